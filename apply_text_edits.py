@@ -28,9 +28,10 @@ def parse_args() -> argparse.Namespace:
 	parser.add_argument(
 		"-i",
 		"--input",
-		dest="patch_path",
+		dest="patch_paths",
 		required=True,
-		help="YAML patch file",
+		nargs="+",
+		help="YAML patch files",
 	)
 	parser.add_argument(
 		"-o",
@@ -90,7 +91,17 @@ def parse_args() -> argparse.Namespace:
 		action="store_false",
 	)
 	parser.set_defaults(include_footer=False)
+	parser.add_argument(
+		"-j",
+		"--jobs",
+		dest="jobs",
+		type=int,
+		default=1,
+		help="Worker processes for slide hashing, 0 for one per CPU (default: 1)",
+	)
 	args = parser.parse_args()
+	if args.output_path and len(args.patch_paths) > 1:
+		parser.error("--output needs a single input; omit it for multiple inputs.")
 	return args
 
 
@@ -100,21 +111,23 @@ def main() -> None:
 	Main entry point.
 	"""
 	args = parse_args()
-	patch_path = args.patch_path
-	output_path = args.output_path
-	if not output_path:
-		base_name = os.path.splitext(patch_path)[0]
-		output_path = f"{base_name}_edited.pptx"
-	apply_text_edits(
-		None,
-		patch_path,
-		output_path,
-		args.force,
-		args.include_subtitle,
-		args.include_footer,
-		args.inplace,
-	)
-	print(f"Wrote output: {output_path}")
+	# one process for every patch file pays interpreter and import startup once
+	for patch_path in args.patch_paths:
+		output_path = args.output_path
+		if not output_path:
+			base_name = os.path.splitext(patch_path)[0]
+			output_path = f"{base_name}_edited.pptx"
+		apply_text_edits(
+			None,
+			patch_path,
+			output_path,
+			args.force,
+			args.include_subtitle,
+			args.include_footer,
+			args.inplace,
+			args.jobs,
+		)
+		print(f"Wrote output: {output_path}")
 
 
 if __name__ == "__main__":
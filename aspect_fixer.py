@@ -3,9 +3,6 @@
 import argparse
 import os
 
-# local repo modules
-import slide_deck_pipeline.aspect_fixer as aspect_fixer
-
 
 #============================================
 def parse_args() -> argparse.Namespace:
@@ -45,6 +42,9 @@ def main() -> None:
 	Main entry point.
 	"""
 	args = parse_args()
+	# local repo modules
+	import slide_deck_pipeline.aspect_fixer as aspect_fixer
+
 	output_path = args.output_path
 	if not output_path:
 		if args.inplace:
@@ -23,9 +23,10 @@ def parse_args() -> argparse.Namespace:
 	parser.add_argument(
 		"-i",
 		"--input",
-		dest="input_path",
+		dest="input_paths",
 		required=True,
-		help="Input PPTX or ODP file",
+		nargs="+",
+		help="Input PPTX or ODP files",
 	)
 	parser.add_argument(
 		"-o",
@@ -79,7 +80,16 @@ def parse_args() -> argparse.Namespace:
 		action="store_false",
 	)
 	parser.set_defaults(include_footer=False)
+	parser.add_argument(
+		"-b",
+		"--baseline",
+		dest="baseline_path",
+		default="",
+		help="Earlier export; leave out text blocks unchanged since then",
+	)
 	args = parser.parse_args()
+	if args.output_path and len(args.input_paths) > 1:
+		parser.error("--output needs a single input; omit it for multiple inputs.")
 	return args
 
 
@@ -89,18 +99,21 @@ def main() -> None:
 	Main entry point.
 	"""
 	args = parse_args()
-	output_path = args.output_path
-	if not output_path:
-		base_name = os.path.splitext(args.input_path)[0]
-		output_path = f"{base_name}_text_edits.yaml"
-	export_slide_text(
-		args.input_path,
-		output_path,
-		args.include_notes,
-		args.include_subtitle,
-		args.include_footer,
-	)
-	print(f"Wrote output: {output_path}")
+	# one process for every deck pays interpreter and import startup once
+	for input_path in args.input_paths:
+		output_path = args.output_path
+		if not output_path:
+			base_name = os.path.splitext(input_path)[0]
+			output_path = f"{base_name}_text_edits.yaml"
+		export_slide_text(
+			input_path,
+			output_path,
+			args.include_notes,
+			args.include_subtitle,
+			args.include_footer,
+			args.baseline_path,
+		)
+		print(f"Wrote output: {output_path}")
 
 
 if __name__ == "__main__":
@@ -3,9 +3,6 @@
 import argparse
 import os
 
-# local repo modules
-import slide_deck_pipeline.layout_fixer as layout_fixer
-
 
 #============================================
 def parse_args() -> argparse.Namespace:
@@ -52,6 +49,9 @@ def main() -> None:
 	Main entry point.
 	"""
 	args = parse_args()
+	# local repo modules
+	import slide_deck_pipeline.layout_fixer as layout_fixer
+
 	output_path = args.output_path
 	if not output_path:
 		if args.inplace:
@@ -14,6 +14,7 @@ collect_asset_types = indexing.collect_asset_types
 describe_shape_type = indexing.describe_shape_type
 is_supported_shape = indexing.is_supported_shape
 collect_unsupported_shapes = indexing.collect_unsupported_shapes
+scan_slide_shapes = indexing.scan_slide_shapes
 resolve_master_name = indexing.resolve_master_name
 report_index_warnings = indexing.report_index_warnings
 report_layout_confidence = indexing.report_layout_confidence
@@ -44,6 +45,14 @@ def parse_args() -> argparse.Namespace:
 		default="",
 		help="Output CSV path (default: <input>.csv)",
 	)
+	parser.add_argument(
+		"-j",
+		"--jobs",
+		dest="jobs",
+		type=int,
+		default=1,
+		help="Worker processes for indexing slides, 0 for one per CPU (default: 1)",
+	)
 	args = parser.parse_args()
 	return args
 
@@ -58,7 +67,7 @@ def main() -> None:
 	if not output_csv:
 		base_name = os.path.splitext(args.input_path)[0]
 		output_csv = f"{base_name}.csv"
-	index_slides_to_csv(args.input_path, output_csv)
+	index_slides_to_csv(args.input_path, output_csv, args.jobs)
 	print(f"Wrote output: {output_csv}")
 
 
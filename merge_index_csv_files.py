@@ -23,7 +23,7 @@ def parse_args() -> argparse.Namespace:
 		dest="input_paths",
 		required=True,
 		nargs="+",
-		help="Input CSV paths or glob patterns",
+		help="Input CSV paths, directories of CSV files, or glob patterns",
 	)
 	parser.add_argument(
 		"-o",
@@ -46,10 +46,12 @@ def parse_args() -> argparse.Namespace:
 #============================================
 def expand_inputs(input_paths: list[str]) -> list[str]:
 	"""
-	Expand glob patterns into concrete file paths.
+	Expand glob patterns and directories into concrete file paths.
+
+	A directory expands to the CSV files directly inside it, in sorted order.
 
 	Args:
-		input_paths: Input paths or glob patterns.
+		input_paths: Input paths, directories, or glob patterns.
 
 	Returns:
 		list[str]: Expanded file paths.
@@ -62,6 +64,16 @@ def expand_inputs(input_paths: list[str]) -> list[str]:
 			paths = sorted(glob.glob(entry))
 			if not paths:
 				raise FileNotFoundError(f"No matches for pattern: {entry}")
+		elif os.path.isdir(entry):
+			# scandir entries carry the file type, so no extra stat per file
+			with os.scandir(entry) as dir_entries:
+				paths = sorted(
+					os.path.join(entry, dir_entry.name)
+					for dir_entry in dir_entries
+					if dir_entry.name.lower().endswith(".csv") and dir_entry.is_file()
+				)
+			if not paths:
+				raise FileNotFoundError(f"No CSV files in directory: {entry}")
 		else:
 			paths = [entry]
 		for path in paths:
@@ -93,15 +105,13 @@ def sort_rows(
 	numeric_values = [value for value in values if value != ""]
 	use_numeric = numeric_values and all(value.isdigit() for value in numeric_values)
 	if use_numeric:
-		# Keep non-numeric values at the end if they appear.
-		def sort_key(row: dict[str, str]) -> tuple[int, int | str]:
-			value = row.get(sort_by, "")
-			if value.isdigit():
-				return (0, int(value))
-			if value:
-				return (1, value)
-			return (2, "")
-		sorted_rows = sorted(rows, key=sort_key)
+		# every non-empty value is digits here; sort positions by plain int
+		# keys and keep rows with an empty value at the end
+		numeric_rows = [row for row, value in zip(rows, values) if value]
+		numeric_keys = [int(value) for value in numeric_values]
+		order = sorted(range(len(numeric_keys)), key=numeric_keys.__getitem__)
+		sorted_rows = [numeric_rows[position] for position in order]
+		sorted_rows.extend(row for row, value in zip(rows, values) if not value)
 		return sorted_rows
 	def sort_key(row: dict[str, str]) -> str:
 		value = row.get(sort_by, "")
@@ -121,7 +131,7 @@ def main() -> None:
 	for path in input_paths:
 		if not os.path.exists(path):
 			raise FileNotFoundError(f"CSV file not found: {path}")
-		rows.extend(csv_schema.read_slide_csv(path))
+		rows.extend(csv_schema.iter_slide_csv(path))
 	if args.sort_by:
 		rows = sort_rows(rows, args.sort_by)
 	csv_schema.write_slide_csv(args.output_path, rows)
@@ -2,10 +2,14 @@
 
 # Standard Library
 import argparse
-import csv
 import os
+import itertools
+import collections.abc
 import random
 
+# local repo modules
+import slide_deck_pipeline.csv_schema as csv_schema
+
 
 #============================================
 def parse_args() -> argparse.Namespace:
@@ -52,78 +56,71 @@ def parse_args() -> argparse.Namespace:
 
 
 #============================================
-def load_rows(path: str) -> tuple[list[str], list[dict[str, str]]]:
+def choose_keep_indices(
+	hash_values: collections.abc.Iterable[str],
+	rng: random.Random,
+) -> tuple[set[int], int]:
 	"""
-	Load CSV fieldnames and rows.
+	Pick the row positions to keep, one at random per repeated hash value.
+
+	Each hash value holds one reservoir slot (Algorithm R with k=1): the
+	n-th row seen with that value replaces the current pick with
+	probability 1/n, so every row in a group is equally likely to be kept
+	without storing the group. Rows with an empty hash value are always kept.
 
 	Args:
-		path: CSV path.
+		hash_values: Stripped hash value per row, in CSV order; a generator
+			is consumed as it yields.
+		rng: Random generator.
 
 	Returns:
-		tuple[list[str], list[dict[str, str]]]: (fieldnames, rows).
-	"""
-	with open(path, newline="", encoding="utf-8") as handle:
-		reader = csv.DictReader(handle)
-		fieldnames = list(reader.fieldnames or [])
-		return (fieldnames, list(reader))
-
-
-#============================================
-def write_rows(path: str, fieldnames: list[str], rows: list[dict[str, str]]) -> None:
-	"""
-	Write rows to a CSV file.
-
-	Args:
-		path: Output path.
-		fieldnames: Column names.
-		rows: Row dicts.
+		tuple[set[int], int]: (kept row positions, removed_count).
 	"""
-	with open(path, "w", newline="", encoding="utf-8") as handle:
-		writer = csv.DictWriter(handle, fieldnames=fieldnames)
-		writer.writeheader()
-		writer.writerows(rows)
+	# hash value -> (chosen row position, rows seen with that value)
+	chosen_by_hash: dict[str, tuple[int, int]] = {}
+	keep_indices: set[int] = set()
+	removed = 0
+	for idx, hash_value in enumerate(hash_values):
+		if not hash_value:
+			keep_indices.add(idx)
+			continue
+		chosen = chosen_by_hash.get(hash_value)
+		if chosen is None:
+			chosen_by_hash[hash_value] = (idx, 1)
+			continue
+		chosen_idx, seen = chosen
+		seen += 1
+		removed += 1
+		if rng.randrange(seen) == 0:
+			chosen_idx = idx
+		chosen_by_hash[hash_value] = (chosen_idx, seen)
+	keep_indices.update(chosen_idx for chosen_idx, _ in chosen_by_hash.values())
+	return (keep_indices, removed)
 
 
 #============================================
-def dedupe_rows_random_choice(
-	rows: list[dict[str, str]],
-	hash_column: str,
-	rng: random.Random,
-) -> tuple[list[dict[str, str]], int]:
+def iter_kept_rows(
+	rows: collections.abc.Iterable[list[str]],
+	keep_indices: set[int],
+) -> collections.abc.Iterator[list[str]]:
 	"""
-	Remove duplicates by selecting one row per hash value at random.
+	Yield the rows at the kept positions, in CSV order.
 
-	The output preserves the original CSV row order (we keep whichever chosen
-	row indices appear in the input).
+	The positions become a byte mask once, so itertools.compress picks the
+	rows in C instead of a set lookup per row, and it stops reading after
+	the last kept row.
 
 	Args:
-		rows: Input rows.
-		hash_column: Column containing a hash key.
-		rng: Random generator.
+		rows: Positional rows in CSV order; a generator is consumed as it yields.
+		keep_indices: Row positions to keep.
 
 	Returns:
-		tuple[list[dict[str, str]], int]: (deduped_rows, removed_count).
+		collections.abc.Iterator[list[str]]: Kept rows.
 	"""
-	indices_by_hash: dict[str, list[int]] = {}
-	keep_indices: set[int] = set()
-	for idx, row in enumerate(rows):
-		hash_value = (row.get(hash_column) or "").strip()
-		if not hash_value:
-			keep_indices.add(idx)
-			continue
-		indices_by_hash.setdefault(hash_value, []).append(idx)
-
-	removed = 0
-	for hash_value, indices in indices_by_hash.items():
-		if len(indices) == 1:
-			keep_indices.add(indices[0])
-			continue
-		chosen = rng.choice(indices)
-		keep_indices.add(chosen)
-		removed += len(indices) - 1
-
-	deduped = [row for idx, row in enumerate(rows) if idx in keep_indices]
-	return (deduped, removed)
+	mask = bytearray(max(keep_indices, default=-1) + 1)
+	for idx in keep_indices:
+		mask[idx] = 1
+	return itertools.compress(rows, mask)
 
 
 #============================================
@@ -149,15 +146,19 @@ def main() -> None:
 		seed = int(str(args.seed).strip())
 	rng = random.Random(seed)
 
-	fieldnames, rows = load_rows(args.input_csv)
+	fieldnames = csv_schema.read_csv_fieldnames(args.input_csv)
 	if args.hash_column not in fieldnames:
 		raise ValueError(f"Hash column not found: {args.hash_column}")
-	deduped, removed = dedupe_rows_random_choice(rows, args.hash_column, rng)
-	write_rows(output_csv, fieldnames, deduped)
+	hash_index = fieldnames.index(args.hash_column)
+	# first pass keeps one pick per hash; the second streams the kept rows out
+	hash_values = (row[hash_index].strip() for row in csv_schema.iter_csv_rows(args.input_csv))
+	keep_indices, removed = choose_keep_indices(hash_values, rng)
+	kept_rows = iter_kept_rows(csv_schema.iter_csv_rows(args.input_csv), keep_indices)
+	csv_schema.write_csv_rows(output_csv, fieldnames, kept_rows)
 
 	print(f"Wrote output: {output_csv}")
-	print(f"Rows before: {len(rows)}")
-	print(f"Rows after:  {len(deduped)}")
+	print(f"Rows before: {len(keep_indices) + removed}")
+	print(f"Rows after:  {len(keep_indices)}")
 	print(f"Removed:     {removed}")
 	if seed is not None:
 		print(f"Seed:        {seed}")
@@ -2,8 +2,11 @@
 
 # Standard Library
 import argparse
-import csv
 import os
+import collections.abc
+
+# local repo modules
+import slide_deck_pipeline.csv_schema as csv_schema
 
 
 #============================================
@@ -52,64 +55,57 @@ def parse_args() -> argparse.Namespace:
 
 
 #============================================
-def load_rows(path: str) -> tuple[list[str], list[dict[str, str]]]:
+def set_master_name(
+	row: list[str],
+	master_index: int,
+	master_name: str,
+	only_empty: bool,
+) -> bool:
 	"""
-	Load CSV fieldnames and rows.
+	Set master_name on one positional row.
 
 	Args:
-		path: CSV path.
+		row: CSV row values (mutated in-place).
+		master_index: Position of the master_name column.
+		master_name: Master name value to set.
+		only_empty: Only set when master_name is empty.
 
 	Returns:
-		tuple[list[str], list[dict[str, str]]]: (fieldnames, rows).
-	"""
-	with open(path, newline="", encoding="utf-8") as handle:
-		reader = csv.DictReader(handle)
-		fieldnames = list(reader.fieldnames or [])
-		return (fieldnames, list(reader))
-
-
-#============================================
-def write_rows(path: str, fieldnames: list[str], rows: list[dict[str, str]]) -> None:
-	"""
-	Write rows to a CSV file.
-
-	Args:
-		path: Output path.
-		fieldnames: Column names.
-		rows: Row dicts.
+		bool: True if the row was updated, False if it was skipped.
 	"""
-	with open(path, "w", newline="", encoding="utf-8") as handle:
-		writer = csv.DictWriter(handle, fieldnames=fieldnames)
-		writer.writeheader()
-		writer.writerows(rows)
+	if only_empty and row[master_index].strip():
+		return False
+	row[master_index] = master_name
+	return True
 
 
 #============================================
-def apply_master_name_to_rows(
-	rows: list[dict[str, str]],
+def iter_updated_rows(
+	path: str,
+	master_index: int,
 	master_name: str,
 	only_empty: bool,
-) -> tuple[int, int]:
+	counts: dict[str, int],
+) -> collections.abc.Iterator[list[str]]:
 	"""
-	Apply master_name to rows.
+	Yield CSV rows with master_name set, one at a time.
 
 	Args:
-		rows: CSV rows (mutated in-place).
+		path: CSV path.
+		master_index: Position of the master_name column.
 		master_name: Master name value to set.
 		only_empty: Only set when master_name is empty.
+		counts: Running "updated" and "skipped" totals (updated in-place).
 
-	Returns:
-		tuple[int, int]: (updated, skipped)
+	Yields:
+		list[str]: Row values in header column order.
 	"""
-	updated = 0
-	skipped = 0
-	for row in rows:
-		if only_empty and (row.get("master_name") or "").strip():
-			skipped += 1
-			continue
-		row["master_name"] = master_name
-		updated += 1
-	return (updated, skipped)
+	for row in csv_schema.iter_csv_rows(path):
+		if set_master_name(row, master_index, master_name, only_empty):
+			counts["updated"] += 1
+		else:
+			counts["skipped"] += 1
+		yield row
 
 
 #============================================
@@ -128,19 +124,24 @@ def main() -> None:
 		base, ext = os.path.splitext(args.input_csv)
 		output_csv = f"{base}_master{ext or '.csv'}"
 
-	fieldnames, rows = load_rows(args.input_csv)
+	fieldnames = csv_schema.read_csv_fieldnames(args.input_csv)
 	if "master_name" not in fieldnames:
 		raise ValueError("CSV missing required column: master_name")
 
-	updated, skipped = apply_master_name_to_rows(
-		rows,
+	master_index = fieldnames.index("master_name")
+	counts = {"updated": 0, "skipped": 0}
+	updated_rows = iter_updated_rows(
+		args.input_csv,
+		master_index,
 		args.master_name,
 		args.only_empty,
+		counts,
 	)
-
-	write_rows(output_csv, fieldnames, rows)
+	csv_schema.write_csv_rows(output_csv, fieldnames, updated_rows)
+	updated = counts["updated"]
+	skipped = counts["skipped"]
 	print(f"Wrote output: {output_csv}")
-	print(f"Rows:        {len(rows)}")
+	print(f"Rows:        {updated + skipped}")
 	print(f"Updated:     {updated}")
 	print(f"Skipped:     {skipped}")
 
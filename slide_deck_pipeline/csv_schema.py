@@ -1,6 +1,7 @@
 import csv
 import hashlib
 import os
+import collections.abc
 import lxml.etree as xml_et
 
 
@@ -16,7 +17,13 @@ CSV_COLUMNS = [
 	"notes_text",
 ]
 CONTEXT_COLUMNS = ("title_text", "body_text", "notes_text")
+# Built once so write_slide_csv does not rebuild them for every row.
+CSV_COLUMN_SET = frozenset(CSV_COLUMNS)
+CONTEXT_COLUMN_POSITIONS = tuple(CSV_COLUMNS.index(column) for column in CONTEXT_COLUMNS)
 XML_PARSER = xml_et.XMLParser(resolve_entities=False, no_network=True, recover=False)
+# Section markers between the hashed parts of a slide payload.
+RELS_SEPARATOR = b"\n--rels--\n"
+NOTES_SEPARATOR = b"\n--notes--\n"
 
 
 #============================================
@@ -32,17 +39,18 @@ def normalize_text(text: str | None) -> str:
 	"""
 	if not text:
 		return ""
-	cleaned = text.replace("\r\n", "\n").replace("\r", "\n")
+	cleaned = text
+	# slide text is almost always LF-only, so skip both copies without a CR
+	if "\r" in cleaned:
+		cleaned = cleaned.replace("\r\n", "\n").replace("\r", "\n")
 	lines = []
 	for raw_line in cleaned.split("\n"):
-		line = raw_line.rstrip()
-		if not line.strip():
+		# split() drops surrounding whitespace and collapses inner runs
+		words = raw_line.split()
+		if not words:
 			continue
-		leading_tabs = len(line) - len(line.lstrip("\t"))
-		content = line.lstrip("\t").strip()
-		content = " ".join(content.split())
-		line_out = ("\t" * leading_tabs) + content
-		lines.append(line_out)
+		leading_tabs = len(raw_line) - len(raw_line.lstrip("\t"))
+		lines.append(("\t" * leading_tabs) + " ".join(words))
 	return "\n".join(lines)
 
 
@@ -59,10 +67,10 @@ def sanitize_context_text(text: str | None) -> str:
 	"""
 	if not text:
 		return ""
-	ascii_only = "".join(ch for ch in text if ord(ch) < 128)
-	for ch in (",", "\t", "\n", "\r"):
-		ascii_only = ascii_only.replace(ch, " ")
-	return " ".join(ascii_only.split())
+	# the codec drops non-ASCII characters in C instead of a per-char loop
+	ascii_only = text.encode("ascii", "ignore").decode("ascii")
+	# split() already breaks on tabs and line breaks; only commas need a space
+	return " ".join(ascii_only.replace(",", " ").split())
 
 
 #============================================
@@ -85,12 +93,15 @@ def compute_slide_hash(
 	normalized_notes = normalize_text(notes_text)
 	if not isinstance(slide_xml, (bytes, bytearray)):
 		raise TypeError("slide_xml must be bytes.")
-	payload = normalize_slide_xml(bytes(slide_xml), rel_hashes)
+	# feed the sections to one hasher rather than concatenating copies
+	hasher = hashlib.sha256(normalize_slide_xml(bytes(slide_xml), rel_hashes))
 	if rel_tokens:
-		payload += b"\n--rels--\n" + repr(tuple(rel_tokens)).encode("utf-8")
+		hasher.update(RELS_SEPARATOR)
+		hasher.update(repr(tuple(rel_tokens)).encode("utf-8"))
 	if normalized_notes:
-		payload += b"\n--notes--\n" + normalized_notes.encode("utf-8")
-	digest = hashlib.sha256(payload).hexdigest()
+		hasher.update(NOTES_SEPARATOR)
+		hasher.update(normalized_notes.encode("utf-8"))
+	digest = hasher.hexdigest()
 	return digest[:16]
 
 
@@ -178,6 +189,20 @@ def compute_text_hash(text: str) -> str:
 		str: Text hash.
 	"""
 	normalized = normalize_text(text)
+	return hash_normalized_text(normalized)
+
+
+#============================================
+def hash_normalized_text(normalized: str) -> str:
+	"""
+	Hash text that is already in normalize_text form.
+
+	Args:
+		normalized: Normalized text.
+
+	Returns:
+		str: Text hash.
+	"""
 	digest = hashlib.sha256(normalized.encode("utf-8")).hexdigest()
 	return digest[:16]
 
@@ -217,6 +242,31 @@ def sanitize_row_context(row: dict[str, str]) -> dict[str, str]:
 	return sanitized
 
 
+#============================================
+def row_to_csv_values(row: dict[str, str]) -> list[str]:
+	"""
+	Convert a slide row to sanitized values in CSV column order.
+
+	Missing columns become empty strings, as with csv.DictWriter.
+
+	Args:
+		row: CSV row.
+
+	Returns:
+		list[str]: Column values in CSV_COLUMNS order.
+
+	Raises:
+		ValueError: If the row has keys outside CSV_COLUMNS.
+	"""
+	if not CSV_COLUMN_SET.issuperset(row):
+		extra_fields = ", ".join(sorted(repr(key) for key in row.keys() - CSV_COLUMN_SET))
+		raise ValueError(f"dict contains fields not in fieldnames: {extra_fields}")
+	values = [row.get(column, "") for column in CSV_COLUMNS]
+	for position in CONTEXT_COLUMN_POSITIONS:
+		values[position] = sanitize_context_text(values[position])
+	return values
+
+
 #============================================
 def validate_headers(headers: list[str]) -> None:
 	"""
@@ -233,49 +283,139 @@ def validate_headers(headers: list[str]) -> None:
 
 
 #============================================
-def read_slide_csv(path: str) -> list[dict[str, str]]:
+def iter_slide_csv(path: str) -> collections.abc.Iterator[dict[str, str]]:
 	"""
-	Read slide records from a CSV file.
+	Yield slide records from a CSV file as they are read.
 
 	Args:
 		path: CSV file path.
 
-	Returns:
-		list[dict[str, str]]: Slide rows.
+	Yields:
+		dict[str, str]: Slide rows.
 	"""
 	if not os.path.exists(path):
 		raise FileNotFoundError(f"CSV file not found: {path}")
 	with open(path, "r", encoding="utf-8", newline="") as handle:
 		reader = csv.reader(handle)
-		rows = []
 		for row in reader:
 			if not row:
 				continue
-			normalized = [field.strip() for field in row]
-			if all(not field for field in normalized):
-				continue
-			if normalized == CSV_COLUMNS:
+			# one joined strip finds blank rows without a stripped copy per
+			# field; only rows that start like the header are compared in full
+			if not "".join(row).strip():
 				continue
+			if row[0].strip() == CSV_COLUMNS[0]:
+				if [field.strip() for field in row] == CSV_COLUMNS:
+					continue
 			if len(row) != len(CSV_COLUMNS):
 				raise ValueError(
 					"CSV row does not match expected schema. "
 					f"Expected {CSV_COLUMNS}, got {row}."
 				)
-			rows.append(dict(zip(CSV_COLUMNS, row)))
-		return rows
+			yield dict(zip(CSV_COLUMNS, row))
+
+
+#============================================
+def read_slide_csv(path: str) -> list[dict[str, str]]:
+	"""
+	Read slide records from a CSV file.
+
+	Args:
+		path: CSV file path.
+
+	Returns:
+		list[dict[str, str]]: Slide rows.
+	"""
+	return list(iter_slide_csv(path))
 
 
 #============================================
-def write_slide_csv(path: str, rows: list[dict[str, str]]) -> None:
+def write_slide_csv(path: str, rows: collections.abc.Iterable[dict[str, str]]) -> None:
 	"""
 	Write slide records to a CSV file.
 
 	Args:
 		path: CSV file path.
-		rows: Slide rows to write.
+		rows: Slide rows to write; a generator is written as it yields.
 	"""
 	with open(path, "w", encoding="utf-8", newline="") as handle:
-		writer = csv.DictWriter(handle, fieldnames=CSV_COLUMNS)
-		writer.writeheader()
-		for row in rows:
-			writer.writerow(sanitize_row_context(row))
+		# positional rows skip DictWriter's per-row key check against a list
+		writer = csv.writer(handle)
+		writer.writerow(CSV_COLUMNS)
+		# writerows pulls from the lazy map, so a generator still streams
+		writer.writerows(map(row_to_csv_values, rows))
+
+
+#============================================
+def read_csv_fieldnames(path: str) -> list[str]:
+	"""
+	Read the header of any CSV file.
+
+	Args:
+		path: CSV path.
+
+	Returns:
+		list[str]: Column names.
+	"""
+	with open(path, newline="", encoding="utf-8") as handle:
+		reader = csv.DictReader(handle)
+		return list(reader.fieldnames or [])
+
+
+#============================================
+def iter_csv_rows(path: str) -> collections.abc.Iterator[list[str]]:
+	"""
+	Yield the data rows of any CSV file one at a time as positional lists.
+
+	Blank lines and the header row are skipped, and short rows are padded
+	to the header width, as csv.DictReader and csv.DictWriter would.
+
+	Args:
+		path: CSV path.
+
+	Yields:
+		list[str]: Row values in header column order.
+	"""
+	with open(path, newline="", encoding="utf-8") as handle:
+		width = None
+		for row in csv.reader(handle):
+			if not row:
+				continue
+			if width is None:
+				# the first non-blank row is the header
+				width = len(row)
+				continue
+			if len(row) < width:
+				row.extend([""] * (width - len(row)))
+			yield row
+
+
+#============================================
+def write_csv_rows(
+	path: str,
+	fieldnames: list[str],
+	rows: collections.abc.Iterable[list[str]],
+) -> None:
+	"""
+	Write positional rows to a CSV file.
+
+	Rows go to a temporary file that replaces the output at the end, so a
+	row stream may still be reading the output path when it is the input.
+	The temporary file is removed if the row stream raises.
+
+	Args:
+		path: Output path.
+		fieldnames: Column names.
+		rows: Positional rows; a generator is written as it yields.
+	"""
+	temp_path = f"{path}.{os.getpid()}.tmp"
+	try:
+		with open(temp_path, "w", newline="", encoding="utf-8") as handle:
+			writer = csv.writer(handle)
+			writer.writerow(fieldnames)
+			writer.writerows(rows)
+		os.replace(temp_path, path)
+	except BaseException:
+		if os.path.exists(temp_path):
+			os.remove(temp_path)
+		raise
@@ -8,6 +8,10 @@ import slide_deck_pipeline.soffice_tools as soffice_tools
 import slide_deck_pipeline.text_normalization as text_normalization
 
 
+# Slide hashes are matched without regard to case.
+HEX_DIGITS = "0123456789abcdefABCDEF"
+
+
 #============================================
 def normalize_row_value(row: dict[str, str], key: str) -> str:
 	"""
@@ -59,10 +63,8 @@ def is_hex_hash(value: str) -> bool:
 	"""
 	if not value or len(value) != 16:
 		return False
-	for ch in value.lower():
-		if ch not in "0123456789abcdef":
-			return False
-	return True
+	# strip() empties the value only when every character is a hex digit
+	return not value.strip(HEX_DIGITS)
 
 
 #============================================
@@ -104,6 +106,79 @@ def load_template_layout_types(template_path: str) -> set[tuple[str, str]]:
 	return available
 
 
+#============================================
+def resolve_row_source(
+	source_pptx: str,
+	csv_dir: str,
+	strict: bool,
+	resolved_sources: dict[str, tuple[str, list[str]]],
+) -> tuple[str, list[str]]:
+	"""
+	Resolve a row's source deck, searching once per distinct source value.
+
+	Args:
+		source_pptx: Source path from the CSV row.
+		csv_dir: Directory containing the CSV.
+		strict: Treat ambiguous matches as errors.
+		resolved_sources: Results of earlier lookups (updated in-place).
+
+	Returns:
+		tuple[str, list[str]]: Resolved path (empty when not found) and warnings.
+	"""
+	resolved = resolved_sources.get(source_pptx)
+	if resolved is None:
+		try:
+			resolved = path_resolver.resolve_source_path(
+				source_pptx,
+				csv_dir,
+				strict,
+			)
+		except FileNotFoundError:
+			resolved = ("", [])
+		resolved_sources[source_pptx] = resolved
+	return resolved
+
+
+#============================================
+def collect_strict_odp_paths(
+	rows: list[dict[str, str]],
+	csv_dir: str,
+	resolved_sources: dict[str, tuple[str, list[str]]],
+) -> list[str]:
+	"""
+	Resolve the ODP source decks that strict validation will hash.
+
+	Args:
+		rows: CSV rows.
+		csv_dir: Directory containing the CSV.
+		resolved_sources: Results of earlier lookups (updated in-place).
+
+	Returns:
+		list[str]: Resolved ODP paths in order of first use.
+	"""
+	odp_paths = {}
+	seen_sources = set()
+	for row in rows:
+		source_pptx = normalize_row_value(row, "source_pptx")
+		if not source_pptx or source_pptx in seen_sources:
+			continue
+		if not is_positive_int(normalize_row_value(row, "source_slide_index")):
+			continue
+		if not normalize_row_value(row, "slide_hash"):
+			continue
+		seen_sources.add(source_pptx)
+		# validate_rows() reports a missing source for each of its rows
+		resolved_path, _ = resolve_row_source(
+			source_pptx,
+			csv_dir,
+			True,
+			resolved_sources,
+		)
+		if resolved_path.lower().endswith(".odp") and os.path.exists(resolved_path):
+			odp_paths[resolved_path] = None
+	return list(odp_paths)
+
+
 #============================================
 def validate_rows(
 	rows: list[dict[str, str]],
@@ -144,15 +219,28 @@ def validate_rows(
 		return (errors, warnings)
 
 	source_cache: dict[str, object] = {}
+	# rows repeat a few source decks; each path search stats several candidates
+	resolved_sources: dict[str, tuple[str, list[str]]] = {}
 	temp_dirs: list[tempfile.TemporaryDirectory] = []
 	pptx_module = None
 	pptx_hash_module = None
+	converted_odps: dict[str, str] = {}
 	if strict:
 		# PIP3 modules
 		import pptx as pptx_module
 
 		# local repo modules
 		import slide_deck_pipeline.pptx_hash as pptx_hash_module
+
+		odp_paths = collect_strict_odp_paths(rows, csv_dir, resolved_sources)
+		if odp_paths:
+			temp_dir = tempfile.TemporaryDirectory()
+			temp_dirs.append(temp_dir)
+			# one soffice run converts every ODP source deck
+			converted_odps = soffice_tools.convert_odps_to_pptx_cached(
+				odp_paths,
+				temp_dir.name,
+			)
 	for index, row in enumerate(rows, 1):
 		source_pptx = normalize_row_value(row, "source_pptx")
 		if not source_pptx:
@@ -162,17 +250,14 @@ def validate_rows(
 			if extension not in (".pptx", ".odp"):
 				warnings.append(f"Row {index}: unexpected source_pptx extension.")
 			if check_sources or strict:
-				try:
-					resolved_path, path_warnings = path_resolver.resolve_source_path(
-						source_pptx,
-						csv_dir,
-						strict,
-					)
-					warnings.extend(path_warnings)
-				except FileNotFoundError:
-					errors.append(f"Row {index}: source_pptx not found.")
-					resolved_path = ""
-				if resolved_path and not os.path.exists(resolved_path):
+				resolved_path, path_warnings = resolve_row_source(
+					source_pptx,
+					csv_dir,
+					strict,
+					resolved_sources,
+				)
+				warnings.extend(path_warnings)
+				if not resolved_path:
 					errors.append(f"Row {index}: source_pptx not found.")
 
 		slide_index = normalize_row_value(row, "source_slide_index")
@@ -187,41 +272,34 @@ def validate_rows(
 
 		master_name = normalize_row_value(row, "master_name")
 		layout_type = normalize_row_value(row, "layout_type")
-		layout_type_key = text_normalization.normalize_simple_name(layout_type)
 		if not master_name:
 			errors.append(f"Row {index}: missing master_name.")
 		if not layout_type:
 			errors.append(f"Row {index}: missing layout_type.")
+		# names are only normalized when a template gives pairs to check
 		if layout_pairs and master_name and layout_type:
 			pair = (
 				text_normalization.normalize_simple_name(master_name),
-				layout_type_key,
+				text_normalization.normalize_simple_name(layout_type),
 			)
 			if pair not in layout_pairs:
 				errors.append(f"Row {index}: master/layout_type not found in template.")
 
 		if strict and source_pptx and is_positive_int(slide_index) and slide_hash:
-			try:
-				resolved_path, path_warnings = path_resolver.resolve_source_path(
-					source_pptx,
-					csv_dir,
-					strict,
-				)
-				warnings.extend(path_warnings)
-			except FileNotFoundError:
+			resolved_path, path_warnings = resolve_row_source(
+				source_pptx,
+				csv_dir,
+				strict,
+				resolved_sources,
+			)
+			warnings.extend(path_warnings)
+			if not resolved_path:
 				continue
 			source_presentation = source_cache.get(resolved_path)
 			if not source_presentation:
-				if resolved_path.lower().endswith(".odp"):
-					temp_dir = tempfile.TemporaryDirectory()
-					temp_dirs.append(temp_dir)
-					converted = soffice_tools.convert_odp_to_pptx(
-						resolved_path,
-						temp_dir.name,
-					)
-					source_presentation = pptx_module.Presentation(converted)
-				else:
-					source_presentation = pptx_module.Presentation(resolved_path)
+				source_presentation = pptx_module.Presentation(
+					converted_odps.get(resolved_path, resolved_path)
+				)
 				source_cache[resolved_path] = source_presentation
 			slide_number = int(slide_index)
 			if slide_number < 1 or slide_number > len(source_presentation.slides):
@@ -1,5 +1,10 @@
 # PIP3 modules
 import pptx
+import pptx.enum.shapes
+
+
+GROUP_SHAPE_TYPE = pptx.enum.shapes.MSO_SHAPE_TYPE.GROUP
+PICTURE_SHAPE_TYPE = pptx.enum.shapes.MSO_SHAPE_TYPE.PICTURE
 
 
 #============================================
@@ -82,7 +87,7 @@ def iter_picture_shapes(slide: pptx.slide.Slide):
 		Picture shapes.
 	"""
 	for shape in iter_shapes(slide.shapes):
-		if shape.shape_type == pptx.enum.shapes.MSO_SHAPE_TYPE.PICTURE:
+		if shape.shape_type == PICTURE_SHAPE_TYPE:
 			yield shape
 
 
@@ -98,11 +103,7 @@ def iter_shapes(shapes):
 		Shape objects.
 	"""
 	for shape in shapes:
-		if (
-			getattr(shape, "shape_type", None)
-			== pptx.enum.shapes.MSO_SHAPE_TYPE.GROUP
-			and hasattr(shape, "shapes")
-		):
+		if getattr(shape, "shape_type", None) == GROUP_SHAPE_TYPE and hasattr(shape, "shapes"):
 			for nested in iter_shapes(shape.shapes):
 				yield nested
 			continue
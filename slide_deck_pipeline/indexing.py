@@ -1,5 +1,7 @@
 # Standard Library
 import tempfile
+import collections.abc
+import concurrent.futures
 
 # PIP3 modules
 import pptx
@@ -13,6 +15,12 @@ import slide_deck_pipeline.pptx_io as pptx_io
 import slide_deck_pipeline.pptx_text as pptx_text
 
 
+GROUP_SHAPE_TYPE = pptx.enum.shapes.MSO_SHAPE_TYPE.GROUP
+PICTURE_SHAPE_TYPE = pptx.enum.shapes.MSO_SHAPE_TYPE.PICTURE
+MEDIA_SHAPE_TYPE = getattr(pptx.enum.shapes.MSO_SHAPE_TYPE, "MEDIA", None)
+# Presentation opened once per indexing worker process by init_index_worker().
+WORKER_PRESENTATION = None
+
 #============================================
 def extract_paragraph_lines(text_frame: pptx.text.text.TextFrame) -> list[str]:
 	"""
@@ -28,17 +36,29 @@ def extract_paragraph_lines(text_frame: pptx.text.text.TextFrame) -> list[str]:
 
 
 #============================================
-def extract_body_text(slide: pptx.slide.Slide) -> str:
+def extract_body_text(
+	slide: pptx.slide.Slide,
+	shapes=None,
+	title_shape=None,
+) -> str:
 	"""
 	Extract body text from non-title text frames.
 
 	Args:
 		slide: Slide instance.
+		shapes: Slide shapes already built by the caller; defaults to slide.shapes.
+		title_shape: Title shape already looked up by the caller; defaults to
+			slide.shapes.title.
 
 	Returns:
 		str: Body text with newline separators.
 	"""
-	return pptx_text.extract_body_text(slide)
+	if shapes is None:
+		shapes = slide.shapes
+	if title_shape is None:
+		title_shape = slide.shapes.title
+	body_text, _, _ = scan_slide_shapes(shapes, title_shape)
+	return body_text
 
 
 #============================================
@@ -56,45 +76,34 @@ def extract_notes_text(slide: pptx.slide.Slide) -> str:
 
 
 #============================================
-def collect_asset_types(slide: pptx.slide.Slide) -> str:
+def collect_asset_types(slide: pptx.slide.Slide, shapes=None) -> str:
 	"""
 	Summarize slide asset types for context.
 
 	Args:
 		slide: Slide instance.
+		shapes: Slide shapes already built by the caller; defaults to slide.shapes.
 
 	Returns:
 		str: Asset type summary string.
 	"""
-	media_type = getattr(pptx.enum.shapes.MSO_SHAPE_TYPE, "MEDIA", None)
-	counts = {
-		"images": 0,
-		"tables": 0,
-		"charts": 0,
-		"media": 0,
-	}
+	if shapes is None:
+		shapes = slide.shapes
+	_, asset_types, _ = scan_slide_shapes(shapes)
+	return asset_types
 
-	def scan_shape(shape) -> None:
-		if (
-			getattr(shape, "shape_type", None)
-			== pptx.enum.shapes.MSO_SHAPE_TYPE.GROUP
-			and hasattr(shape, "shapes")
-		):
-			for nested in shape.shapes:
-				scan_shape(nested)
-			return
-		if getattr(shape, "shape_type", None) == pptx.enum.shapes.MSO_SHAPE_TYPE.PICTURE:
-			counts["images"] += 1
-		if getattr(shape, "has_table", False):
-			counts["tables"] += 1
-		if getattr(shape, "has_chart", False):
-			counts["charts"] += 1
-		if media_type and getattr(shape, "shape_type", None) == media_type:
-			counts["media"] += 1
 
-	for shape in slide.shapes:
-		scan_shape(shape)
+#============================================
+def format_asset_types(counts: dict[str, int]) -> str:
+	"""
+	Format asset counts as an asset type summary.
+
+	Args:
+		counts: Counts for images, tables, charts, and media.
 
+	Returns:
+		str: Asset type summary string.
+	"""
 	labels = []
 	if counts["images"] == 1:
 		labels.append("image")
@@ -120,7 +129,20 @@ def describe_shape_type(shape) -> str:
 	Returns:
 		str: Shape type name.
 	"""
-	shape_type = getattr(shape, "shape_type", None)
+	return shape_type_label(getattr(shape, "shape_type", None))
+
+
+#============================================
+def shape_type_label(shape_type) -> str:
+	"""
+	Return a readable name for a shape type value.
+
+	Args:
+		shape_type: Shape type enum value or None.
+
+	Returns:
+		str: Shape type name.
+	"""
 	if shape_type is None:
 		return "unknown"
 	return getattr(shape_type, "name", str(shape_type))
@@ -139,7 +161,7 @@ def is_supported_shape(shape) -> bool:
 	"""
 	if getattr(shape, "is_placeholder", False):
 		return True
-	if getattr(shape, "shape_type", None) == pptx.enum.shapes.MSO_SHAPE_TYPE.PICTURE:
+	if getattr(shape, "shape_type", None) == PICTURE_SHAPE_TYPE:
 		return True
 	if getattr(shape, "has_text_frame", False):
 		return True
@@ -151,30 +173,98 @@ def is_supported_shape(shape) -> bool:
 
 
 #============================================
-def collect_unsupported_shapes(slide: pptx.slide.Slide) -> list[str]:
+def collect_unsupported_shapes(slide: pptx.slide.Slide, shapes=None) -> list[str]:
 	"""
 	Collect unsupported shape types from a slide.
 
 	Args:
 		slide: Slide instance.
+		shapes: Slide shapes already built by the caller; defaults to slide.shapes.
 
 	Returns:
 		list[str]: Shape type names.
 	"""
+	if shapes is None:
+		shapes = slide.shapes
+	_, _, unsupported = scan_slide_shapes(shapes)
+	return unsupported
+
+
+#============================================
+def scan_slide_shapes(shapes, title_shape=None) -> tuple[str, str, list[str]]:
+	"""
+	Collect body text, asset types, and unsupported shapes in one walk.
+
+	extract_body_text(), collect_asset_types(), and
+	collect_unsupported_shapes() each return one part of this walk.
+
+	Args:
+		shapes: Slide shapes, usually built once by the caller.
+		title_shape: Title shape to leave out of the body text, or None.
+
+	Returns:
+		tuple[str, str, list[str]]: Body text, asset type summary, and
+			unsupported shape type names.
+	"""
+	body_lines = []
+	counts = {
+		"images": 0,
+		"tables": 0,
+		"charts": 0,
+		"media": 0,
+	}
 	unsupported = []
-	for shape in slide.shapes:
-		if (
-			getattr(shape, "shape_type", None)
-			== pptx.enum.shapes.MSO_SHAPE_TYPE.GROUP
-			and hasattr(shape, "shapes")
-		):
+
+	def scan_shape(shape, depth: int, include_text: bool) -> None:
+		# depth 0 is a slide-level shape; unsupported shapes are reported for
+		# slide-level shapes and the direct children of slide-level groups
+		shape_type = getattr(shape, "shape_type", None)
+		if shape_type == GROUP_SHAPE_TYPE and hasattr(shape, "shapes"):
+			if depth == 1 and not is_supported_shape(shape):
+				unsupported.append(describe_shape_type(shape))
 			for nested in shape.shapes:
-				if not is_supported_shape(nested):
-					unsupported.append(describe_shape_type(nested))
-			continue
-		if not is_supported_shape(shape):
-			unsupported.append(describe_shape_type(shape))
-	return unsupported
+				scan_shape(nested, depth + 1, include_text)
+			return
+		# each python-pptx shape property re-reads the XML, so read each once
+		# and reuse it for the support check, the text, and the asset counts
+		has_text_frame = getattr(shape, "has_text_frame", False)
+		has_table = getattr(shape, "has_table", False)
+		has_chart = getattr(shape, "has_chart", False)
+		if depth <= 1:
+			# same test as is_supported_shape(), with is_placeholder read last
+			is_supported = (
+				shape_type == PICTURE_SHAPE_TYPE
+				or has_text_frame
+				or has_table
+				or has_chart
+				or getattr(shape, "is_placeholder", False)
+			)
+			if not is_supported:
+				unsupported.append(shape_type_label(shape_type))
+		if include_text:
+			if has_text_frame:
+				body_lines.extend(pptx_text.extract_paragraph_lines(shape.text_frame))
+			if has_table:
+				body_lines.extend(pptx_text.extract_table_text(shape.table))
+			if has_chart:
+				body_lines.extend(pptx_text.extract_chart_title_text(shape.chart))
+		if shape_type == PICTURE_SHAPE_TYPE:
+			counts["images"] += 1
+		if has_table:
+			counts["tables"] += 1
+		if has_chart:
+			counts["charts"] += 1
+		if MEDIA_SHAPE_TYPE and shape_type == MEDIA_SHAPE_TYPE:
+			counts["media"] += 1
+
+	for shape in shapes:
+		include_text = True
+		if title_shape is not None and shape == title_shape:
+			# a slide has one title, so stop comparing once it is skipped
+			title_shape = None
+			include_text = False
+		scan_shape(shape, 0, include_text)
+	return ("\n".join(body_lines), format_asset_types(counts), unsupported)
 
 
 #============================================
@@ -287,13 +377,14 @@ def build_slide_row(
 
 
 #============================================
-def index_slides_to_csv(input_path: str, output_csv: str) -> None:
+def index_slides_to_csv(input_path: str, output_csv: str, jobs: int = 1) -> None:
 	"""
 	Index slides to CSV.
 
 	Args:
 		input_path: Input PPTX or ODP path.
 		output_csv: Output CSV path.
+		jobs: Worker processes for indexing slides.
 	"""
 	needs_conversion = input_path.lower().endswith(".odp")
 	if needs_conversion:
@@ -302,74 +393,215 @@ def index_slides_to_csv(input_path: str, output_csv: str) -> None:
 				input_path,
 				temp_dir,
 			)
-			rows = index_rows(pptx_path, source_name)
-	else:
-		pptx_path, source_name = pptx_io.resolve_input_pptx(input_path, None)
-		rows = index_rows(pptx_path, source_name)
+			rows = iter_index_rows(pptx_path, source_name, jobs)
+			csv_schema.write_slide_csv(output_csv, rows)
+		return
+	pptx_path, source_name = pptx_io.resolve_input_pptx(input_path, None)
+	rows = iter_index_rows(pptx_path, source_name, jobs)
 	csv_schema.write_slide_csv(output_csv, rows)
 
 
 #============================================
-def index_rows(
+def index_slide(
+	slide: pptx.slide.Slide,
+	index: int,
+	source_name: str,
+	slide_width: int,
+	slide_height: int,
+) -> tuple[dict[str, str], float, str | None, list[str]]:
+	"""
+	Index one slide.
+
+	Args:
+		slide: Slide instance.
+		index: 1-based slide index.
+		source_name: Source basename for CSV rows.
+		slide_width: Presentation slide width.
+		slide_height: Presentation slide height.
+
+	Returns:
+		tuple[dict[str, str], float, str | None, list[str]]: CSV row, layout
+			confidence, layout warning, and unsupported shape types.
+	"""
+	# python-pptx builds new shape proxies on every slide.shapes walk, and
+	# each proxy re-queries its placeholder element, so build them once
+	shapes = list(slide.shapes)
+	# slide.shapes.title scans the shape tree and builds a new proxy each time
+	title_shape = slide.shapes.title
+	title_text = ""
+	if title_shape and title_shape.text_frame:
+		title_text = title_shape.text_frame.text or ""
+	notes_text = extract_notes_text(slide)
+	# placeholder roles and geometry from hashing, reused for classification
+	shape_boxes = {}
+	slide_hash, _, _ = pptx_hash.compute_slide_hash_from_slide(
+		slide,
+		notes_text,
+		shapes,
+		shape_boxes=shape_boxes,
+	)
+	body_text, asset_types, unsupported = scan_slide_shapes(shapes, title_shape)
+	layout_type, layout_confidence, _ = (
+		layout_classifier.classify_layout_type(
+			slide,
+			slide_width,
+			slide_height,
+			title_text,
+			body_text,
+			shapes,
+			shape_boxes,
+		)
+	)
+	master_name, layout_warning = resolve_master_name(slide)
+	row = build_slide_row(
+		source_name,
+		index,
+		title_text,
+		body_text,
+		notes_text,
+		slide_hash,
+		master_name,
+		layout_type,
+		asset_types,
+	)
+	return (row, layout_confidence, layout_warning, unsupported)
+
+
+#============================================
+def init_index_worker(pptx_path: str) -> None:
+	"""
+	Open the presentation once in an indexing worker process.
+
+	Args:
+		pptx_path: PPTX path.
+	"""
+	global WORKER_PRESENTATION
+	WORKER_PRESENTATION = pptx.Presentation(pptx_path)
+
+
+#============================================
+def index_slide_range(task: tuple[int, int, str]) -> list[tuple]:
+	"""
+	Index a range of slides in the worker presentation.
+
+	Args:
+		task: Zero-based (start, stop) slide positions and source basename.
+
+	Returns:
+		list[tuple]: index_slide() results in slide order.
+	"""
+	start, stop, source_name = task
+	presentation = WORKER_PRESENTATION
+	slide_width = int(getattr(presentation, "slide_width", 0) or 0)
+	slide_height = int(getattr(presentation, "slide_height", 0) or 0)
+	slides = presentation.slides
+	results = []
+	for position in range(start, stop):
+		results.append(
+			index_slide(
+				slides[position],
+				position + 1,
+				source_name,
+				slide_width,
+				slide_height,
+			)
+		)
+	return results
+
+
+#============================================
+def iter_slide_results(
 	pptx_path: str,
 	source_name: str,
-) -> list[dict[str, str]]:
+	jobs: int,
+) -> collections.abc.Iterator[tuple]:
 	"""
-	Index rows from a PPTX path.
+	Yield index_slide() results in slide order.
 
 	Args:
 		pptx_path: Path to PPTX.
 		source_name: Source basename for CSV rows.
+		jobs: Worker processes; above 1, blocks of slides are indexed in a
+			process pool, each worker opening the PPTX once. 0 uses one
+			worker per CPU.
 
-	Returns:
-		list[dict[str, str]]: CSV rows.
+	Yields:
+		tuple: index_slide() result for each slide.
 	"""
 	presentation = pptx.Presentation(pptx_path)
+	slide_count = len(presentation.slides)
+	jobs = pptx_hash.resolve_worker_count(jobs)
+	if jobs > 1 and slide_count > 1:
+		jobs = min(jobs, slide_count)
+		tasks = [
+			(start, stop, source_name)
+			for start, stop in pptx_hash.split_slide_blocks(slide_count, jobs)
+		]
+		with concurrent.futures.ProcessPoolExecutor(
+			max_workers=jobs,
+			initializer=init_index_worker,
+			initargs=(pptx_path,),
+		) as executor:
+			for block_results in executor.map(index_slide_range, tasks):
+				yield from block_results
+		return
 	slide_width = int(getattr(presentation, "slide_width", 0) or 0)
 	slide_height = int(getattr(presentation, "slide_height", 0) or 0)
-	rows = []
+	for index, slide in enumerate(presentation.slides, 1):
+		yield index_slide(slide, index, source_name, slide_width, slide_height)
+
+
+#============================================
+def iter_index_rows(
+	pptx_path: str,
+	source_name: str,
+	jobs: int = 1,
+) -> collections.abc.Iterator[dict[str, str]]:
+	"""
+	Yield CSV rows from a PPTX path one slide at a time.
+
+	The warning and layout confidence reports print once the last row has
+	been yielded.
+
+	Args:
+		pptx_path: Path to PPTX.
+		source_name: Source basename for CSV rows.
+		jobs: Worker processes for indexing slides.
+
+	Yields:
+		dict[str, str]: CSV row for each slide.
+	"""
 	unsupported_shapes = {}
 	layout_errors = {}
 	layout_confidences = {}
-	for index, slide in enumerate(presentation.slides, 1):
-		title_text = ""
-		if slide.shapes.title and slide.shapes.title.text_frame:
-			title_text = slide.shapes.title.text_frame.text or ""
-		notes_text = extract_notes_text(slide)
-		slide_hash, _, _ = pptx_hash.compute_slide_hash_from_slide(
-			slide,
-			notes_text,
-		)
-		body_text = extract_body_text(slide)
-		asset_types = collect_asset_types(slide)
-		layout_type, layout_confidence, _ = (
-			layout_classifier.classify_layout_type(
-				slide,
-				slide_width,
-				slide_height,
-				title_text,
-				body_text,
-			)
-		)
+	results = iter_slide_results(pptx_path, source_name, jobs)
+	for index, result in enumerate(results, 1):
+		row, layout_confidence, layout_warning, unsupported = result
 		layout_confidences[index] = layout_confidence
-		master_name, layout_warning = resolve_master_name(slide)
 		if layout_warning:
 			layout_errors[index] = layout_warning
-		unsupported = collect_unsupported_shapes(slide)
 		if unsupported:
 			unsupported_shapes[index] = unsupported
-		row = build_slide_row(
-			source_name,
-			index,
-			title_text,
-			body_text,
-			notes_text,
-			slide_hash,
-			master_name,
-			layout_type,
-			asset_types,
-		)
-		rows.append(row)
+		yield row
 	report_index_warnings(unsupported_shapes, layout_errors)
 	report_layout_confidence(layout_confidences)
-	return rows
+
+
+#============================================
+def index_rows(
+	pptx_path: str,
+	source_name: str,
+	jobs: int = 1,
+) -> list[dict[str, str]]:
+	"""
+	Index rows from a PPTX path.
+
+	Args:
+		pptx_path: Path to PPTX.
+		source_name: Source basename for CSV rows.
+		jobs: Worker processes for indexing slides.
+
+	Returns:
+		list[dict[str, str]]: CSV rows.
+	"""
+	return list(iter_index_rows(pptx_path, source_name, jobs))
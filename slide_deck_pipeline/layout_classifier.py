@@ -1,6 +1,43 @@
+# Standard Library
+import weakref
+
 # PIP3 modules
 import pptx
 import pptx.enum.shapes
+import pptx.shapes.placeholder
+
+
+# Slide placeholder classes that inherit missing geometry from the layout.
+INHERITING_PLACEHOLDERS = (
+	pptx.shapes.placeholder.SlidePlaceholder,
+	pptx.shapes.placeholder.ChartPlaceholder,
+	pptx.shapes.placeholder.PicturePlaceholder,
+	pptx.shapes.placeholder.TablePlaceholder,
+	pptx.shapes.placeholder.PlaceholderPicture,
+)
+# Inherited placeholder geometry per slide layout part, keyed by placeholder idx.
+LAYOUT_GEOMETRY = weakref.WeakKeyDictionary()
+PLACEHOLDERS = pptx.enum.shapes.PP_PLACEHOLDER
+TITLE_PLACEHOLDER_TYPES = (PLACEHOLDERS.TITLE, PLACEHOLDERS.CENTER_TITLE)
+SUBTITLE_PLACEHOLDER_TYPE = PLACEHOLDERS.SUBTITLE
+# Members missing from the installed python-pptx are left out of these tuples.
+BODY_PLACEHOLDER_TYPES = tuple(
+	getattr(PLACEHOLDERS, name)
+	for name in ("BODY", "OBJECT", "CONTENT", "TEXT")
+	if hasattr(PLACEHOLDERS, name)
+)
+# Placeholders that take a single image inserted by the rebuild step.
+IMAGE_PLACEHOLDER_TYPES = tuple(
+	getattr(PLACEHOLDERS, name)
+	for name in ("PICTURE", "OBJECT", "CONTENT")
+	if hasattr(PLACEHOLDERS, name)
+)
+# Placeholders that text_to_slides fills as picture slots.
+PICTURE_SLOT_PLACEHOLDER_TYPES = tuple(
+	getattr(PLACEHOLDERS, name)
+	for name in ("PICTURE", "MEDIA")
+	if hasattr(PLACEHOLDERS, name)
+)
 
 
 #============================================
@@ -14,58 +51,105 @@ def classify_placeholder_role(placeholder_type) -> str | None:
 	Returns:
 		str | None: Role name or None if unsupported.
 	"""
-	placeholders = pptx.enum.shapes.PP_PLACEHOLDER
-	if placeholder_type in (
-		placeholders.TITLE,
-		placeholders.CENTER_TITLE,
-	):
+	if placeholder_type in TITLE_PLACEHOLDER_TYPES:
 		return "title"
-	if placeholder_type == placeholders.SUBTITLE:
+	if placeholder_type == SUBTITLE_PLACEHOLDER_TYPE:
 		return "subtitle"
-	body_types = [
-		placeholders.BODY,
-		placeholders.OBJECT,
-	]
-	content_type = getattr(placeholders, "CONTENT", None)
-	if content_type is not None:
-		body_types.append(content_type)
-	text_type = getattr(placeholders, "TEXT", None)
-	if text_type is not None:
-		body_types.append(text_type)
-	if placeholder_type in tuple(body_types):
+	if placeholder_type in BODY_PLACEHOLDER_TYPES:
 		return "body"
 	return None
 
 
 #============================================
-def collect_placeholder_boxes(slide: pptx.slide.Slide) -> list[dict[str, object]]:
+def shape_geometry(shape) -> tuple[int, int, int, int]:
+	"""
+	Return shape geometry, resolving placeholder inheritance once.
+
+	python-pptx looks up the layout placeholder again for each of left, top,
+	width, and height, scanning every layout placeholder each time. Here the
+	layout geometry is read once per layout and placeholder idx and reused
+	for every slide on that layout. Missing values are 0.
+
+	Args:
+		shape: Shape instance.
+
+	Returns:
+		tuple[int, int, int, int]: (left, top, width, height).
+	"""
+	if not isinstance(shape, INHERITING_PLACEHOLDERS):
+		return (
+			int(getattr(shape, "left", 0) or 0),
+			int(getattr(shape, "top", 0) or 0),
+			int(getattr(shape, "width", 0) or 0),
+			int(getattr(shape, "height", 0) or 0),
+		)
+	element = shape._element
+	geometry = (element.x, element.y, element.cx, element.cy)
+	if None in geometry:
+		layout = shape.part.slide_layout
+		layout_boxes = LAYOUT_GEOMETRY.setdefault(layout.part, {})
+		idx = element.ph_idx
+		inherited = layout_boxes.get(idx)
+		if inherited is None:
+			inherited = (None, None, None, None)
+			base = layout.placeholders.get(idx=idx)
+			if base is not None:
+				inherited = (base.left, base.top, base.width, base.height)
+			layout_boxes[idx] = inherited
+		geometry = tuple(
+			inherited[position] if value is None else value
+			for position, value in enumerate(geometry)
+		)
+	return tuple(int(value or 0) for value in geometry)
+
+
+#============================================
+def collect_placeholder_boxes(
+	slide: pptx.slide.Slide,
+	shapes=None,
+	shape_boxes: dict | None = None,
+) -> list[dict[str, object]]:
 	"""
 	Collect placeholder boxes with roles and geometry.
 
 	Args:
 		slide: Slide instance.
+		shapes: Slide shapes already built by the caller; defaults to slide.shapes.
+		shape_boxes: Optional (placeholder role, geometry) per shape element,
+			as filled by pptx_hash.compute_slide_hash_from_slide(); an empty
+			role means the shape is not a classified placeholder.
 
 	Returns:
 		list[dict[str, object]]: Placeholder metadata.
 	"""
+	if shapes is None:
+		shapes = slide.shapes
 	boxes = []
-	for shape in slide.shapes:
-		if not getattr(shape, "is_placeholder", False):
-			continue
-		try:
-			placeholder_type = shape.placeholder_format.type
-		except Exception:
-			continue
-		role = classify_placeholder_role(placeholder_type)
-		if not role:
-			continue
+	for shape in shapes:
+		cached = shape_boxes.get(shape._element) if shape_boxes else None
+		if cached is not None:
+			role, geometry = cached
+			if not role:
+				continue
+		else:
+			if not getattr(shape, "is_placeholder", False):
+				continue
+			try:
+				placeholder_type = shape.placeholder_format.type
+			except Exception:
+				continue
+			role = classify_placeholder_role(placeholder_type)
+			if not role:
+				continue
+			geometry = shape_geometry(shape)
+		left, top, width, height = geometry
 		boxes.append(
 			{
 				"role": role,
-				"left": int(shape.left),
-				"top": int(shape.top),
-				"width": int(shape.width),
-				"height": int(shape.height),
+				"left": left,
+				"top": top,
+				"width": width,
+				"height": height,
 			}
 		)
 	return boxes
@@ -201,6 +285,8 @@ def classify_layout_type(
 	slide_height: int,
 	title_text: str,
 	body_text: str,
+	shapes=None,
+	shape_boxes: dict | None = None,
 ) -> tuple[str, float, list[str]]:
 	"""
 	Classify a slide into a semantic layout type.
@@ -211,11 +297,13 @@ def classify_layout_type(
 		slide_height: Slide height in EMUs.
 		title_text: Title text.
 		body_text: Body text.
+		shapes: Slide shapes already built by the caller; defaults to slide.shapes.
+		shape_boxes: Optional dict passed to collect_placeholder_boxes().
 
 	Returns:
 		tuple[str, float, list[str]]: Layout type, confidence, reasons.
 	"""
-	placeholders = collect_placeholder_boxes(slide)
+	placeholders = collect_placeholder_boxes(slide, shapes, shape_boxes)
 	if not placeholders:
 		if title_text or body_text:
 			return ("custom", 0.2, ["text_without_placeholders"])
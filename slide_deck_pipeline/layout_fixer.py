@@ -8,6 +8,7 @@ import pptx
 import pptx.enum.shapes
 
 # local repo modules
+import slide_deck_pipeline.layout_classifier as layout_classifier
 import slide_deck_pipeline.pptx_io as pptx_io
 import slide_deck_pipeline.text_boxes as text_boxes
 import slide_deck_pipeline.soffice_tools as soffice_tools
@@ -15,6 +16,8 @@ import slide_deck_pipeline.soffice_tools as soffice_tools
 
 # Title length limit in characters
 TITLE_MAX_LENGTH = 120
+SHAPE_TYPES = pptx.enum.shapes.MSO_SHAPE_TYPE
+TITLE_PLACEHOLDER_TYPE = pptx.enum.shapes.PP_PLACEHOLDER.TITLE
 
 
 #============================================
@@ -55,7 +58,7 @@ def is_title_placeholder(shape) -> bool:
 	if not shape.is_placeholder:
 		return False
 	try:
-		return shape.placeholder_format.type == pptx.enum.shapes.PP_PLACEHOLDER.TITLE
+		return shape.placeholder_format.type == TITLE_PLACEHOLDER_TYPE
 	except Exception:
 		return False
 
@@ -66,14 +69,7 @@ def is_body_placeholder(shape) -> bool:
 	if not shape.is_placeholder:
 		return False
 	try:
-		placeholder_type = shape.placeholder_format.type
-		placeholders = pptx.enum.shapes.PP_PLACEHOLDER
-		body_types = [placeholders.BODY]
-		for attr_name in ("OBJECT", "CONTENT", "TEXT"):
-			candidate = getattr(placeholders, attr_name, None)
-			if candidate is not None:
-				body_types.append(candidate)
-		return placeholder_type in tuple(body_types)
+		return shape.placeholder_format.type in layout_classifier.BODY_PLACEHOLDER_TYPES
 	except Exception:
 		return False
 
@@ -134,13 +130,15 @@ def count_assets(slide) -> dict[str, int]:
 		"other": 0,
 	}
 	for shape in slide.shapes:
-		if shape.shape_type == pptx.enum.shapes.MSO_SHAPE_TYPE.PICTURE:
+		# shape_type is computed from the XML on each access, so read it once
+		shape_type = shape.shape_type
+		if shape_type == SHAPE_TYPES.PICTURE:
 			counts["images"] += 1
-		elif shape.shape_type == pptx.enum.shapes.MSO_SHAPE_TYPE.TABLE:
+		elif shape_type == SHAPE_TYPES.TABLE:
 			counts["tables"] += 1
-		elif shape.shape_type == pptx.enum.shapes.MSO_SHAPE_TYPE.CHART:
+		elif shape_type == SHAPE_TYPES.CHART:
 			counts["charts"] += 1
-		elif not shape.has_text_frame and shape.shape_type != pptx.enum.shapes.MSO_SHAPE_TYPE.PLACEHOLDER:
+		elif not shape.has_text_frame and shape_type != SHAPE_TYPES.PLACEHOLDER:
 			counts["other"] += 1
 	return counts
 
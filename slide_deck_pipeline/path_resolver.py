@@ -45,6 +45,30 @@ def _collect_matches(roots: list[str], relative_path: str) -> list[str]:
 	return sorted(matches)
 
 
+#============================================
+def _iter_search_levels(input_dir: str | None):
+	"""
+	Yield root directory groups in search order.
+
+	Subdirectory listings are only taken when an earlier level missed, so
+	the common case of a file in the working directory costs no listdir.
+
+	Args:
+		input_dir: Optional base directory.
+
+	Yields:
+		list[str]: Root directories for one search level.
+	"""
+	cwd = os.getcwd()
+	yield [cwd]
+	yield [os.path.abspath(os.path.join(cwd, ".."))]
+	yield _list_subdirs(cwd)
+	if input_dir:
+		yield [os.path.abspath(input_dir)]
+		yield [os.path.abspath(os.path.join(input_dir, ".."))]
+		yield _list_subdirs(input_dir)
+
+
 #============================================
 def resolve_path(
 	target_path: str,
@@ -69,22 +93,7 @@ def resolve_path(
 		if os.path.exists(target_path):
 			return (target_path, warnings)
 		raise FileNotFoundError(f"Path not found: {target_path}")
-	cwd = os.getcwd()
-	cwd_parent = os.path.abspath(os.path.join(cwd, ".."))
-	levels = [
-		[cwd],
-		[cwd_parent],
-		_list_subdirs(cwd),
-	]
-	if input_dir:
-		levels.extend(
-			[
-				[os.path.abspath(input_dir)],
-				[os.path.abspath(os.path.join(input_dir, ".."))],
-				_list_subdirs(input_dir),
-			]
-		)
-	for roots in levels:
+	for roots in _iter_search_levels(input_dir):
 		matches = _collect_matches(roots, target_path)
 		if not matches:
 			continue
@@ -1,5 +1,8 @@
 # Standard Library
+import os
+import weakref
 import hashlib
+import concurrent.futures
 
 # PIP3 modules
 import pptx
@@ -9,8 +12,16 @@ import pptx.enum.shapes
 import slide_deck_pipeline.csv_schema as csv_schema
 import slide_deck_pipeline.layout_classifier as layout_classifier
 import slide_deck_pipeline.pptx_text as pptx_text
+import slide_deck_pipeline.text_boxes as text_boxes
 
 
+GROUP_SHAPE_TYPE = pptx.enum.shapes.MSO_SHAPE_TYPE.GROUP
+PICTURE_SHAPE_TYPE = pptx.enum.shapes.MSO_SHAPE_TYPE.PICTURE
+# Presentation opened once per hashing worker process by init_hash_worker().
+WORKER_PRESENTATION = None
+# Image hash per image part; a logo reused on every slide is hashed once.
+IMAGE_PART_HASHES = weakref.WeakKeyDictionary()
+
 #============================================
 def extract_slide_xml(slide) -> bytes:
 	"""
@@ -53,12 +64,7 @@ def shape_geometry(shape) -> tuple[int, int, int, int]:
 	Returns:
 		tuple[int, int, int, int]: (left, top, width, height).
 	"""
-	return (
-		int(getattr(shape, "left", 0) or 0),
-		int(getattr(shape, "top", 0) or 0),
-		int(getattr(shape, "width", 0) or 0),
-		int(getattr(shape, "height", 0) or 0),
-	)
+	return layout_classifier.shape_geometry(shape)
 
 
 #============================================
@@ -92,6 +98,7 @@ def hash_bytes(payload: bytes) -> str:
 	Returns:
 		str: Short hash string.
 	"""
+	# stored in CSVs and patch files, so the algorithm and length are fixed
 	return hashlib.sha256(payload).hexdigest()[:16]
 
 
@@ -106,25 +113,41 @@ def hash_image_blob(shape) -> str:
 	Returns:
 		str: Image hash or empty string.
 	"""
-	if getattr(shape, "shape_type", None) != pptx.enum.shapes.MSO_SHAPE_TYPE.PICTURE:
+	if getattr(shape, "shape_type", None) != PICTURE_SHAPE_TYPE:
 		return ""
-	image = getattr(shape, "image", None)
-	if not image or not getattr(image, "blob", None):
+	# linked pictures have no embedded image part
+	image_rid = shape._pic.blip_rId
+	if image_rid is None:
 		return ""
-	return hash_bytes(bytes(image.blob))
+	image_part = shape.part.related_part(image_rid)
+	image_hash = IMAGE_PART_HASHES.get(image_part)
+	if image_hash is None:
+		image_hash = ""
+		if image_part.blob:
+			image_hash = hash_bytes(image_part.blob)
+		IMAGE_PART_HASHES[image_part] = image_hash
+	return image_hash
 
 
 #============================================
-def hash_shape_text(shape) -> str:
+def hash_shape_text(shape, shape_texts: dict | None = None) -> str:
 	"""
 	Hash normalized shape text.
 
 	Args:
 		shape: Shape instance.
+		shape_texts: Optional dict that collects (text, text hash) per text
+			frame shape element, so callers can reuse them for box records.
 
 	Returns:
 		str: Text hash or empty string.
 	"""
+	if shape_texts is not None and getattr(shape, "has_text_frame", False):
+		text_value, text_hash = text_boxes.extract_text_and_hash(shape)
+		shape_texts[shape._element] = (text_value, text_hash)
+		if not text_value:
+			return ""
+		return text_hash
 	lines = pptx_text.extract_shape_text(shape)
 	if not lines:
 		return ""
@@ -143,13 +166,11 @@ def shape_kind(shape) -> str:
 	Returns:
 		str: Shape kind.
 	"""
-	if (
-		getattr(shape, "shape_type", None)
-		== pptx.enum.shapes.MSO_SHAPE_TYPE.GROUP
-		and hasattr(shape, "shapes")
-	):
+	# shape_type on a plain shape re-queries its placeholder element, so read it once
+	shape_type = getattr(shape, "shape_type", None)
+	if shape_type == GROUP_SHAPE_TYPE and hasattr(shape, "shapes"):
 		return "group"
-	if getattr(shape, "shape_type", None) == pptx.enum.shapes.MSO_SHAPE_TYPE.PICTURE:
+	if shape_type == PICTURE_SHAPE_TYPE:
 		return "picture"
 	if getattr(shape, "has_table", False):
 		return "table"
@@ -163,24 +184,34 @@ def shape_kind(shape) -> str:
 
 
 #============================================
-def build_shape_tokens(shape, tokens: list[tuple]) -> None:
+def build_shape_tokens(
+	shape,
+	tokens: list[tuple],
+	shape_texts: dict | None = None,
+	shape_boxes: dict | None = None,
+) -> None:
 	"""
 	Append shape tokens in order.
 
 	Args:
 		shape: Shape instance.
 		tokens: Token list to append to.
+		shape_texts: Optional dict passed to hash_shape_text().
+		shape_boxes: Optional dict that collects (placeholder role, geometry)
+			per non-group shape element, for layout classification.
 	"""
 	kind = shape_kind(shape)
 	geom = shape_geometry(shape)
 	if kind == "group":
 		tokens.append(("group_start", geom, shape_type_name(shape)))
 		for nested in shape.shapes:
-			build_shape_tokens(nested, tokens)
+			build_shape_tokens(nested, tokens, shape_texts, shape_boxes)
 		tokens.append(("group_end",))
 		return
 	role = placeholder_role(shape)
-	text_hash = hash_shape_text(shape)
+	if shape_boxes is not None:
+		shape_boxes[shape._element] = (role, geom)
+	text_hash = hash_shape_text(shape, shape_texts)
 	image_hash = hash_image_blob(shape)
 	tokens.append(
 		(
@@ -199,6 +230,9 @@ def build_shape_tokens(shape, tokens: list[tuple]) -> None:
 def compute_slide_hash_from_slide(
 	slide,
 	notes_text: str | None = None,
+	shapes=None,
+	shape_texts: dict | None = None,
+	shape_boxes: dict | None = None,
 ) -> tuple[str, str, bytes]:
 	"""
 	Compute slide hash and return slide XML and notes text.
@@ -206,6 +240,11 @@ def compute_slide_hash_from_slide(
 	Args:
 		slide: Slide instance.
 		notes_text: Optional notes text to reuse.
+		shapes: Slide shapes already built by the caller; defaults to slide.shapes.
+		shape_texts: Optional dict filled with (text, text hash) per text
+			frame shape element, keyed by shape._element.
+		shape_boxes: Optional dict filled with (placeholder role, geometry)
+			per non-group shape element, keyed by shape._element.
 
 	Returns:
 		tuple[str, str, bytes]: Slide hash, notes text, slide XML bytes.
@@ -213,9 +252,114 @@ def compute_slide_hash_from_slide(
 	if notes_text is None:
 		notes_text = pptx_text.extract_notes_text(slide)
 	slide_xml = extract_slide_xml(slide)
+	if shapes is None:
+		shapes = slide.shapes
 	tokens: list[tuple] = []
-	for shape in slide.shapes:
-		build_shape_tokens(shape, tokens)
+	for shape in shapes:
+		build_shape_tokens(shape, tokens, shape_texts, shape_boxes)
 	payload = repr(tuple(tokens)).encode("utf-8")
 	slide_hash = csv_schema.compute_slide_hash(payload, notes_text)
 	return (slide_hash, notes_text, slide_xml)
+
+
+#============================================
+def init_hash_worker(pptx_path: str) -> None:
+	"""
+	Open the presentation once in a hashing worker process.
+
+	Args:
+		pptx_path: PPTX path.
+	"""
+	global WORKER_PRESENTATION
+	WORKER_PRESENTATION = pptx.Presentation(pptx_path)
+
+
+#============================================
+def hash_slide_range(bounds: tuple[int, int]) -> list[str]:
+	"""
+	Hash a range of slides in the worker presentation.
+
+	Args:
+		bounds: Zero-based (start, stop) slide positions.
+
+	Returns:
+		list[str]: Slide hashes in slide order.
+	"""
+	start, stop = bounds
+	slides = WORKER_PRESENTATION.slides
+	hashes = []
+	for position in range(start, stop):
+		slide_hash, _, _ = compute_slide_hash_from_slide(slides[position])
+		hashes.append(slide_hash)
+	return hashes
+
+
+#============================================
+def resolve_worker_count(jobs: int) -> int:
+	"""
+	Resolve a --jobs value to a worker process count.
+
+	Args:
+		jobs: Requested worker processes; 0 or less means one per CPU.
+
+	Returns:
+		int: Worker process count, at least 1.
+	"""
+	if jobs <= 0:
+		return os.cpu_count() or 1
+	return jobs
+
+
+#============================================
+def split_slide_blocks(slide_count: int, jobs: int) -> list[tuple[int, int]]:
+	"""
+	Split slide positions into one contiguous block per worker.
+
+	One block per worker keeps pool IPC to a few messages.
+
+	Args:
+		slide_count: Number of slides in the deck.
+		jobs: Number of worker processes.
+
+	Returns:
+		list[tuple[int, int]]: Zero-based (start, stop) slide positions.
+	"""
+	if slide_count <= 0:
+		return []
+	block_size = -(-slide_count // max(1, jobs))
+	blocks = [
+		(start, min(start + block_size, slide_count))
+		for start in range(0, slide_count, block_size)
+	]
+	return blocks
+
+
+#============================================
+def compute_deck_slide_hashes(pptx_path: str, slide_count: int, jobs: int) -> list[str]:
+	"""
+	Hash every slide of a deck using a pool of worker processes.
+
+	Each worker opens the PPTX once and hashes a contiguous block of slides,
+	so the result matches compute_slide_hash_from_slide() on each slide.
+
+	Args:
+		pptx_path: PPTX path.
+		slide_count: Number of slides in the deck.
+		jobs: Number of worker processes.
+
+	Returns:
+		list[str]: Slide hashes in slide order.
+	"""
+	if slide_count <= 0:
+		return []
+	jobs = max(1, min(jobs, slide_count))
+	blocks = split_slide_blocks(slide_count, jobs)
+	hashes = []
+	with concurrent.futures.ProcessPoolExecutor(
+		max_workers=jobs,
+		initializer=init_hash_worker,
+		initargs=(pptx_path,),
+	) as executor:
+		for block_hashes in executor.map(hash_slide_range, blocks):
+			hashes.extend(block_hashes)
+	return hashes
@@ -32,6 +32,6 @@ def resolve_input_pptx(input_path: str, temp_dir: str | None) -> tuple[str, str]
 	if lowered.endswith(".odp"):
 		if not temp_dir:
 			raise ValueError("Temporary directory required for ODP conversion.")
-		pptx_path = soffice_tools.convert_odp_to_pptx(resolved_path, temp_dir)
+		pptx_path = soffice_tools.convert_odp_to_pptx_cached(resolved_path, temp_dir)
 		return (pptx_path, source_name)
 	raise ValueError("Input must be a .pptx or .odp file.")
@@ -1,6 +1,60 @@
 # PIP3 modules
+import lxml.etree
 import pptx
 import pptx.enum.shapes
+import pptx.oxml.ns
+
+
+GROUP_SHAPE_TYPE = pptx.enum.shapes.MSO_SHAPE_TYPE.GROUP
+DRAWING_NAMESPACES = pptx.oxml.ns.nsmap("a")
+LINE_BREAK_TAG = pptx.oxml.ns.qn("a:br")
+# Compiled once; each returns nodes in document order.
+PARAGRAPH_XPATH = lxml.etree.XPath("a:p", namespaces=DRAWING_NAMESPACES)
+PARAGRAPH_LEVEL_XPATH = lxml.etree.XPath(
+	"a:pPr/@lvl",
+	namespaces=DRAWING_NAMESPACES,
+)
+PARAGRAPH_TEXT_XPATH = lxml.etree.XPath(
+	"a:r/a:t | a:br | a:fld/a:t",
+	namespaces=DRAWING_NAMESPACES,
+)
+
+
+#============================================
+def paragraph_levels_and_text(text_frame) -> list[tuple[int, str]]:
+	"""
+	Read the indent level and text of each paragraph in a text frame.
+
+	Reads the a:p elements with compiled XPath queries instead of building
+	python-pptx paragraph and run proxies. Text matches _Paragraph.text:
+	runs and fields contribute their raw a:t text, including the _xHHHH_
+	escapes python-pptx writes for control characters, and each a:br
+	becomes a vertical tab.
+
+	Args:
+		text_frame: TextFrame instance.
+
+	Returns:
+		list[tuple[int, str]]: Indent level and unstripped text per paragraph.
+	"""
+	tx_body = getattr(text_frame, "_txBody", None)
+	if tx_body is None:
+		return [
+			(paragraph.level, paragraph.text)
+			for paragraph in text_frame.paragraphs
+		]
+	pairs = []
+	for paragraph_element in PARAGRAPH_XPATH(tx_body):
+		level_values = PARAGRAPH_LEVEL_XPATH(paragraph_element)
+		level = int(level_values[0]) if level_values else 0
+		parts = []
+		for node in PARAGRAPH_TEXT_XPATH(paragraph_element):
+			if node.tag == LINE_BREAK_TAG:
+				parts.append("\v")
+			elif node.text:
+				parts.append(node.text)
+		pairs.append((level, "".join(parts)))
+	return pairs
 
 
 #============================================
@@ -14,13 +68,11 @@ def extract_paragraph_lines(text_frame: pptx.text.text.TextFrame) -> list[str]:
 	Returns:
 		list[str]: Lines with leading tab indentation.
 	"""
-	lines = []
-	for paragraph in text_frame.paragraphs:
-		text = paragraph.text.strip()
-		if not text:
-			continue
-		indent = "\t" * paragraph.level
-		lines.append(f"{indent}{text}")
+	lines = [
+		"\t" * level + text
+		for level, raw_text in paragraph_levels_and_text(text_frame)
+		if (text := raw_text.strip())
+	]
 	return lines
 
 
@@ -77,11 +129,7 @@ def extract_shape_text(shape) -> list[str]:
 		list[str]: Text lines.
 	"""
 	lines = []
-	if (
-		getattr(shape, "shape_type", None)
-		== pptx.enum.shapes.MSO_SHAPE_TYPE.GROUP
-		and hasattr(shape, "shapes")
-	):
+	if getattr(shape, "shape_type", None) == GROUP_SHAPE_TYPE and hasattr(shape, "shapes"):
 		for nested in shape.shapes:
 			lines.extend(extract_shape_text(nested))
 		return lines
@@ -95,20 +143,32 @@ def extract_shape_text(shape) -> list[str]:
 
 
 #============================================
-def extract_body_text(slide: pptx.slide.Slide) -> str:
+def extract_body_text(
+	slide: pptx.slide.Slide,
+	shapes=None,
+	title_shape=None,
+) -> str:
 	"""
 	Extract body text from non-title text frames.
 
 	Args:
 		slide: Slide instance.
+		shapes: Slide shapes already built by the caller; defaults to slide.shapes.
+		title_shape: Title shape already looked up by the caller; defaults to
+			slide.shapes.title.
 
 	Returns:
 		str: Body text with newline separators.
 	"""
+	if shapes is None:
+		shapes = slide.shapes
+	if title_shape is None:
+		title_shape = slide.shapes.title
 	lines = []
-	title_shape = slide.shapes.title
-	for shape in slide.shapes:
-		if title_shape and shape == title_shape:
+	for shape in shapes:
+		if title_shape is not None and shape == title_shape:
+			# a slide has one title, so stop comparing once it is skipped
+			title_shape = None
 			continue
 		lines.extend(extract_shape_text(shape))
 	return "\n".join(lines)
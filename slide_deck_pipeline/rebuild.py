@@ -1,4 +1,5 @@
 # Standard Library
+import contextlib
 import io
 import math
 import os
@@ -20,6 +21,10 @@ import slide_deck_pipeline.text_normalization as text_normalization
 import slide_deck_pipeline.image_utils as image_utils
 
 
+PICTURE_SHAPE_TYPE = pptx.enum.shapes.MSO_SHAPE_TYPE.PICTURE
+BODY_PLACEHOLDER_TYPE = pptx.enum.shapes.PP_PLACEHOLDER.BODY
+
+
 #============================================
 def normalize_name(name: str) -> str:
 	"""
@@ -185,16 +190,21 @@ def find_body_placeholder(slide: pptx.slide.Slide) -> pptx.shapes.base.BaseShape
 	Returns:
 		pptx.shapes.base.BaseShape | None: Body shape or None.
 	"""
+	# one walk finds the body placeholder, the title, and the fallback;
+	# the title is the first placeholder with idx 0, as in slide.shapes.title
+	title_found = False
+	fallback_shape = None
 	for shape in slide.shapes:
-		if not shape.is_placeholder:
-			continue
-		placeholder_type = shape.placeholder_format.type
-		if placeholder_type == pptx.enum.shapes.PP_PLACEHOLDER.BODY:
-			return shape
-	for shape in slide.shapes:
-		if shape.has_text_frame and shape != slide.shapes.title:
-			return shape
-	return None
+		if shape.is_placeholder:
+			placeholder_format = shape.placeholder_format
+			if placeholder_format.type == BODY_PLACEHOLDER_TYPE:
+				return shape
+			if not title_found and placeholder_format.idx == 0:
+				title_found = True
+				continue
+		if fallback_shape is None and shape.has_text_frame:
+			fallback_shape = shape
+	return fallback_shape
 
 
 #============================================
@@ -246,19 +256,22 @@ def set_notes_text(slide: pptx.slide.Slide, notes_text: str) -> None:
 
 
 #============================================
-def collect_source_images(slide: pptx.slide.Slide) -> list[bytes]:
+def collect_source_images(slide: pptx.slide.Slide, shapes=None) -> list[bytes]:
 	"""
 	Collect image blobs from a source slide.
 
 	Args:
 		slide: Source slide instance.
+		shapes: Slide shapes already built by the caller; defaults to slide.shapes.
 
 	Returns:
 		list[bytes]: Image blobs in slide order.
 	"""
+	if shapes is None:
+		shapes = slide.shapes
 	images = []
-	for shape in slide.shapes:
-		if shape.shape_type != pptx.enum.shapes.MSO_SHAPE_TYPE.PICTURE:
+	for shape in shapes:
+		if shape.shape_type != PICTURE_SHAPE_TYPE:
 			continue
 		images.append(shape.image.blob)
 	return images
@@ -281,13 +294,15 @@ def place_images_grid(slide: pptx.slide.Slide, image_blobs: list[bytes]) -> None
 	rows = int(math.ceil(len(image_blobs) / cols))
 	margin = pptx.util.Inches(0.5)
 	slide_width, slide_height = get_slide_dimensions(slide)
-	cell_width = (slide_width - (margin * (cols + 1))) // cols
-	cell_height = (slide_height - (margin * (rows + 1))) // rows
+	cell_width = int((slide_width - (margin * (cols + 1))) // cols)
+	cell_height = int((slide_height - (margin * (rows + 1))) // rows)
+	# cell offsets depend only on the grid shape, so compute them once
+	lefts = [int(margin + (cell_width + margin) * col) for col in range(cols)]
+	tops = [int(margin + (cell_height + margin) * row) for row in range(rows)]
 	for index, blob in enumerate(image_blobs):
-		row = index // cols
-		col = index % cols
-		left = margin + (cell_width + margin) * col
-		top = margin + (cell_height + margin) * row
+		row, col = divmod(index, cols)
+		left = lefts[col]
+		top = tops[row]
 		stream = io.BytesIO(blob)
 		picture = slide.shapes.add_picture(
 			stream,
@@ -298,10 +313,10 @@ def place_images_grid(slide: pptx.slide.Slide, image_blobs: list[bytes]) -> None
 		)
 		image_utils.fit_picture_shape(
 			picture,
-			int(left),
-			int(top),
-			int(cell_width),
-			int(cell_height),
+			left,
+			top,
+			cell_width,
+			cell_height,
 		)
 
 
@@ -317,16 +332,10 @@ def insert_images(slide: pptx.slide.Slide, image_blobs: list[bytes]) -> None:
 	if not image_blobs:
 		return
 	picture_placeholders = []
-	placeholder_enum = pptx.enum.shapes.PP_PLACEHOLDER
-	picture_types = [placeholder_enum.PICTURE]
-	for attr_name in ("OBJECT", "CONTENT"):
-		candidate = getattr(placeholder_enum, attr_name, None)
-		if candidate is not None:
-			picture_types.append(candidate)
 	for shape in slide.shapes:
 		if not shape.is_placeholder:
 			continue
-		if shape.placeholder_format.type in tuple(picture_types):
+		if shape.placeholder_format.type in layout_classifier.IMAGE_PLACEHOLDER_TYPES:
 			picture_placeholders.append(shape)
 	if len(image_blobs) == 1 and picture_placeholders:
 		stream = io.BytesIO(image_blobs[0])
@@ -386,6 +395,34 @@ def get_slide_dimensions(slide: pptx.slide.Slide) -> tuple[int, int]:
 	return (presentation.slide_width, presentation.slide_height)
 
 
+#============================================
+def resolve_source_paths(rows: list[dict[str, str]], csv_dir: str) -> dict[str, str]:
+	"""
+	Resolve each distinct source deck named in the CSV rows once.
+
+	Args:
+		rows: CSV rows.
+		csv_dir: Directory of the CSV file.
+
+	Returns:
+		dict[str, str]: Resolved path for each source_pptx value.
+	"""
+	source_paths = {}
+	for row in rows:
+		source_pptx = row["source_pptx"]
+		if source_pptx in source_paths:
+			continue
+		source_path, path_warnings = path_resolver.resolve_source_path(
+			source_pptx,
+			csv_dir,
+			strict=False,
+		)
+		for message in path_warnings:
+			print(f"Warning: {message}")
+		source_paths[source_pptx] = source_path
+	return source_paths
+
+
 #============================================
 def rebuild_from_csv(
 	input_csv: str,
@@ -415,64 +452,97 @@ def rebuild_from_csv(
 	else:
 		presentation = pptx.Presentation()
 	layout_map = build_layout_map(presentation)
-	source_cache: dict[str, pptx.Presentation] = {}
-	temp_dirs = []
+	# rows repeat a few (master, layout type) pairs, so resolve each pair once
+	layout_choices: dict[tuple[str, str], pptx.slide.SlideLayout] = {}
+	# slide list and per-slide (hash, image blobs) for each opened source,
+	# so rows that reuse a source slide skip the hash and image walk
+	source_states: dict[str, tuple[list, dict[int, tuple[str, list[bytes]]]]] = {}
+	source_paths = resolve_source_paths(rows, csv_dir)
+	# last row that reads each source deck, so its parsed XML can be released
+	last_source_rows = {}
 	for row_index, row in enumerate(rows, 1):
-		source_pptx = row["source_pptx"]
-		source_path, path_warnings = path_resolver.resolve_source_path(
-			source_pptx,
-			csv_dir,
-			strict=False,
-		)
-		for message in path_warnings:
-			print(f"Warning: {message}")
-		source_key = source_path
-		source_presentation = source_cache.get(source_key)
-		if not source_presentation:
-			if source_path.lower().endswith(".odp"):
-				temp_dir = tempfile.TemporaryDirectory()
-				temp_dirs.append(temp_dir)
-				converted = soffice_tools.convert_odp_to_pptx(source_path, temp_dir.name)
-				source_presentation = pptx.Presentation(converted)
-			else:
-				source_presentation = pptx.Presentation(source_path)
-			source_cache[source_key] = source_presentation
-
-		slide_index = int(row["source_slide_index"])
-		if slide_index < 1 or slide_index > len(source_presentation.slides):
-			raise ValueError(
-				f"Source slide index out of range: {source_pptx} {slide_index}."
+		last_source_rows[source_paths[row["source_pptx"]]] = row_index
+	odp_paths = [path for path in source_paths.values() if path.lower().endswith(".odp")]
+	write_odp = output_path.lower().endswith(".odp")
+	# the stack removes the work directory on every exit path
+	with contextlib.ExitStack() as stack:
+		# one work directory holds converted ODP sources and the ODP output copy
+		work_dir = ""
+		if odp_paths or write_odp:
+			work_dir = stack.enter_context(tempfile.TemporaryDirectory())
+		converted_odps = {}
+		if odp_paths:
+			# one soffice run converts every ODP source deck
+			converted_odps = soffice_tools.convert_odps_to_pptx_cached(
+				odp_paths,
+				work_dir,
 			)
-		source_slide = source_presentation.slides[slide_index - 1]
-		computed_hash, _, _ = pptx_hash.compute_slide_hash_from_slide(source_slide)
-		row_hash = row.get("slide_hash", "")
-		if not row_hash:
-			raise ValueError(f"Row {row_index}: slide_hash is missing.")
-		if row_hash != computed_hash:
-			raise ValueError(
-				f"Row {row_index}: slide_hash mismatch for {source_pptx} slide {slide_index}."
-			)
-		image_blobs = collect_source_images(source_slide)
-		layout_type = row.get("layout_type", "")
-		if not layout_type:
-			raise ValueError(f"Row {row_index}: layout_type is missing.")
-		layout = select_layout(
-			presentation,
-			layout_map,
-			row.get("master_name", ""),
-			layout_type,
-		)
-		slide = presentation.slides.add_slide(layout)
-		set_title(slide, row.get("title_text", ""))
-		set_body_text(slide, row.get("body_text", ""))
-		set_notes_text(slide, row.get("notes_text", ""))
-		insert_images(slide, image_blobs)
-	if output_path.lower().endswith(".odp"):
-		with tempfile.TemporaryDirectory() as temp_dir:
-			temp_pptx = os.path.join(temp_dir, "merged.pptx")
+		for row_index, row in enumerate(rows, 1):
+			source_pptx = row["source_pptx"]
+			source_path = source_paths[source_pptx]
+			source_state = source_states.get(source_path)
+			if source_state is None:
+				source_presentation = pptx.Presentation(
+					converted_odps.get(source_path, source_path)
+				)
+				source_state = (list(source_presentation.slides), {})
+				source_states[source_path] = source_state
+			source_slides, slide_checks = source_state
+
+			slide_index = int(row["source_slide_index"])
+			if slide_index < 1 or slide_index > len(source_slides):
+				raise ValueError(
+					f"Source slide index out of range: {source_pptx} {slide_index}."
+				)
+			slide_check = slide_checks.get(slide_index)
+			if slide_check is None:
+				source_slide = source_slides[slide_index - 1]
+				# one set of shape proxies serves the hash check and the image copy
+				source_shapes = list(source_slide.shapes)
+				computed_hash, _, _ = pptx_hash.compute_slide_hash_from_slide(
+					source_slide,
+					shapes=source_shapes,
+				)
+				slide_check = (
+					computed_hash,
+					collect_source_images(source_slide, source_shapes),
+				)
+				slide_checks[slide_index] = slide_check
+			computed_hash, image_blobs = slide_check
+			row_hash = row.get("slide_hash", "")
+			if not row_hash:
+				raise ValueError(f"Row {row_index}: slide_hash is missing.")
+			if row_hash != computed_hash:
+				raise ValueError(
+					f"Row {row_index}: slide_hash mismatch for {source_pptx} slide {slide_index}."
+				)
+			layout_type = row.get("layout_type", "")
+			if not layout_type:
+				raise ValueError(f"Row {row_index}: layout_type is missing.")
+			layout_key = (row.get("master_name", ""), layout_type)
+			layout = layout_choices.get(layout_key)
+			if layout is None:
+				layout = select_layout(
+					presentation,
+					layout_map,
+					layout_key[0],
+					layout_type,
+				)
+				layout_choices[layout_key] = layout
+			slide = presentation.slides.add_slide(layout)
+			set_title(slide, row.get("title_text", ""))
+			set_body_text(slide, row.get("body_text", ""))
+			set_notes_text(slide, row.get("notes_text", ""))
+			insert_images(slide, image_blobs)
+			if last_source_rows[source_path] == row_index:
+				# pictures were copied into the output deck, so the source is done
+				del source_states[source_path]
+		if write_odp:
+			# a subdirectory keeps the staged deck apart from converted sources
+			staging_dir = os.path.join(work_dir, "output")
+			os.makedirs(staging_dir)
+			temp_pptx = os.path.join(staging_dir, "merged.pptx")
 			presentation.save(temp_pptx)
 			soffice_tools.convert_pptx_to_odp(temp_pptx, output_path)
-	else:
-		presentation.save(output_path)
-	for temp_dir in temp_dirs:
-		temp_dir.cleanup()
+		else:
+			presentation.save(output_path)
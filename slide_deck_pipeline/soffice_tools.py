@@ -1,10 +1,16 @@
 # Standard Library
 import os
+import atexit
 import shutil
+import hashlib
+import pathlib
+import tempfile
 import subprocess
 
 
 LIBREOFFICE_APP_PATH = "/Applications/LibreOffice.app/Contents/MacOS/soffice"
+# LibreOffice profile directory per process id, created on first use.
+SOFFICE_PROFILE_DIRS: dict[int, str] = {}
 
 
 #============================================
@@ -35,29 +41,92 @@ def require_soffice() -> str:
 
 
 #============================================
-def convert_odp_to_pptx(odp_path: str, work_dir: str) -> str:
+def get_cache_root() -> str:
 	"""
-	Convert an ODP file to PPTX using soffice.
+	Return the per-user cache root for this pipeline.
+
+	Returns:
+		str: Cache root path (may not exist yet).
+	"""
+	cache_root = os.environ.get("XDG_CACHE_HOME")
+	if not cache_root:
+		cache_root = os.path.join(os.path.expanduser("~"), ".cache")
+	return os.path.join(cache_root, "slide_deck_pipeline")
+
+
+#============================================
+def get_soffice_profile_dir() -> str:
+	"""
+	Return this process's LibreOffice profile directory.
+
+	Each process gets its own profile, created on first use and removed at
+	exit. Concurrent pipeline runs never contend for one profile's lock,
+	and a damaged profile does not outlive the process that used it.
+
+	Returns:
+		str: Profile directory path.
+	"""
+	pid = os.getpid()
+	profile_dir = SOFFICE_PROFILE_DIRS.get(pid)
+	if profile_dir is None:
+		profile_dir = tempfile.mkdtemp(prefix=f"soffice_profile_{pid}_")
+		atexit.register(shutil.rmtree, profile_dir, True)
+		SOFFICE_PROFILE_DIRS[pid] = profile_dir
+	return profile_dir
+
+
+#============================================
+def build_soffice_command(
+	target_format: str,
+	output_dir: str,
+	*input_paths: str,
+) -> list[str]:
+	"""
+	Build a headless soffice conversion command.
+
+	The command uses the process's own LibreOffice profile from
+	get_soffice_profile_dir(). A profile is only initialized on its first
+	start, so later conversions in the same process skip that setup, unlike
+	--safe-mode, which starts from a fresh profile every time. It also keeps
+	conversions working while the desktop LibreOffice is open.
 
 	Args:
-		odp_path: Path to the ODP file.
-		work_dir: Output directory for the converted PPTX.
+		target_format: soffice --convert-to format, such as pptx or odp.
+		output_dir: Output directory for the converted files.
+		input_paths: Files to convert; one soffice run converts them all.
 
 	Returns:
-		str: Path to the converted PPTX file.
+		list[str]: Command arguments.
 	"""
 	soffice_bin = require_soffice()
+	profile_url = pathlib.Path(os.path.abspath(get_soffice_profile_dir())).as_uri()
 	command = [
 		soffice_bin,
+		f"-env:UserInstallation={profile_url}",
 		"--headless",
 		"--norestore",
-		"--safe-mode",
 		"--convert-to",
-		"pptx",
+		target_format,
 		"--outdir",
-		work_dir,
-		odp_path,
+		output_dir,
 	]
+	command.extend(input_paths)
+	return command
+
+
+#============================================
+def convert_odp_to_pptx(odp_path: str, work_dir: str) -> str:
+	"""
+	Convert an ODP file to PPTX using soffice.
+
+	Args:
+		odp_path: Path to the ODP file.
+		work_dir: Output directory for the converted PPTX.
+
+	Returns:
+		str: Path to the converted PPTX file.
+	"""
+	command = build_soffice_command("pptx", work_dir, odp_path)
 	result = subprocess.run(command, capture_output=True, text=True, cwd=work_dir)
 	if result.returncode != 0:
 		message = result.stderr.strip() or result.stdout.strip()
@@ -69,6 +138,184 @@ def convert_odp_to_pptx(odp_path: str, work_dir: str) -> str:
 	return pptx_path
 
 
+#============================================
+def convert_odps_to_pptx(odp_paths: list[str], work_dir: str) -> dict[str, str]:
+	"""
+	Convert several ODP files to PPTX with a single soffice run.
+
+	Args:
+		odp_paths: ODP paths with distinct base names.
+		work_dir: Output directory for the converted PPTX files.
+
+	Returns:
+		dict[str, str]: Converted PPTX path for each ODP path.
+	"""
+	command = build_soffice_command("pptx", work_dir, *odp_paths)
+	result = subprocess.run(command, capture_output=True, text=True, cwd=work_dir)
+	if result.returncode != 0:
+		message = result.stderr.strip() or result.stdout.strip()
+		raise RuntimeError(f"ODP conversion failed: {message}")
+	converted = {}
+	for odp_path in odp_paths:
+		base_name = os.path.splitext(os.path.basename(odp_path))[0]
+		pptx_path = os.path.join(work_dir, f"{base_name}.pptx")
+		if not os.path.exists(pptx_path):
+			raise FileNotFoundError(f"Converted PPTX not found: {pptx_path}")
+		converted[odp_path] = pptx_path
+	return converted
+
+
+#============================================
+def get_conversion_cache_dir() -> str:
+	"""
+	Return the directory used to cache ODP to PPTX conversions.
+
+	Returns:
+		str: Cache directory path (may not exist yet).
+	"""
+	cache_dir = os.path.join(get_cache_root(), "odp_to_pptx")
+	return cache_dir
+
+
+#============================================
+def hash_file(path: str) -> str:
+	"""
+	Return the SHA-256 hex digest of a file's contents.
+
+	Args:
+		path: File path.
+
+	Returns:
+		str: Hex digest.
+	"""
+	with open(path, "rb") as handle:
+		digest = hashlib.file_digest(handle, "sha256").hexdigest()
+	return digest
+
+
+#============================================
+def get_cached_pptx_path(odp_path: str) -> str:
+	"""
+	Return the cache path for an ODP file's converted PPTX.
+
+	Args:
+		odp_path: Path to the ODP file.
+
+	Returns:
+		str: Cache path keyed by ODP content hash (may not exist yet).
+	"""
+	return os.path.join(get_conversion_cache_dir(), f"{hash_file(odp_path)}.pptx")
+
+
+#============================================
+def copy_cached_pptx(cache_path: str, odp_path: str, work_dir: str) -> str:
+	"""
+	Copy a cached PPTX into the work directory under the ODP base name.
+
+	Args:
+		cache_path: Cached PPTX path.
+		odp_path: Path to the ODP file.
+		work_dir: Output directory for the PPTX.
+
+	Returns:
+		str: Copied PPTX path.
+	"""
+	base_name = os.path.splitext(os.path.basename(odp_path))[0]
+	pptx_path = os.path.join(work_dir, f"{base_name}.pptx")
+	shutil.copyfile(cache_path, pptx_path)
+	return pptx_path
+
+
+#============================================
+def store_cached_pptx(pptx_path: str, cache_path: str) -> None:
+	"""
+	Store a converted PPTX in the conversion cache.
+
+	Args:
+		pptx_path: Converted PPTX path.
+		cache_path: Cache path from get_cached_pptx_path().
+	"""
+	# write under a temporary name, then rename so readers never see a partial file
+	temp_path = f"{cache_path}.{os.getpid()}.tmp"
+	try:
+		os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+		shutil.copyfile(pptx_path, temp_path)
+	except OSError as exc:
+		print(f"Warning: could not cache converted PPTX: {exc}")
+		return
+	os.replace(temp_path, cache_path)
+
+
+#============================================
+def convert_odp_to_pptx_cached(odp_path: str, work_dir: str) -> str:
+	"""
+	Convert an ODP file to PPTX, reusing earlier conversions of the same bytes.
+
+	Conversions are cached by ODP content hash, so reruns on an unchanged
+	deck copy the cached PPTX instead of starting soffice.
+
+	Args:
+		odp_path: Path to the ODP file.
+		work_dir: Output directory for the converted PPTX.
+
+	Returns:
+		str: Path to the converted PPTX file.
+	"""
+	cache_path = get_cached_pptx_path(odp_path)
+	if os.path.exists(cache_path):
+		return copy_cached_pptx(cache_path, odp_path, work_dir)
+	pptx_path = convert_odp_to_pptx(odp_path, work_dir)
+	store_cached_pptx(pptx_path, cache_path)
+	return pptx_path
+
+
+#============================================
+def convert_odps_to_pptx_cached(odp_paths: list[str], work_dir: str) -> dict[str, str]:
+	"""
+	Convert several ODP files to PPTX, starting soffice at most once.
+
+	Cached conversions are copied as in convert_odp_to_pptx_cached(). The
+	rest go to one soffice run, since a run with many inputs pays the
+	LibreOffice startup once and parallel runs cannot share the process's
+	profile. soffice names outputs by input base name, so ODP files whose
+	base name repeats an earlier one go to a further batch in a
+	subdirectory, one soffice run per level of repetition.
+
+	Args:
+		odp_paths: Paths to the ODP files.
+		work_dir: Output directory for the converted PPTX files.
+
+	Returns:
+		dict[str, str]: Converted PPTX path for each ODP path.
+	"""
+	converted = {}
+	# cache path per ODP waiting for the batch soffice run
+	pending = {}
+	pending_names = set()
+	repeated_names = []
+	for odp_path in dict.fromkeys(odp_paths):
+		cache_path = get_cached_pptx_path(odp_path)
+		if os.path.exists(cache_path):
+			converted[odp_path] = copy_cached_pptx(cache_path, odp_path, work_dir)
+			continue
+		base_name = os.path.splitext(os.path.basename(odp_path))[0]
+		if base_name in pending_names:
+			repeated_names.append(odp_path)
+			continue
+		pending_names.add(base_name)
+		pending[odp_path] = cache_path
+	if pending:
+		batch = convert_odps_to_pptx(list(pending), work_dir)
+		for odp_path, pptx_path in batch.items():
+			store_cached_pptx(pptx_path, pending[odp_path])
+		converted.update(batch)
+	if repeated_names:
+		repeated_dir = os.path.join(work_dir, "repeated")
+		os.makedirs(repeated_dir, exist_ok=True)
+		converted.update(convert_odps_to_pptx_cached(repeated_names, repeated_dir))
+	return converted
+
+
 #============================================
 def convert_pptx_to_odp(pptx_path: str, output_path: str) -> None:
 	"""
@@ -78,19 +325,8 @@ def convert_pptx_to_odp(pptx_path: str, output_path: str) -> None:
 		pptx_path: Path to PPTX file.
 		output_path: Desired ODP output path.
 	"""
-	soffice_bin = require_soffice()
 	output_dir = os.path.dirname(output_path) or "."
-	command = [
-		soffice_bin,
-		"--headless",
-		"--norestore",
-		"--safe-mode",
-		"--convert-to",
-		"odp",
-		"--outdir",
-		output_dir,
-		pptx_path,
-	]
+	command = build_soffice_command("odp", output_dir, pptx_path)
 	result = subprocess.run(command, capture_output=True, text=True, cwd=output_dir)
 	if result.returncode != 0:
 		message = result.stderr.strip() or result.stdout.strip()
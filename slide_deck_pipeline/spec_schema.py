@@ -1,5 +1,6 @@
 # Standard Library
 import os
+import functools
 
 # PIP3 modules
 import yaml
@@ -51,6 +52,8 @@ def normalize_name(value: str) -> str:
 
 
 #============================================
+# specs and templates repeat a handful of layout names across every slide
+@functools.lru_cache(maxsize=128)
 def normalize_layout_type(value: str, allow_unknown: bool = False) -> str:
 	"""
 	Normalize a layout_type value to a canonical name.
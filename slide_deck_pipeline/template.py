@@ -1,5 +1,6 @@
 # Standard Library
 import os
+import functools
 
 # PIP3 modules
 import pptx
@@ -9,6 +10,8 @@ import slide_deck_pipeline.spec_schema as spec_schema
 
 
 #============================================
+# every deck built from a template repeats the same few layout names
+@functools.lru_cache(maxsize=256)
 def normalize_layout_name(name: str) -> str:
 	"""
 	Normalize a layout name for matching to layout_type.
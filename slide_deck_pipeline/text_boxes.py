@@ -1,15 +1,21 @@
 # Standard Library
-import hashlib
 import re
+import sys
+import hashlib
 
 # PIP3 modules
 import pptx
 import pptx.enum.shapes
 
 # local repo modules
+import slide_deck_pipeline.csv_schema as csv_schema
+import slide_deck_pipeline.layout_classifier as layout_classifier
 import slide_deck_pipeline.pptx_text as pptx_text
 
 
+PLACEHOLDERS = pptx.enum.shapes.PP_PLACEHOLDER
+
+
 #============================================
 def is_body_placeholder(placeholder_type) -> bool:
 	"""
@@ -21,13 +27,7 @@ def is_body_placeholder(placeholder_type) -> bool:
 	Returns:
 		bool: True if treated as body content.
 	"""
-	placeholders = pptx.enum.shapes.PP_PLACEHOLDER
-	body_types = [placeholders.BODY]
-	for attr_name in ("OBJECT", "CONTENT", "TEXT"):
-		candidate = getattr(placeholders, attr_name, None)
-		if candidate is not None:
-			body_types.append(candidate)
-	return placeholder_type in tuple(body_types)
+	return placeholder_type in layout_classifier.BODY_PLACEHOLDER_TYPES
 
 
 #============================================
@@ -85,6 +85,42 @@ def extract_text_block(shape) -> str:
 	return "\n".join(lines)
 
 
+#============================================
+def extract_text_and_hash(shape) -> tuple[str, str]:
+	"""
+	Extract a shape's text block and its text hash in one paragraph pass.
+
+	Each paragraph line is normalized while it is extracted, so the text
+	is not split and normalized again for hashing.
+
+	Args:
+		shape: Shape instance.
+
+	Returns:
+		tuple[str, str]: Text block with tab indentation and its text hash.
+	"""
+	if not getattr(shape, "has_text_frame", False):
+		return ("", csv_schema.hash_normalized_text(""))
+	lines = []
+	normalized_lines = []
+	needs_full_normalize = False
+	for level, text in pptx_text.paragraph_levels_and_text(shape.text_frame):
+		text = text.strip()
+		if not text:
+			continue
+		indent = "\t" * level
+		lines.append(f"{indent}{text}")
+		# embedded line feeds start new lines under normalize_text
+		if "\n" in text or "\r" in text:
+			needs_full_normalize = True
+		normalized_lines.append(indent + " ".join(text.split()))
+	text_block = "\n".join(lines)
+	if needs_full_normalize:
+		return (text_block, csv_schema.compute_text_hash(text_block))
+	text_hash = csv_schema.hash_normalized_text("\n".join(normalized_lines))
+	return (text_block, text_hash)
+
+
 #============================================
 def ensure_unique_id(box_id: str, used: set[str]) -> str:
 	"""
@@ -97,38 +133,38 @@ def ensure_unique_id(box_id: str, used: set[str]) -> str:
 	Returns:
 		str: Unique box id.
 	"""
+	# interned ids match interned patch box ids by identity in dict lookups
 	if box_id not in used:
+		box_id = sys.intern(box_id)
 		used.add(box_id)
 		return box_id
 	counter = 2
 	while True:
 		candidate = f"{box_id}_{counter}"
 		if candidate not in used:
+			candidate = sys.intern(candidate)
 			used.add(candidate)
 			return candidate
 		counter += 1
 
 
 #============================================
-def collect_text_boxes(
+def iter_placeholder_boxes(
 	slide: pptx.slide.Slide,
 	include_subtitle: bool,
 	include_footer: bool,
-	include_fallback: bool = True,
-) -> tuple[list[dict[str, object]], bool]:
+):
 	"""
-	Collect text boxes for export or update.
+	Yield placeholder text box records in slide shape order.
 
 	Args:
 		slide: Slide instance.
 		include_subtitle: Include subtitle placeholders.
 		include_footer: Include footer placeholders.
-		include_fallback: Include non-placeholder shapes if needed.
 
-	Returns:
-		tuple[list[dict[str, object]], bool]: Box records and fallback flag.
+	Yields:
+		dict[str, object]: Box record.
 	"""
-	boxes = []
 	used_ids: set[str] = set()
 	body_count = 0
 	for shape in slide.shapes:
@@ -138,34 +174,52 @@ def collect_text_boxes(
 			continue
 		placeholder_type = shape.placeholder_format.type
 		box_id = ""
-		if placeholder_type in (
-			pptx.enum.shapes.PP_PLACEHOLDER.TITLE,
-			pptx.enum.shapes.PP_PLACEHOLDER.CENTER_TITLE,
-		):
+		if placeholder_type in layout_classifier.TITLE_PLACEHOLDER_TYPES:
 			box_id = "title"
-		elif placeholder_type == pptx.enum.shapes.PP_PLACEHOLDER.SUBTITLE:
+		elif placeholder_type == PLACEHOLDERS.SUBTITLE:
 			if include_subtitle:
 				box_id = "subtitle"
 		elif is_body_placeholder(placeholder_type):
 			body_count += 1
 			box_id = f"body_{body_count}"
-		elif placeholder_type == pptx.enum.shapes.PP_PLACEHOLDER.FOOTER:
+		elif placeholder_type == PLACEHOLDERS.FOOTER:
 			if include_footer:
 				box_id = "footer"
 		if not box_id:
 			continue
 		box_id = ensure_unique_id(box_id, used_ids)
-		boxes.append(
-			{
-				"box_id": box_id,
-				"shape": shape,
-				"shape_name": getattr(shape, "name", ""),
-				"placeholder_type": placeholder_type_name(placeholder_type),
-			}
-		)
+		yield {
+			"box_id": box_id,
+			"shape": shape,
+			"shape_name": getattr(shape, "name", ""),
+			"placeholder_type": placeholder_type_name(placeholder_type),
+		}
+
+
+#============================================
+def collect_text_boxes(
+	slide: pptx.slide.Slide,
+	include_subtitle: bool,
+	include_footer: bool,
+	include_fallback: bool = True,
+) -> tuple[list[dict[str, object]], bool]:
+	"""
+	Collect text boxes for export or update.
+
+	Args:
+		slide: Slide instance.
+		include_subtitle: Include subtitle placeholders.
+		include_footer: Include footer placeholders.
+		include_fallback: Include non-placeholder shapes if needed.
+
+	Returns:
+		tuple[list[dict[str, object]], bool]: Box records and fallback flag.
+	"""
+	boxes = list(iter_placeholder_boxes(slide, include_subtitle, include_footer))
 	if boxes or not include_fallback:
 		return (boxes, False)
 	fallback_boxes = []
+	used_ids: set[str] = set()
 	fallback_index = 0
 	for shape in slide.shapes:
 		if not getattr(shape, "has_text_frame", False):
@@ -190,3 +244,39 @@ def collect_text_boxes(
 			}
 		)
 	return (fallback_boxes, True)
+
+
+#============================================
+def find_box(
+	slide: pptx.slide.Slide,
+	box_id: str,
+	include_subtitle: bool,
+	include_footer: bool,
+) -> dict[str, object] | None:
+	"""
+	Find one text box by id, stopping at the first matching placeholder.
+
+	Box ids match collect_text_boxes. Fallback shapes are only scanned when
+	the slide has no matching placeholder boxes at all.
+
+	Args:
+		slide: Slide instance.
+		box_id: Box id to find.
+		include_subtitle: Include subtitle placeholders.
+		include_footer: Include footer placeholders.
+
+	Returns:
+		dict[str, object] | None: Box record, or None when not found.
+	"""
+	has_placeholders = False
+	for box in iter_placeholder_boxes(slide, include_subtitle, include_footer):
+		if box["box_id"] == box_id:
+			return box
+		has_placeholders = True
+	if has_placeholders:
+		return None
+	boxes, _ = collect_text_boxes(slide, include_subtitle, include_footer)
+	for box in boxes:
+		if box["box_id"] == box_id:
+			return box
+	return None
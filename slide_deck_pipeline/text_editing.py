@@ -1,6 +1,8 @@
 # Standard Library
 import os
+import sys
 import tempfile
+import collections.abc
 
 # PIP3 modules
 import pptx
@@ -18,6 +20,42 @@ import slide_deck_pipeline.text_normalization as text_normalization
 
 
 MAX_BULLET_DEPTH = 4
+BULLET_INDENTS = tuple("\t" * depth for depth in range(MAX_BULLET_DEPTH))
+SKIP_EDIT_STATUSES = frozenset(("locked", "skip", "frozen"))
+# Patches editing this many boxes or fewer scan for each box instead of
+# mapping every text box on the slide.
+FIND_BOX_LIMIT = 4
+# YAML strings shorter than this (keys, box ids, hashes) are interned.
+INTERN_MAX_LENGTH = 64
+
+
+#============================================
+class PatchLoader(yaml.CSafeLoader):
+	"""
+	libyaml safe loader that interns short strings.
+
+	Patch files repeat the same keys, box ids, and statuses thousands of
+	times, so sharing one string object per value saves memory and lets
+	dict lookups match on identity.
+	"""
+
+	def construct_yaml_str(self, node) -> str:
+		"""
+		Construct a string scalar, interning it when short.
+
+		Args:
+			node: Scalar node.
+
+		Returns:
+			str: String value.
+		"""
+		value = super().construct_yaml_str(node)
+		if len(value) < INTERN_MAX_LENGTH:
+			value = sys.intern(value)
+		return value
+
+
+PatchLoader.add_constructor("tag:yaml.org,2002:str", PatchLoader.construct_yaml_str)
 
 
 #============================================
@@ -56,18 +94,27 @@ def render_bullets(items, level: int = 0) -> list[str]:
 	if level >= MAX_BULLET_DEPTH:
 		raise ValueError("Bullet nesting depth exceeds the maximum.")
 	if isinstance(items, str):
-		lines.append("\t" * level + items)
+		lines.append(BULLET_INDENTS[level] + items)
 		return lines
 	if not isinstance(items, list):
 		raise ValueError("Bullets must be a list or string.")
-	for item in items:
-		if isinstance(item, str):
-			lines.append("\t" * level + item)
-			continue
-		if isinstance(item, list):
-			lines.extend(render_bullets(item, level + 1))
-			continue
-		raise ValueError("Bullets must contain strings or lists only.")
+	# depth-first walk with an explicit stack of (item iterator, level)
+	stack = [(iter(items), level)]
+	while stack:
+		item_iter, item_level = stack[-1]
+		for item in item_iter:
+			if isinstance(item, str):
+				lines.append(BULLET_INDENTS[item_level] + item)
+				continue
+			if isinstance(item, list):
+				if item_level + 1 >= MAX_BULLET_DEPTH:
+					raise ValueError("Bullet nesting depth exceeds the maximum.")
+				# descend; this iterator resumes after the nested list is done
+				stack.append((iter(item), item_level + 1))
+				break
+			raise ValueError("Bullets must contain strings or lists only.")
+		else:
+			stack.pop()
 	return lines
 
 
@@ -101,10 +148,12 @@ def should_skip_box(box: dict[str, object]) -> bool:
 	"""
 	if box.get("locked"):
 		return True
-	ed_status = str(box.get("edit_status", "")).strip().lower()
-	if ed_status in ("locked", "skip", "frozen"):
-		return True
-	return False
+	ed_status = box.get("edit_status")
+	# most boxes carry no edit_status at all
+	if ed_status is None:
+		return False
+	is_skipped = str(ed_status).strip().lower() in SKIP_EDIT_STATUSES
+	return is_skipped
 
 
 #============================================
@@ -123,13 +172,210 @@ def set_shape_text(shape, text_value: str) -> None:
 	lines = parse_text_lines(text_value)
 	if not lines:
 		return
+	# write a:p elements directly instead of creating paragraph proxies;
+	# clear() leaves one empty paragraph that keeps its a:pPr
+	tx_body = text_frame._txBody
 	for index, (level, text) in enumerate(lines):
 		if index == 0:
-			paragraph = text_frame.paragraphs[0]
+			paragraph_element = tx_body.p_lst[0]
 		else:
-			paragraph = text_frame.add_paragraph()
-		paragraph.text = text
-		paragraph.level = level
+			paragraph_element = tx_body.add_p()
+		paragraph_element.append_text(text)
+		paragraph_element.get_or_add_pPr().lvl = level
+
+
+#============================================
+def compose_event_node(
+	loader: yaml.CSafeLoader,
+	anchors: dict[str, yaml.Node],
+) -> yaml.Node:
+	"""
+	Compose one YAML node from the loader event stream.
+
+	The C loader does not expose compose_node(), so this mirrors the
+	PyYAML composer for the scalar, sequence, and mapping events.
+
+	Args:
+		loader: Loader positioned at the start of a node.
+		anchors: Anchor name to node map for alias lookups.
+
+	Returns:
+		yaml.Node: Composed node.
+	"""
+	event = loader.get_event()
+	if isinstance(event, yaml.AliasEvent):
+		if event.anchor not in anchors:
+			raise ValueError(f"Patch file uses undefined alias: {event.anchor}")
+		return anchors[event.anchor]
+	tag = event.tag
+	if isinstance(event, yaml.ScalarEvent):
+		if tag is None or tag == "!":
+			tag = loader.resolve(yaml.ScalarNode, event.value, event.implicit)
+		node = yaml.ScalarNode(
+			tag,
+			event.value,
+			event.start_mark,
+			event.end_mark,
+			style=event.style,
+		)
+	elif isinstance(event, yaml.SequenceStartEvent):
+		if tag is None or tag == "!":
+			tag = loader.resolve(yaml.SequenceNode, None, event.implicit)
+		node = yaml.SequenceNode(
+			tag,
+			[],
+			event.start_mark,
+			None,
+			flow_style=event.flow_style,
+		)
+		while not loader.check_event(yaml.SequenceEndEvent):
+			node.value.append(compose_event_node(loader, anchors))
+		node.end_mark = loader.get_event().end_mark
+	elif isinstance(event, yaml.MappingStartEvent):
+		if tag is None or tag == "!":
+			tag = loader.resolve(yaml.MappingNode, None, event.implicit)
+		node = yaml.MappingNode(
+			tag,
+			[],
+			event.start_mark,
+			None,
+			flow_style=event.flow_style,
+		)
+		while not loader.check_event(yaml.MappingEndEvent):
+			key_node = compose_event_node(loader, anchors)
+			value_node = compose_event_node(loader, anchors)
+			node.value.append((key_node, value_node))
+		node.end_mark = loader.get_event().end_mark
+	else:
+		raise ValueError(f"Unexpected YAML event in patch file: {event}")
+	if event.anchor is not None:
+		anchors[event.anchor] = node
+	return node
+
+
+#============================================
+def iter_sequence_items(
+	loader: yaml.CSafeLoader,
+	anchors: dict[str, yaml.Node],
+):
+	"""
+	Yield constructed items from a YAML sequence one at a time.
+
+	Args:
+		loader: Loader positioned after a sequence start event.
+		anchors: Anchor name to node map for alias lookups.
+
+	Yields:
+		Constructed Python objects for each sequence item.
+	"""
+	while not loader.check_event(yaml.SequenceEndEvent):
+		node = compose_event_node(loader, anchors)
+		yield loader.construct_document(node)
+	loader.get_event()
+
+
+#============================================
+def finish_patch_document(
+	loader: yaml.CSafeLoader,
+	anchors: dict[str, yaml.Node],
+	header: dict[str, object],
+) -> None:
+	"""
+	Read the header keys after the patches list and check the file ends.
+
+	Args:
+		loader: Loader positioned after the patches list.
+		anchors: Anchor name to node map for alias lookups.
+		header: Header keys read so far (updated in-place).
+	"""
+	while not loader.check_event(yaml.MappingEndEvent):
+		key = loader.construct_document(compose_event_node(loader, anchors))
+		if key == "patches":
+			raise ValueError("Patch file must contain one patches list.")
+		value_node = compose_event_node(loader, anchors)
+		header[key] = loader.construct_document(value_node)
+	# skip the mapping and document end events
+	loader.get_event()
+	loader.get_event()
+	if not loader.check_event(yaml.StreamEndEvent):
+		raise ValueError("Patch file must contain a single YAML document.")
+
+
+#============================================
+def stream_patches(
+	loader: yaml.CSafeLoader,
+	anchors: dict[str, yaml.Node],
+	header: dict[str, object],
+):
+	"""
+	Yield patches, then read the rest of the file and dispose the loader.
+
+	Args:
+		loader: Loader positioned after the patches sequence start event.
+		anchors: Anchor name to node map for alias lookups.
+		header: Header keys read so far (updated in-place).
+
+	Yields:
+		Constructed patch items.
+	"""
+	try:
+		yield from iter_sequence_items(loader, anchors)
+		finish_patch_document(loader, anchors, header)
+	finally:
+		loader.dispose()
+
+
+#============================================
+def load_patch_stream(handle) -> tuple[dict[str, object], collections.abc.Iterable]:
+	"""
+	Read patch header keys and return the patches list lazily.
+
+	Header keys (version, source_pptx) are constructed up front. When both
+	appear before the patches key, as written by export_slide_text, the
+	patches are yielded one at a time while the handle stays open, and the
+	rest of the file is still parsed after the last one; otherwise the
+	patches list is read fully so later header keys are not missed.
+
+	Args:
+		handle: Open patch file handle.
+
+	Returns:
+		tuple[dict[str, object], collections.abc.Iterable]: Header and patches.
+	"""
+	# libyaml-backed safe loader, much faster than the pure-Python parser
+	loader = PatchLoader(handle)
+	anchors: dict[str, yaml.Node] = {}
+	streaming = False
+	try:
+		# skip the stream and document start events
+		loader.get_event()
+		if loader.check_event(yaml.StreamEndEvent):
+			raise ValueError("Patch file must be a YAML mapping.")
+		loader.get_event()
+		if not loader.check_event(yaml.MappingStartEvent):
+			raise ValueError("Patch file must be a YAML mapping.")
+		loader.get_event()
+		header: dict[str, object] = {}
+		patches = []
+		while not loader.check_event(yaml.MappingEndEvent):
+			key = loader.construct_document(compose_event_node(loader, anchors))
+			if key != "patches":
+				value_node = compose_event_node(loader, anchors)
+				header[key] = loader.construct_document(value_node)
+				continue
+			if not loader.check_event(yaml.SequenceStartEvent):
+				raise ValueError("Patch file must contain a patches list.")
+			loader.get_event()
+			if "version" in header and "source_pptx" in header:
+				streaming = True
+				return (header, stream_patches(loader, anchors, header))
+			patches = list(iter_sequence_items(loader, anchors))
+		finish_patch_document(loader, anchors, header)
+		return (header, patches)
+	finally:
+		# the patch stream disposes the loader once it is read
+		if not streaming:
+			loader.dispose()
 
 
 #============================================
@@ -141,6 +387,7 @@ def apply_text_edits(
 	include_subtitle: bool,
 	include_footer: bool,
 	inplace: bool,
+	jobs: int = 1,
 ) -> None:
 	"""
 	Apply text edits to a deck.
@@ -153,125 +400,257 @@ def apply_text_edits(
 		include_subtitle: Include subtitle placeholders in matching.
 		include_footer: Include footer placeholders in matching.
 		inplace: Allow writing to the input path.
+		jobs: Worker processes for slide hashing.
 	"""
+	# keep the patch file open so patches stream into apply_and_save
 	with open(patch_path, "r", encoding="utf-8") as handle:
-		payload = yaml.safe_load(handle)
-	if not isinstance(payload, dict):
-		raise ValueError("Patch file must be a YAML mapping.")
-	version = payload.get("version")
-	if str(version).isdigit():
-		version_value = int(version)
+		header, patches = load_patch_stream(handle)
+		version = header.get("version")
+		if str(version).isdigit():
+			version_value = int(version)
+		else:
+			raise ValueError("Unsupported patch version.")
+		if version_value != 1:
+			raise ValueError("Unsupported patch version.")
+		source_name = str(header.get("source_pptx", "")).strip()
+		if not input_path:
+			if not source_name:
+				raise ValueError("Patch file missing source_pptx; pass --input.")
+			patch_dir = os.path.dirname(os.path.abspath(patch_path))
+			resolved_path, warnings = path_resolver.resolve_path(
+				source_name,
+				input_dir=patch_dir,
+				strict=False,
+			)
+			for warning in warnings:
+				print(f"WARN: {warning}")
+			input_path = resolved_path
+		input_base = os.path.basename(input_path)
+		if source_name and source_name != input_base:
+			print("WARN: patch source_pptx does not match input file basename.")
+		if not inplace:
+			input_abs = os.path.abspath(input_path)
+			output_abs = os.path.abspath(output_path)
+			if input_abs == output_abs:
+				raise ValueError("Output path matches input; use --inplace to override.")
+
+		needs_conversion = input_path.lower().endswith(".odp")
+		if needs_conversion:
+			with tempfile.TemporaryDirectory() as temp_dir:
+				pptx_path, _ = pptx_io.resolve_input_pptx(input_path, temp_dir)
+				apply_and_save(
+					pptx_path,
+					patches,
+					output_path,
+					force,
+					include_subtitle,
+					include_footer,
+					jobs,
+				)
+			return
+		pptx_path, _ = pptx_io.resolve_input_pptx(input_path, None)
+		apply_and_save(
+			pptx_path,
+			patches,
+			output_path,
+			force,
+			include_subtitle,
+			include_footer,
+			jobs,
+		)
+
+
+#============================================
+def cached_text_hash(text: str, text_hashes: dict[str, str]) -> str:
+	"""
+	Return the text hash, reusing earlier results for identical text.
+
+	Args:
+		text: Text to hash.
+		text_hashes: Text to hash cache, updated in place.
+
+	Returns:
+		str: Text hash.
+	"""
+	text_hash = text_hashes.get(text)
+	if text_hash is None:
+		text_hash = csv_schema.compute_text_hash(text)
+		text_hashes[text] = text_hash
+	return text_hash
+
+
+#============================================
+def resolve_slide_number(slide_index, slide_count: int) -> int:
+	"""
+	Validate a patch source_slide_index against the deck size.
+
+	Args:
+		slide_index: Value from the patch, usually an int from YAML.
+		slide_count: Number of slides in the deck.
+
+	Returns:
+		int: 1-based slide number, or 0 when missing or out of range.
+	"""
+	# YAML gives plain ints for unquoted indexes, so skip the string check
+	if type(slide_index) is int:
+		slide_number = slide_index
+	elif slide_index is None or not str(slide_index).isdigit():
+		return 0
 	else:
-		raise ValueError("Unsupported patch version.")
-	if version_value != 1:
-		raise ValueError("Unsupported patch version.")
-	patches = payload.get("patches", [])
-	if not isinstance(patches, list):
-		raise ValueError("Patch file must contain a patches list.")
-	source_name = str(payload.get("source_pptx", "")).strip()
-	if not input_path:
-		if not source_name:
-			raise ValueError("Patch file missing source_pptx; pass --input.")
-		patch_dir = os.path.dirname(os.path.abspath(patch_path))
-		resolved_path, warnings = path_resolver.resolve_path(
-			source_name,
-			input_dir=patch_dir,
-			strict=False,
+		slide_number = int(str(slide_index))
+	if slide_number < 1 or slide_number > slide_count:
+		return 0
+	return slide_number
+
+
+#============================================
+def build_slide_state(
+	slide: pptx.slide.Slide,
+	include_subtitle: bool,
+	include_footer: bool,
+	slide_hash: str = "",
+) -> dict[str, object]:
+	"""
+	Collect the slide hash, notes text, and box map used to match patches.
+
+	Args:
+		slide: Slide instance.
+		include_subtitle: Include subtitle placeholders in matching.
+		include_footer: Include footer placeholders in matching.
+		slide_hash: Precomputed slide hash, or empty to compute it here.
+
+	Returns:
+		dict[str, object]: Slide state with slide, slide_hash, notes_text,
+			and box_map. box_map is None until a patch needs it, see
+			lookup_box.
+	"""
+	notes_text = pptx_text.extract_notes_text(slide)
+	if not slide_hash:
+		slide_hash, _, _ = pptx_hash.compute_slide_hash_from_slide(
+			slide,
+			notes_text,
 		)
-		for warning in warnings:
-			print(f"WARN: {warning}")
-		input_path = resolved_path
-	input_base = os.path.basename(input_path)
-	if source_name and source_name != input_base:
-		print("WARN: patch source_pptx does not match input file basename.")
-	if not inplace:
-		input_abs = os.path.abspath(input_path)
-		output_abs = os.path.abspath(output_path)
-		if input_abs == output_abs:
-			raise ValueError("Output path matches input; use --inplace to override.")
-
-	needs_conversion = input_path.lower().endswith(".odp")
-	if needs_conversion:
-		with tempfile.TemporaryDirectory() as temp_dir:
-			pptx_path, _ = pptx_io.resolve_input_pptx(input_path, temp_dir)
-			apply_and_save(
-				pptx_path,
-				patches,
-				output_path,
-				force,
-				include_subtitle,
-				include_footer,
-			)
-		return
-	pptx_path, _ = pptx_io.resolve_input_pptx(input_path, None)
-	apply_and_save(
-		pptx_path,
-		patches,
-		output_path,
-		force,
-		include_subtitle,
-		include_footer,
-	)
+	slide_state = {
+		"slide": slide,
+		"slide_hash": slide_hash,
+		"notes_text": notes_text,
+		"box_map": None,
+	}
+	return slide_state
+
+
+#============================================
+def lookup_box(
+	slide: pptx.slide.Slide,
+	slide_state: dict[str, object],
+	box_id: str,
+	box_count: int,
+	include_subtitle: bool,
+	include_footer: bool,
+) -> dict[str, object] | None:
+	"""
+	Look up a text box, building the slide box map only for larger patches.
+
+	Args:
+		slide: Slide instance.
+		slide_state: Slide state from build_slide_state.
+		box_id: Box id to find.
+		box_count: Number of boxes in the current patch.
+		include_subtitle: Include subtitle placeholders in matching.
+		include_footer: Include footer placeholders in matching.
+
+	Returns:
+		dict[str, object] | None: Box record, or None when not found.
+	"""
+	box_map = slide_state["box_map"]
+	if box_map is None and box_count <= FIND_BOX_LIMIT:
+		# a scan that stops at the match beats mapping every shape
+		return text_boxes.find_box(slide, box_id, include_subtitle, include_footer)
+	if box_map is None:
+		boxes, _ = text_boxes.collect_text_boxes(
+			slide,
+			include_subtitle,
+			include_footer,
+			include_fallback=True,
+		)
+		box_map = {box["box_id"]: box for box in boxes}
+		slide_state["box_map"] = box_map
+	return box_map.get(box_id)
 
 
 #============================================
 def apply_and_save(
 	pptx_path: str,
-	patches: list[dict[str, object]],
+	patches: collections.abc.Iterable,
 	output_path: str,
 	force: bool,
 	include_subtitle: bool,
 	include_footer: bool,
+	jobs: int = 1,
 ) -> None:
 	"""
 	Apply edits to a PPTX and save to output.
 
 	Args:
 		pptx_path: Input PPTX path.
-		patches: Patch entries.
+		patches: Patch entries, as a list or a streaming iterator.
 		output_path: Output PPTX or ODP path.
 		force: Apply edits even if text hashes mismatch.
 		include_subtitle: Include subtitle placeholders in matching.
 		include_footer: Include footer placeholders in matching.
+		jobs: Worker processes for slide hashing (1 hashes slides on demand,
+			0 uses one worker per CPU).
 	"""
 	presentation = pptx.Presentation(pptx_path)
+	slide_count = len(presentation.slides)
+	slide_hashes: list[str] = []
+	jobs = pptx_hash.resolve_worker_count(jobs)
+	if jobs > 1:
+		slide_hashes = pptx_hash.compute_deck_slide_hashes(
+			pptx_path,
+			slide_count,
+			jobs,
+		)
 	updated = 0
+	unchanged = 0
 	skipped = 0
 	missing = 0
 	mismatched = 0
 	slide_hash_mismatch = 0
+	slide_cache: dict[int, dict[str, object]] = {}
+	text_hashes: dict[str, str] = {}
 	for patch in patches:
 		if not isinstance(patch, dict):
 			continue
-		slide_index = patch.get("source_slide_index")
-		if slide_index is None:
-			missing += 1
-			continue
-		slide_index_text = str(slide_index)
-		if not slide_index_text.isdigit():
-			missing += 1
-			continue
-		slide_number = int(slide_index_text)
-		if slide_number < 1 or slide_number > len(presentation.slides):
+		slide_number = resolve_slide_number(
+			patch.get("source_slide_index"),
+			slide_count,
+		)
+		if not slide_number:
 			missing += 1
 			continue
-		slide = presentation.slides[slide_number - 1]
-		notes_text = pptx_text.extract_notes_text(slide)
-		current_hash, _, _ = pptx_hash.compute_slide_hash_from_slide(
-			slide,
-			notes_text,
-		)
-		expected_hash = str(patch.get("slide_hash", ""))
-		if not expected_hash or expected_hash != current_hash:
+		# hash and map each slide once, before any patch edits it
+		slide_state = slide_cache.get(slide_number)
+		if slide_state is None:
+			slide = presentation.slides[slide_number - 1]
+			known_hash = ""
+			if slide_hashes:
+				known_hash = slide_hashes[slide_number - 1]
+			slide_state = build_slide_state(
+				slide,
+				include_subtitle,
+				include_footer,
+				known_hash,
+			)
+			slide_cache[slide_number] = slide_state
+		slide = slide_state["slide"]
+		expected_hash = patch.get("slide_hash", "")
+		if not isinstance(expected_hash, str):
+			expected_hash = str(expected_hash)
+		if not expected_hash or expected_hash != slide_state["slide_hash"]:
 			slide_hash_mismatch += 1
 			continue
-		boxes, _ = text_boxes.collect_text_boxes(
-			slide,
-			include_subtitle,
-			include_footer,
-			include_fallback=True,
-		)
-		box_map = {box["box_id"]: box for box in boxes}
+		notes_text = slide_state["notes_text"]
 		boxes_data = patch.get("boxes", [])
 		if not isinstance(boxes_data, list):
 			missing += 1
@@ -282,22 +661,36 @@ def apply_and_save(
 			if should_skip_box(box):
 				skipped += 1
 				continue
-			box_id = str(box.get("box_id", ""))
+			box_id = box.get("box_id", "")
+			if not isinstance(box_id, str):
+				box_id = str(box_id)
 			if not box_id:
 				missing += 1
 				continue
 			if box_id == "notes":
 				new_text = resolve_box_text(box)
 				if not force:
-					current_notes_hash = csv_schema.compute_text_hash(notes_text)
+					current_notes_hash = cached_text_hash(notes_text, text_hashes)
 					expected_notes_hash = str(box.get("text_hash_before", ""))
 					if expected_notes_hash and expected_notes_hash != current_notes_hash:
 						mismatched += 1
 						continue
+				if new_text == notes_text:
+					unchanged += 1
+					continue
 				set_notes_text(slide, new_text)
+				notes_text = pptx_text.extract_notes_text(slide)
+				slide_state["notes_text"] = notes_text
 				updated += 1
 				continue
-			box_meta = box_map.get(box_id)
+			box_meta = lookup_box(
+				slide,
+				slide_state,
+				box_id,
+				len(boxes_data),
+				include_subtitle,
+				include_footer,
+			)
 			if not box_meta:
 				missing += 1
 				continue
@@ -305,11 +698,15 @@ def apply_and_save(
 			current_text = text_boxes.extract_text_block(shape)
 			if not force:
 				expected_hash = str(box.get("text_hash_before", ""))
-				current_hash = csv_schema.compute_text_hash(current_text)
+				current_hash = cached_text_hash(current_text, text_hashes)
 				if expected_hash and expected_hash != current_hash:
 					mismatched += 1
 					continue
 			new_text = resolve_box_text(box)
+			# leave untouched boxes alone so their XML is not rebuilt
+			if new_text == current_text:
+				unchanged += 1
+				continue
 			set_shape_text(shape, new_text)
 			updated += 1
 
@@ -322,6 +719,7 @@ def apply_and_save(
 		presentation.save(output_path)
 
 	print(f"Updated blocks: {updated}")
+	print(f"Unchanged blocks: {unchanged}")
 	print(f"Skipped locked blocks: {skipped}")
 	print(f"Missing targets: {missing}")
 	print(f"Text hash mismatches: {mismatched}")
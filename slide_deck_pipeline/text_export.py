@@ -1,4 +1,6 @@
 # Standard Library
+import os
+import re
 import tempfile
 
 # PIP3 modules
@@ -13,22 +15,40 @@ import slide_deck_pipeline.pptx_text as pptx_text
 import slide_deck_pipeline.text_boxes as text_boxes
 
 
+# Strings matching this pattern can be written as plain YAML scalars when
+# the resolver also reads them back as strings.
+PLAIN_SCALAR_RE = re.compile(r"[A-Za-z0-9_./()][A-Za-z0-9 _./()-]*")
+# Printable ASCII plus tab and newline, the only characters kept unescaped.
+UNESCAPED_TEXT_RE = re.compile(r"[\t\n\x20-\x7e]*")
+YAML_RESOLVER = yaml.resolver.Resolver()
+
 #============================================
-def build_box_record(shape, box_meta: dict[str, object]) -> dict[str, str]:
+def build_box_record(
+	shape,
+	box_meta: dict[str, object],
+	shape_texts: dict | None = None,
+) -> dict[str, str]:
 	"""
 	Build a YAML box record from a shape.
 
 	Args:
 		shape: Shape instance.
 		box_meta: Metadata for the box.
+		shape_texts: (text, text hash) per shape element, collected while
+			hashing the slide; missing shapes are extracted here.
 
 	Returns:
 		dict[str, str]: Box record.
 	"""
-	text_value = text_boxes.extract_text_block(shape)
+	cached = None
+	if shape_texts:
+		cached = shape_texts.get(shape._element)
+	if cached is None:
+		cached = text_boxes.extract_text_and_hash(shape)
+	text_value, text_hash = cached
 	box_record = {
 		"box_id": box_meta["box_id"],
-		"text_hash_before": csv_schema.compute_text_hash(text_value),
+		"text_hash_before": text_hash,
 		"text": text_value,
 	}
 	shape_name = box_meta.get("shape_name", "")
@@ -40,6 +60,194 @@ def build_box_record(shape, box_meta: dict[str, object]) -> dict[str, str]:
 	return box_record
 
 
+#============================================
+def format_yaml_scalar(value) -> str:
+	"""
+	Format a scalar as a single-line YAML value.
+
+	Args:
+		value: String, integer, boolean, or None.
+
+	Returns:
+		str: YAML scalar text.
+	"""
+	if value is None:
+		return "null"
+	if isinstance(value, bool):
+		return "true" if value else "false"
+	if isinstance(value, int):
+		return str(value)
+	text = str(value)
+	is_plain = (
+		PLAIN_SCALAR_RE.fullmatch(text)
+		and not text.endswith(" ")
+		and YAML_RESOLVER.resolve(yaml.ScalarNode, text, (True, False))
+		== "tag:yaml.org,2002:str"
+	)
+	if is_plain:
+		return text
+	if "\n" not in text and UNESCAPED_TEXT_RE.fullmatch(text):
+		quoted = "'" + text.replace("'", "''") + "'"
+		return quoted
+	# double-quoted scalar with escapes keeps the file ASCII-only
+	pieces = ['"']
+	for char in text:
+		code = ord(char)
+		if char == '"' or char == "\\":
+			pieces.append("\\" + char)
+		elif 0x20 <= code < 0x7f:
+			pieces.append(char)
+		elif char == "\t":
+			pieces.append("\\t")
+		elif char == "\n":
+			pieces.append("\\n")
+		elif code < 0x100:
+			pieces.append(f"\\x{code:02x}")
+		elif code < 0x10000:
+			pieces.append(f"\\u{code:04x}")
+		else:
+			pieces.append(f"\\U{code:08x}")
+	pieces.append('"')
+	quoted = "".join(pieces)
+	return quoted
+
+
+#============================================
+def can_use_literal_block(text: str) -> bool:
+	"""
+	Check whether multi-line text can be written as a literal block scalar.
+
+	Args:
+		text: Text value.
+
+	Returns:
+		bool: True if a literal block round-trips the text exactly.
+	"""
+	if "\n" not in text or not UNESCAPED_TEXT_RE.fullmatch(text):
+		return False
+	body = text.rstrip("\n")
+	if not body:
+		return False
+	return True
+
+
+#============================================
+def append_literal_block(parts: list[str], text: str, indent: str) -> None:
+	"""
+	Append a literal block scalar header and its indented lines.
+
+	Args:
+		parts: Output string pieces.
+		text: Multi-line text value.
+		indent: Indentation for the block content lines.
+	"""
+	body = text.rstrip("\n")
+	trailing = len(text) - len(body)
+	header = "|"
+	# indentation is detected from the first non-empty line, so give it
+	# explicitly when that line starts with a tab or space
+	if body.lstrip("\n")[0] in " \t":
+		header += "2"
+	# chomping: strip the final newline, clip to one, or keep them all
+	if trailing == 0:
+		header += "-"
+	elif trailing > 1:
+		header += "+"
+	parts.append(header + "\n")
+	for line in body.split("\n"):
+		if line:
+			parts.append(f"{indent}{line}\n")
+		else:
+			parts.append("\n")
+	if trailing > 1:
+		parts.append("\n" * (trailing - 1))
+
+
+#============================================
+def append_yaml_mapping(
+	parts: list[str],
+	mapping: dict[str, object],
+	indent: str,
+	first_prefix: str,
+) -> None:
+	"""
+	Append block-style YAML lines for a mapping.
+
+	Lists must hold mappings and are written as indentless sequences, the
+	same layout yaml.safe_dump uses with default_flow_style=False.
+
+	Args:
+		parts: Output string pieces.
+		mapping: Mapping to write.
+		indent: Indentation for the mapping keys.
+		first_prefix: Prefix for the first key (for example "- " in a list).
+	"""
+	prefix = first_prefix
+	for key, value in mapping.items():
+		if isinstance(value, list):
+			if not value:
+				parts.append(f"{prefix}{key}: []\n")
+			else:
+				parts.append(f"{prefix}{key}:\n")
+				for item in value:
+					append_yaml_mapping(parts, item, indent + "  ", indent + "- ")
+		elif isinstance(value, str) and can_use_literal_block(value):
+			parts.append(f"{prefix}{key}: ")
+			append_literal_block(parts, value, indent + "  ")
+		else:
+			parts.append(f"{prefix}{key}: {format_yaml_scalar(value)}\n")
+		prefix = indent
+
+
+#============================================
+def emit_patch_yaml(payload: dict[str, object]) -> str:
+	"""
+	Render a text edit patch payload as YAML text.
+
+	Multi-line text is written as literal blocks so it reads like the slide.
+
+	Args:
+		payload: Patch payload with version, source_pptx, and patches.
+
+	Returns:
+		str: YAML document text.
+	"""
+	parts: list[str] = []
+	append_yaml_mapping(parts, payload, "", "")
+	yaml_text = "".join(parts)
+	return yaml_text
+
+
+#============================================
+def load_baseline_hashes(baseline_path: str) -> dict[tuple[int, str], str]:
+	"""
+	Index text hashes from an earlier export by slide index and box id.
+
+	Args:
+		baseline_path: Earlier YAML patch file.
+
+	Returns:
+		dict[tuple[int, str], str]: Text hash per (slide index, box id).
+	"""
+	with open(baseline_path, "r", encoding="utf-8") as handle:
+		payload = yaml.load(handle, Loader=yaml.CSafeLoader)
+	if not isinstance(payload, dict):
+		raise ValueError("Baseline file must be a YAML mapping.")
+	baseline_hashes: dict[tuple[int, str], str] = {}
+	for patch in payload.get("patches") or []:
+		if not isinstance(patch, dict):
+			continue
+		slide_index = patch.get("source_slide_index")
+		if not isinstance(slide_index, int):
+			continue
+		for box in patch.get("boxes") or []:
+			if not isinstance(box, dict):
+				continue
+			box_key = (slide_index, str(box.get("box_id", "")))
+			baseline_hashes[box_key] = str(box.get("text_hash_before", ""))
+	return baseline_hashes
+
+
 #============================================
 def export_slide_text(
 	input_path: str,
@@ -47,6 +255,7 @@ def export_slide_text(
 	include_notes: bool,
 	include_subtitle: bool,
 	include_footer: bool,
+	baseline_path: str = "",
 ) -> None:
 	"""
 	Export slide text blocks to YAML.
@@ -57,6 +266,8 @@ def export_slide_text(
 		include_notes: Include speaker notes blocks.
 		include_subtitle: Include subtitle placeholders.
 		include_footer: Include footer placeholders.
+		baseline_path: Earlier export; boxes whose text is unchanged since
+			then are left out.
 	"""
 	needs_conversion = input_path.lower().endswith(".odp")
 	if needs_conversion:
@@ -72,6 +283,7 @@ def export_slide_text(
 				include_notes,
 				include_subtitle,
 				include_footer,
+				baseline_path,
 			)
 		return
 	pptx_path, source_name = pptx_io.resolve_input_pptx(input_path, None)
@@ -82,6 +294,7 @@ def export_slide_text(
 		include_notes,
 		include_subtitle,
 		include_footer,
+		baseline_path,
 	)
 
 
@@ -93,6 +306,7 @@ def write_yaml(
 	include_notes: bool,
 	include_subtitle: bool,
 	include_footer: bool,
+	baseline_path: str = "",
 ) -> None:
 	"""
 	Write YAML from a PPTX path.
@@ -104,16 +318,25 @@ def write_yaml(
 		include_notes: Include speaker notes blocks.
 		include_subtitle: Include subtitle placeholders.
 		include_footer: Include footer placeholders.
+		baseline_path: Earlier export; boxes whose text hash matches it are
+			left out.
 	"""
+	baseline_hashes: dict[tuple[int, str], str] = {}
+	if baseline_path:
+		baseline_hashes = load_baseline_hashes(baseline_path)
+	omitted = 0
 	presentation = pptx.Presentation(pptx_path)
 	patches = []
 	fallback_slides = []
 	box_count = 0
 	for index, slide in enumerate(presentation.slides, 1):
 		notes_text = pptx_text.extract_notes_text(slide)
+		# box text and hashes are the same ones the slide hash reads
+		shape_texts = {}
 		slide_hash, _, _ = pptx_hash.compute_slide_hash_from_slide(
 			slide,
 			notes_text,
+			shape_texts=shape_texts,
 		)
 		boxes, used_fallback = text_boxes.collect_text_boxes(
 			slide,
@@ -126,7 +349,7 @@ def write_yaml(
 		box_records = []
 		for box_meta in boxes:
 			shape = box_meta["shape"]
-			box_records.append(build_box_record(shape, box_meta))
+			box_records.append(build_box_record(shape, box_meta, shape_texts))
 		if include_notes:
 			box_records.append(
 				{
@@ -136,6 +359,15 @@ def write_yaml(
 					"placeholder_type": "notes",
 				}
 			)
+		if baseline_hashes:
+			changed_records = []
+			for record in box_records:
+				box_key = (index, record["box_id"])
+				if baseline_hashes.get(box_key) == record["text_hash_before"]:
+					omitted += 1
+					continue
+				changed_records.append(record)
+			box_records = changed_records
 		if not box_records:
 			continue
 		box_count += len(box_records)
@@ -149,17 +381,16 @@ def write_yaml(
 	payload = {
 		"version": 1,
 		"source_pptx": source_name,
-		"patches": patches,
 	}
+	if baseline_path:
+		payload["base"] = os.path.basename(baseline_path)
+	payload["patches"] = patches
+	yaml_text = emit_patch_yaml(payload)
 	with open(output_path, "w", encoding="utf-8") as handle:
-		yaml.safe_dump(
-			payload,
-			handle,
-			sort_keys=False,
-			default_flow_style=False,
-			allow_unicode=False,
-		)
+		handle.write(yaml_text)
 	print(f"Exported {len(patches)} slides with {box_count} text blocks.")
+	if baseline_path:
+		print(f"Left out {omitted} text blocks unchanged since the baseline.")
 	if fallback_slides:
 		listed = ", ".join(str(idx) for idx in fallback_slides)
 		print(f"Fallback shape matching used on slides: {listed}")
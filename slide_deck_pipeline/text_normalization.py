@@ -1,5 +1,10 @@
 # Standard Library
 import re
+import functools
+
+
+LINE_BREAK_RE = re.compile(r"\r\n?")
+INDENTED_LINE_RE = re.compile(r"^(\t*)(.*)$", re.MULTILINE)
 
 
 #============================================
@@ -60,23 +65,25 @@ def parse_tab_indented_lines(
 	if not text_value:
 		return []
 	lines = []
-	cleaned = text_value.replace("\r\n", "\n").replace("\r", "\n")
-	for raw_line in cleaned.split("\n"):
-		if raw_line == "":
+	cleaned = LINE_BREAK_RE.sub("\n", text_value)
+	# one match per line: group 1 is the leading tabs, group 2 the rest
+	for match in INDENTED_LINE_RE.finditer(cleaned):
+		tabs, text = match.groups()
+		if not tabs and not text:
 			if keep_blank_lines:
 				lines.append((0, ""))
 			continue
-		if not keep_blank_lines and not raw_line.strip():
+		if not keep_blank_lines and not text.strip():
 			continue
-		level = len(raw_line) - len(raw_line.lstrip("\t"))
-		text = raw_line.lstrip("\t")
 		if strip_text:
 			text = text.strip()
-		lines.append((level, text))
+		lines.append((len(tabs), text))
 	return lines
 
 
 #============================================
+# CSV rows and template layouts repeat a handful of master and layout names
+@functools.lru_cache(maxsize=256)
 def normalize_simple_name(value: str) -> str:
 	"""
 	Normalize a name for simple matching.
@@ -3,7 +3,6 @@ import os
 
 # PIP3 modules
 import pptx
-import pptx.enum.shapes
 import pptx.oxml.ns
 
 # local repo modules
@@ -100,12 +99,6 @@ def collect_placeholders(slide) -> dict[str, list[object]]:
 	"""
 	roles = {"title": [], "subtitle": [], "body": [], "picture": []}
 	placeholders = getattr(slide, "placeholders", [])
-	picture_types = []
-	placeholder_enum = pptx.enum.shapes.PP_PLACEHOLDER
-	if hasattr(placeholder_enum, "PICTURE"):
-		picture_types.append(placeholder_enum.PICTURE)
-	if hasattr(placeholder_enum, "MEDIA"):
-		picture_types.append(placeholder_enum.MEDIA)
 	for shape in placeholders:
 		if not getattr(shape, "is_placeholder", False):
 			continue
@@ -116,7 +109,7 @@ def collect_placeholders(slide) -> dict[str, list[object]]:
 		role = layout_classifier.classify_placeholder_role(placeholder_type)
 		if role:
 			roles[role].append(shape)
-		if placeholder_type in picture_types:
+		if placeholder_type in layout_classifier.PICTURE_SLOT_PLACEHOLDER_TYPES:
 			roles["picture"].append(shape)
 	for role, items in roles.items():
 		roles[role] = sorted(items, key=placeholder_index)
@@ -330,9 +323,16 @@ def render_to_pptx(
 			)
 	total_images = 0
 	total_dropped = 0
+	# specs repeat a few layout types, so resolve each type once; its
+	# warnings are still reported for every slide that uses it
+	layout_choices: dict[str, tuple[object, list[str]]] = {}
 	for entry in spec.get("slides", []):
 		layout_type = entry.get("layout_type")
-		layout, layout_warnings = resolve_layout(layout_type)
+		layout_choice = layout_choices.get(layout_type)
+		if layout_choice is None:
+			layout_choice = resolve_layout(layout_type)
+			layout_choices[layout_type] = layout_choice
+		layout, layout_warnings = layout_choice
 		warnings.extend(layout_warnings)
 		slide = presentation.slides.add_slide(layout)
 		placed, dropped, slide_warnings = fill_placeholders(
@@ -0,0 +1,36 @@
+import os
+import sys
+import subprocess
+
+import pytest
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+# CLI scripts whose --help and argument errors should not load python-pptx.
+LIGHT_SCRIPTS = (
+	"fix_layout",
+	"aspect_fixer",
+	"validate_csv",
+	"text_to_slides",
+	"merge_index_csv_files",
+	"clear_direct_formatting",
+	"set_master_name_in_csv",
+	"shrink_text_on_overflow",
+	"remove_duplicate_slides_from_csv",
+)
+
+
+#============================================
+@pytest.mark.parametrize("script_name", LIGHT_SCRIPTS)
+def test_cli_import_skips_pptx(script_name: str) -> None:
+	"""
+	Import a CLI script without pulling in python-pptx.
+	"""
+	code = f"import sys, {script_name}; print('pptx' in sys.modules)"
+	result = subprocess.run(
+		[sys.executable, "-c", code],
+		cwd=REPO_ROOT,
+		capture_output=True,
+		text=True,
+		check=True,
+	)
+	assert result.stdout.strip() == "False"
@@ -1,3 +1,4 @@
+import hashlib
 import pathlib
 
 import pytest
@@ -15,6 +16,16 @@ def test_normalize_text_preserves_tabs() -> None:
 	assert csv_schema.normalize_text(raw) == expected
 
 
+#============================================
+def test_normalize_text_line_endings() -> None:
+	"""
+	Treat CRLF and lone CR line endings like LF.
+	"""
+	expected = csv_schema.normalize_text("One\n\tTwo\nThree")
+	assert csv_schema.normalize_text("One\r\n\tTwo\rThree") == expected
+	assert expected == "One\n\tTwo\nThree"
+
+
 #============================================
 def test_slide_hash_consistent() -> None:
 	"""
@@ -39,6 +50,25 @@ def test_slide_hash_ignores_ids() -> None:
 	assert first == second
 
 
+#============================================
+def test_slide_hash_matches_joined_payload() -> None:
+	"""
+	Keep the slide hash equal to SHA-256 of the joined payload sections.
+	"""
+	slide_xml = b"<slide><shape>Text</shape></slide>"
+	rel_tokens = [("rId2", "abc123")]
+	payload = (
+		csv_schema.normalize_slide_xml(slide_xml)
+		+ b"\n--rels--\n"
+		+ repr(tuple(rel_tokens)).encode("utf-8")
+		+ b"\n--notes--\n"
+		+ b"Some notes"
+	)
+	expected = hashlib.sha256(payload).hexdigest()[:16]
+	result = csv_schema.compute_slide_hash(slide_xml, " Some  notes ", rel_tokens=rel_tokens)
+	assert result == expected
+
+
 #============================================
 def test_text_hash_consistent() -> None:
 	"""
@@ -51,6 +81,15 @@ def test_text_hash_consistent() -> None:
 	assert first != third
 
 
+#============================================
+def test_text_hash_pinned_value() -> None:
+	"""
+	Keep text hashes stable so existing patch files still match.
+	"""
+	raw = "\tItem one  \r\n\t\tSub  item\n\n  Loose  text "
+	assert csv_schema.compute_text_hash(raw) == "0eaf381434f18475"
+
+
 #============================================
 def test_sanitize_context_text() -> None:
 	"""
@@ -63,6 +102,8 @@ def test_sanitize_context_text() -> None:
 	assert "\n" not in cleaned
 	assert "\r" not in cleaned
 	assert all(ord(ch) < 128 for ch in cleaned)
+	assert cleaned == "Title with comma and lines caf"
+	assert csv_schema.sanitize_context_text("a,,b\r\n\u00a0 c\x0bd") == "a b c d"
 
 
 #============================================
@@ -119,6 +160,48 @@ def test_read_slide_csv_header_in_middle(tmp_path: pathlib.Path) -> None:
 	assert len(rows) == 2
 	assert rows[0]["source_slide_index"] == "1"
 	assert rows[1]["source_slide_index"] == "2"
+
+
+#============================================
+def test_read_slide_csv_skips_blank_and_padded_header_rows(tmp_path: pathlib.Path) -> None:
+	"""
+	Skip whitespace-only rows and headers with padded names, keep data rows.
+	"""
+	csv_path = tmp_path / "padded.csv"
+	padded_headers = ",".join(f" {column} " for column in csv_schema.CSV_COLUMNS)
+	lines = [
+		padded_headers,
+		" , , , , , , , , ",
+		"source_pptx,1,deadbeefdeadbeef,Master,title_content,,Title,Body,Notes",
+	]
+	csv_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+	rows = csv_schema.read_slide_csv(str(csv_path))
+	assert len(rows) == 1
+	assert rows[0]["source_pptx"] == "source_pptx"
+	assert rows[0]["source_slide_index"] == "1"
+
+
+#============================================
+def test_iter_slide_csv_yields_rows_lazily(tmp_path: pathlib.Path) -> None:
+	"""
+	Yield rows one at a time, matching read_slide_csv.
+	"""
+	csv_path = tmp_path / "stream.csv"
+	headers = ",".join(csv_schema.CSV_COLUMNS)
+	lines = [
+		headers,
+		"deck.pptx,1,deadbeefdeadbeef,Master,title_content,,Title,Body,Notes",
+		"deck.pptx,2,feedfacefeedface,Master,title_content,,Title2,Body2,Notes2",
+		"bad,row",
+	]
+	csv_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+	rows = csv_schema.iter_slide_csv(str(csv_path))
+	assert next(rows)["source_slide_index"] == "1"
+	assert next(rows)["source_slide_index"] == "2"
+	with pytest.raises(ValueError):
+		next(rows)
+
+
 #============================================
 def test_validate_headers_ok() -> None:
 	"""
@@ -136,3 +219,43 @@ def test_validate_headers_error() -> None:
 	headers.append("extra")
 	with pytest.raises(ValueError):
 		csv_schema.validate_headers(headers)
+
+
+#============================================
+def test_write_slide_csv_positional_rows(tmp_path: pathlib.Path) -> None:
+	"""
+	Write rows in column order, sanitizing context and filling missing keys.
+	"""
+	csv_path = tmp_path / "written.csv"
+	row = {
+		"notes_text": "Notes, with comma",
+		"source_pptx": "deck.pptx",
+		"source_slide_index": "1",
+		"slide_hash": "deadbeefdeadbeef",
+		"title_text": "Title\tText",
+	}
+	csv_schema.write_slide_csv(str(csv_path), [row])
+	lines = csv_path.read_text(encoding="utf-8").splitlines()
+	assert lines[0] == ",".join(csv_schema.CSV_COLUMNS)
+	assert lines[1] == "deck.pptx,1,deadbeefdeadbeef,,,,Title Text,,Notes with comma"
+	with pytest.raises(ValueError):
+		csv_schema.write_slide_csv(str(csv_path), [{"extra": "x"}])
+
+
+#============================================
+def test_write_csv_rows_removes_temp_file_on_error(tmp_path) -> None:
+	"""
+	Leave the output untouched and no temp file behind when rows fail.
+	"""
+	csv_path = tmp_path / "slides.csv"
+	csv_path.write_text("a,b\n1,2\n", encoding="utf-8")
+
+	def failing_rows():
+		yield ["3", "4"]
+		raise UnicodeDecodeError("utf-8", b"\xff", 0, 1, "invalid start byte")
+
+	with pytest.raises(UnicodeDecodeError):
+		csv_schema.write_csv_rows(str(csv_path), ["a", "b"], failing_rows())
+	assert csv_path.read_text(encoding="utf-8") == "a,b\n1,2\n"
+	assert [path.name for path in tmp_path.iterdir()] == ["slides.csv"]
+
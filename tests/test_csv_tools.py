@@ -1,84 +1,70 @@
 import random
 
+import pytest
+
+import merge_index_csv_files as merge_index
 import remove_duplicate_slides_from_csv as remove_duplicate
 import set_master_name_in_csv as set_master
+import slide_deck_pipeline.csv_schema as csv_schema
 
 
 #============================================
-def test_set_master_name_overwrites_all_rows() -> None:
+def write_master_csv(path) -> None:
 	"""
-	apply_master_name_to_rows overwrites master_name on every row by default.
+	Write a small CSV with master_name values to update.
 	"""
-	rows = [
-		{"master_name": "", "slide_hash": "a"},
-		{"master_name": "old", "slide_hash": "b"},
-	]
-	updated, skipped = set_master.apply_master_name_to_rows(
-		rows,
-		"custom",
-		only_empty=False,
+	path.write_text(
+		"slide_hash,master_name\na,\nb,old\nc,  \n",
+		encoding="utf-8",
 	)
-	assert updated == 2
-	assert skipped == 0
-	assert [row["master_name"] for row in rows] == ["custom", "custom"]
 
 
 #============================================
-def test_set_master_name_only_empty_skips_non_empty() -> None:
+def test_set_master_name_overwrites_all_rows(tmp_path) -> None:
 	"""
-	apply_master_name_to_rows can skip rows that already have a master_name.
+	iter_updated_rows overwrites master_name on every row by default.
 	"""
-	rows = [
-		{"master_name": "", "slide_hash": "a"},
-		{"master_name": "keep", "slide_hash": "b"},
-		{"master_name": "  ", "slide_hash": "c"},
-	]
-	updated, skipped = set_master.apply_master_name_to_rows(
-		rows,
-		"custom",
-		only_empty=True,
-	)
-	assert updated == 2
-	assert skipped == 1
-	assert [row["master_name"] for row in rows] == ["custom", "keep", "custom"]
+	csv_path = tmp_path / "slides.csv"
+	write_master_csv(csv_path)
+	counts = {"updated": 0, "skipped": 0}
+	rows = list(set_master.iter_updated_rows(str(csv_path), 1, "custom", False, counts))
+	assert counts == {"updated": 3, "skipped": 0}
+	assert [row[1] for row in rows] == ["custom", "custom", "custom"]
 
 
 #============================================
-def test_remove_duplicate_slides_is_reproducible_with_seed() -> None:
+def test_set_master_name_only_empty_skips_non_empty(tmp_path) -> None:
 	"""
-	dedupe_rows_random_choice is deterministic when using the same RNG seed.
+	iter_updated_rows can skip rows that already have a master_name.
 	"""
-	rows = [
-		{"slide_hash": "aaa", "source_slide_index": "1"},
-		{"slide_hash": "aaa", "source_slide_index": "2"},
-		{"slide_hash": "bbb", "source_slide_index": "3"},
-		{"slide_hash": "aaa", "source_slide_index": "4"},
-		{"slide_hash": "", "source_slide_index": "5"},
-	]
+	csv_path = tmp_path / "slides.csv"
+	write_master_csv(csv_path)
+	counts = {"updated": 0, "skipped": 0}
+	rows = list(set_master.iter_updated_rows(str(csv_path), 1, "custom", True, counts))
+	assert counts == {"updated": 2, "skipped": 1}
+	assert [row[1] for row in rows] == ["custom", "old", "custom"]
 
-	rng_one = random.Random(123)
-	deduped_one, removed_one = remove_duplicate.dedupe_rows_random_choice(
-		rows,
-		"slide_hash",
-		rng_one,
+
+#============================================
+def test_remove_duplicate_slides_is_reproducible_with_seed() -> None:
+	"""
+	choose_keep_indices is deterministic when using the same RNG seed.
+	"""
+	hash_values = ["aaa", "aaa", "bbb", "aaa", ""]
+	keep_one, removed_one = remove_duplicate.choose_keep_indices(
+		hash_values,
+		random.Random(123),
 	)
-	rng_two = random.Random(123)
-	deduped_two, removed_two = remove_duplicate.dedupe_rows_random_choice(
-		rows,
-		"slide_hash",
-		rng_two,
+	keep_two, removed_two = remove_duplicate.choose_keep_indices(
+		hash_values,
+		random.Random(123),
 	)
-
-	assert removed_one == 2
-	assert removed_two == 2
-	assert [row["source_slide_index"] for row in deduped_one] == [
-		row["source_slide_index"] for row in deduped_two
-	]
-
+	assert removed_one == removed_two == 2
+	assert keep_one == keep_two
 	# One 'aaa' row kept, 'bbb' kept, blank-hash row always kept.
-	assert sum(1 for row in deduped_one if row["slide_hash"] == "aaa") == 1
-	assert sum(1 for row in deduped_one if row["slide_hash"] == "bbb") == 1
-	assert sum(1 for row in deduped_one if row["slide_hash"] == "") == 1
+	assert sum(1 for idx in keep_one if hash_values[idx] == "aaa") == 1
+	assert {2, 4} <= keep_one
+	assert len(keep_one) == 3
 
 
 #============================================
@@ -86,16 +72,125 @@ def test_remove_duplicate_slides_keeps_unique_hashes() -> None:
 	"""
 	Unique hashes are never removed.
 	"""
-	rows = [
-		{"slide_hash": "a", "source_slide_index": "1"},
-		{"slide_hash": "b", "source_slide_index": "2"},
-		{"slide_hash": "c", "source_slide_index": "3"},
-	]
-	deduped, removed = remove_duplicate.dedupe_rows_random_choice(
-		rows,
-		"slide_hash",
+	keep_indices, removed = remove_duplicate.choose_keep_indices(
+		["a", "b", "c"],
 		random.Random(0),
 	)
 	assert removed == 0
-	assert deduped == rows
+	assert keep_indices == {0, 1, 2}
+
+
+#============================================
+def test_remove_duplicate_slides_streams_in_place(tmp_path) -> None:
+	"""
+	Write kept positional rows streamed from the same file they replace.
+	"""
+	csv_path = tmp_path / "slides.csv"
+	fieldnames = ["source_slide_index", "slide_hash"]
+	csv_path.write_text(
+		"source_slide_index,slide_hash\n1,aaa\n\n2,bbb\n3\n4,aaa\n",
+		encoding="utf-8",
+	)
+	assert csv_schema.read_csv_fieldnames(str(csv_path)) == fieldnames
+	rows = list(csv_schema.iter_csv_rows(str(csv_path)))
+	assert rows == [["1", "aaa"], ["2", "bbb"], ["3", ""], ["4", "aaa"]]
+	keep_indices, removed = remove_duplicate.choose_keep_indices(
+		(row[1] for row in rows),
+		random.Random(5),
+	)
+	assert removed == 1
+	expected = [row for idx, row in enumerate(rows) if idx in keep_indices]
+	kept_rows = remove_duplicate.iter_kept_rows(
+		csv_schema.iter_csv_rows(str(csv_path)),
+		keep_indices,
+	)
+	csv_schema.write_csv_rows(str(csv_path), fieldnames, kept_rows)
+	assert list(csv_schema.iter_csv_rows(str(csv_path))) == expected
+	assert len(expected) == 3
+	assert ["2", "bbb"] in expected
+	assert ["3", ""] in expected
+	assert sorted(path.name for path in tmp_path.iterdir()) == ["slides.csv"]
+
 
+#============================================
+def test_iter_kept_rows_keeps_order_and_stops_early() -> None:
+	"""
+	Yield kept rows in CSV order and stop reading after the last one.
+	"""
+	read = []
+
+	def rows():
+		for idx in range(6):
+			read.append(idx)
+			yield [str(idx)]
+
+	assert list(remove_duplicate.iter_kept_rows(rows(), {3, 0, 2})) == [["0"], ["2"], ["3"]]
+	assert len(read) < 6
+	assert list(remove_duplicate.iter_kept_rows(rows(), set())) == []
+
+
+#============================================
+def test_set_master_name_positional_row() -> None:
+	"""
+	set_master_name edits the master_name column of a positional row.
+	"""
+	row = ["deck.pptx", "Old"]
+	assert set_master.set_master_name(row, 1, "New", True) is False
+	assert row == ["deck.pptx", "Old"]
+	assert set_master.set_master_name(row, 1, "New", False) is True
+	assert row == ["deck.pptx", "New"]
+	empty_row = ["deck.pptx", " "]
+	assert set_master.set_master_name(empty_row, 1, "New", True) is True
+	assert empty_row == ["deck.pptx", "New"]
+
+
+#============================================
+def test_merge_expand_inputs_reads_directories(tmp_path) -> None:
+	"""
+	expand_inputs expands a directory to its CSV files in name order.
+	"""
+	for name in ("b.csv", "a.csv", "notes.txt"):
+		(tmp_path / name).write_text("", encoding="utf-8")
+	(tmp_path / "nested.csv").mkdir()
+	expanded = merge_index.expand_inputs([str(tmp_path), str(tmp_path / "a.csv")])
+	assert expanded == [str(tmp_path / "a.csv"), str(tmp_path / "b.csv")]
+	empty_dir = tmp_path / "empty"
+	empty_dir.mkdir()
+	with pytest.raises(FileNotFoundError):
+		merge_index.expand_inputs([str(empty_dir)])
+
+
+#============================================
+def test_merge_sort_rows_numeric_keeps_empty_last() -> None:
+	"""
+	sort_rows sorts digit columns numerically, stable, with empty values last.
+	"""
+	rows = [
+		{"source_slide_index": "10", "title_text": "a"},
+		{"source_slide_index": "", "title_text": "b"},
+		{"source_slide_index": "2", "title_text": "c"},
+		{"source_slide_index": "10", "title_text": "d"},
+		{"source_slide_index": "", "title_text": "e"},
+	]
+	sorted_rows = merge_index.sort_rows(rows, "source_slide_index")
+	assert [row["title_text"] for row in sorted_rows] == ["c", "a", "d", "b", "e"]
+
+
+#============================================
+def test_choose_keep_indices_picks_each_duplicate_evenly() -> None:
+	"""
+	choose_keep_indices keeps every row of a hash group about equally often.
+	"""
+	hash_values = ["aaa", "bbb", "aaa", "", "aaa"]
+	counts = {0: 0, 2: 0, 4: 0}
+	for seed in range(300):
+		keep_indices, removed = remove_duplicate.choose_keep_indices(
+			iter(hash_values),
+			random.Random(seed),
+		)
+		assert removed == 2
+		assert {1, 3} <= keep_indices
+		assert len(keep_indices) == 3
+		(kept_aaa,) = keep_indices - {1, 3}
+		counts[kept_aaa] += 1
+	assert all(70 <= count <= 130 for count in counts.values())
@@ -4,6 +4,7 @@ pptx = pytest.importorskip("pptx")
 
 import index_slide_deck
 import slide_deck_pipeline.csv_schema as csv_schema
+import slide_deck_pipeline.pptx_text as pptx_text
 
 assert pptx
 
@@ -19,6 +20,11 @@ class FakeTextFrame:
 		self.paragraphs = paragraphs
 
 
+class FakeTable:
+	def __init__(self) -> None:
+		self.rows = []
+
+
 class FakeShape:
 	def __init__(
 		self,
@@ -36,6 +42,8 @@ class FakeShape:
 		self.shape_id = shape_id
 		self.has_table = has_table
 		self.has_chart = has_chart
+		self.table = FakeTable() if has_table else None
+		self.chart = None
 
 
 class FakeShapes:
@@ -97,6 +105,42 @@ def test_extract_paragraph_lines() -> None:
 	assert lines == ["Top", "\tSub"]
 
 
+#============================================
+def test_extract_paragraph_lines_matches_paragraph_proxies() -> None:
+	"""
+	Read levels, line breaks, fields, and control characters as python-pptx does.
+	"""
+	presentation = pptx.Presentation()
+	slide = presentation.slides.add_slide(presentation.slide_layouts[6])
+	frame = slide.shapes.add_textbox(0, 0, 100, 100).text_frame
+	frame.text = "First\vline"
+	second = frame.add_paragraph()
+	second.level = 2
+	second.add_run().text = "  Slide "
+	second._p.append(pptx.oxml.parse_xml(
+		'<a:fld xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main"'
+		' id="{B6F15528-21DE-4FAA-801E-634DDDAF4B2B}" type="slidenum">'
+		"<a:t>7</a:t></a:fld>"
+	))
+	frame.add_paragraph().add_run()
+	# python-pptx stores control characters as _xHHHH_ escapes in a:t
+	control = frame.add_paragraph()
+	control.add_run().text = "Bell\x07 tab\t"
+	control.add_run().text = "vt\x0b end"
+	expected = []
+	for paragraph in frame.paragraphs:
+		text = paragraph.text.strip()
+		if text:
+			expected.append("\t" * paragraph.level + text)
+	lines = index_slide_deck.extract_paragraph_lines(frame)
+	assert lines == expected
+	assert lines == [
+		"First\vline",
+		"\t\tSlide 7",
+		"Bell_x0007_ tab\tvt_x000B_ end",
+	]
+
+
 #============================================
 def test_extract_body_text_skips_title() -> None:
 	"""
@@ -111,6 +155,18 @@ def test_extract_body_text_skips_title() -> None:
 	assert index_slide_deck.extract_body_text(slide) == "Body"
 
 
+#============================================
+def test_extract_body_text_uses_given_title() -> None:
+	"""
+	Skip the title shape passed in without looking it up again.
+	"""
+	title_shape = FakeShape(text_frame=FakeTextFrame([FakeParagraph("Title", 0)]))
+	body_shape = FakeShape(text_frame=FakeTextFrame([FakeParagraph("Body", 0)]))
+	slide = FakeSlide(FakeShapes([title_shape, body_shape]))
+	shapes = [title_shape, body_shape]
+	assert index_slide_deck.extract_body_text(slide, shapes, title_shape) == "Body"
+
+
 #============================================
 def test_collect_asset_types() -> None:
 	"""
@@ -128,6 +184,44 @@ def test_collect_asset_types() -> None:
 	assert index_slide_deck.collect_asset_types(slide) == "images_2|table"
 
 
+#============================================
+def test_collect_asset_types_uses_given_shapes() -> None:
+	"""
+	Scan the shape list passed in instead of walking slide.shapes again.
+	"""
+	image_shape = FakeShape(
+		shape_type=pptx.enum.shapes.MSO_SHAPE_TYPE.PICTURE,
+	)
+	table_shape = FakeShape(has_table=True)
+	slide = FakeSlide(FakeShapes([image_shape, table_shape]))
+	assert index_slide_deck.collect_asset_types(slide, [image_shape]) == "image"
+
+
+#============================================
+def test_scan_slide_shapes_matches_separate_walks() -> None:
+	"""
+	One shape walk gives the body text, assets, and unsupported shapes.
+	"""
+	title_shape = FakeShape(text_frame=FakeTextFrame([FakeParagraph("Title", 0)]))
+	body_shape = FakeShape(text_frame=FakeTextFrame([FakeParagraph("Body", 1)]))
+	image_shape = FakeShape(shape_type=pptx.enum.shapes.MSO_SHAPE_TYPE.PICTURE)
+	line_shape = FakeShape(shape_type=pptx.enum.shapes.MSO_SHAPE_TYPE.LINE)
+	group_shape = FakeShape(shape_type=pptx.enum.shapes.MSO_SHAPE_TYPE.GROUP)
+	group_shape.shapes = [
+		FakeShape(text_frame=FakeTextFrame([FakeParagraph("Grouped", 0)])),
+		FakeShape(shape_type=pptx.enum.shapes.MSO_SHAPE_TYPE.PICTURE),
+		line_shape,
+	]
+	shapes = [title_shape, body_shape, image_shape, line_shape, group_shape]
+	slide = FakeSlide(FakeShapes(shapes, title=title_shape))
+	result = index_slide_deck.scan_slide_shapes(shapes, title_shape)
+	assert result == ("\tBody\nGrouped", "images_2", ["LINE", "LINE"])
+	assert result[0] == pptx_text.extract_body_text(slide, shapes, title_shape)
+	assert index_slide_deck.extract_body_text(slide) == result[0]
+	assert index_slide_deck.collect_asset_types(slide) == result[1]
+	assert index_slide_deck.collect_unsupported_shapes(slide) == result[2]
+
+
 #============================================
 def test_resolve_master_name_fallback() -> None:
 	"""
@@ -213,3 +213,72 @@ def test_blank_classification() -> None:
 	assert layout == "blank"
 	assert confidence == 1.0
 	assert "no_placeholders_no_text" in reasons
+
+
+#============================================
+def test_shape_geometry_matches_placeholder_inheritance() -> None:
+	"""
+	Match python-pptx placeholder geometry for inherited and moved shapes.
+	"""
+	pptx = pytest.importorskip("pptx")
+	presentation = pptx.Presentation()
+	slide = presentation.slides.add_slide(presentation.slide_layouts[1])
+	moved = slide.placeholders[1]
+	moved.left = 12345
+	for shape in slide.shapes:
+		expected = (shape.left, shape.top, shape.width, shape.height)
+		assert layout_classifier.shape_geometry(shape) == expected
+
+
+#============================================
+def test_classify_layout_type_reuses_hash_shape_boxes() -> None:
+	"""
+	Classify the same way from the roles and geometry collected while hashing.
+	"""
+	pptx = pytest.importorskip("pptx")
+	pptx_hash = pytest.importorskip("slide_deck_pipeline.pptx_hash")
+	presentation = pptx.Presentation()
+	slide_width = int(presentation.slide_width)
+	slide_height = int(presentation.slide_height)
+	for layout in presentation.slide_layouts:
+		slide = presentation.slides.add_slide(layout)
+		shapes = list(slide.shapes)
+		shape_boxes = {}
+		pptx_hash.compute_slide_hash_from_slide(
+			slide,
+			shapes=shapes,
+			shape_boxes=shape_boxes,
+		)
+		expected = layout_classifier.classify_layout_type(
+			slide,
+			slide_width,
+			slide_height,
+			"Title",
+			"Body",
+			shapes,
+		)
+		result = layout_classifier.classify_layout_type(
+			slide,
+			slide_width,
+			slide_height,
+			"Title",
+			"Body",
+			shapes,
+			shape_boxes,
+		)
+		assert result == expected
+
+
+#============================================
+def test_classify_placeholder_role() -> None:
+	"""
+	Map placeholder types to roles from the module level type tuples.
+	"""
+	pptx = pytest.importorskip("pptx")
+	placeholders = pptx.enum.shapes.PP_PLACEHOLDER
+	assert layout_classifier.classify_placeholder_role(placeholders.TITLE) == "title"
+	assert layout_classifier.classify_placeholder_role(placeholders.CENTER_TITLE) == "title"
+	assert layout_classifier.classify_placeholder_role(placeholders.SUBTITLE) == "subtitle"
+	assert layout_classifier.classify_placeholder_role(placeholders.BODY) == "body"
+	assert layout_classifier.classify_placeholder_role(placeholders.OBJECT) == "body"
+	assert layout_classifier.classify_placeholder_role(placeholders.PICTURE) is None
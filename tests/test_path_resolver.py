@@ -0,0 +1,35 @@
+import os
+
+import slide_deck_pipeline.path_resolver as path_resolver
+
+
+#============================================
+def test_resolve_path_skips_listing_on_cwd_hit(tmp_path, monkeypatch) -> None:
+	"""
+	Resolve a file in the working directory without listing subdirectories.
+	"""
+	(tmp_path / "deck.pptx").write_bytes(b"")
+	monkeypatch.chdir(tmp_path)
+	listed = []
+
+	def tracking_list_subdirs(root: str) -> list[str]:
+		listed.append(root)
+		return []
+
+	monkeypatch.setattr(path_resolver, "_list_subdirs", tracking_list_subdirs)
+	resolved, warnings = path_resolver.resolve_path("deck.pptx")
+	assert resolved == os.path.join(str(tmp_path), "deck.pptx")
+	assert warnings == []
+	assert listed == []
+
+
+#============================================
+def test_resolve_path_finds_subdir_file(tmp_path, monkeypatch) -> None:
+	"""
+	Fall back to immediate subdirectories of the working directory.
+	"""
+	(tmp_path / "decks").mkdir()
+	(tmp_path / "decks" / "deck.pptx").write_bytes(b"")
+	monkeypatch.chdir(tmp_path)
+	resolved, _ = path_resolver.resolve_path("deck.pptx")
+	assert resolved == os.path.join(str(tmp_path), "decks", "deck.pptx")
@@ -1,3 +1,4 @@
+import os
 import pathlib
 
 import pytest
@@ -7,6 +8,8 @@ pptx = pytest.importorskip("pptx")
 import index_slide_deck
 import rebuild_slides
 import slide_deck_pipeline.csv_schema as csv_schema
+import slide_deck_pipeline.pptx_hash as pptx_hash
+import slide_deck_pipeline.soffice_tools as soffice_tools
 
 
 #============================================
@@ -109,3 +112,148 @@ def test_pipeline_rebuild_with_template_clears_template_slides(tmp_path: pathlib
 	assert output_path.exists()
 	merged = pptx.Presentation(str(output_path))
 	assert len(merged.slides) == 2
+
+
+#============================================
+def index_decks(tmp_path: pathlib.Path, titles: list[str], source_ext: str = "pptx") -> list[list[dict]]:
+	"""
+	Create one single-slide deck per title and return each deck's index rows.
+	"""
+	deck_rows = []
+	for title in titles:
+		deck_path = tmp_path / f"{title.lower()}.pptx"
+		create_pptx(deck_path, title, ["Alpha"])
+		source_name = f"{title.lower()}.{source_ext}"
+		deck_rows.append(index_slide_deck.index_rows(str(deck_path), source_name))
+	return deck_rows
+
+
+#============================================
+def rebuild_rows(tmp_path: pathlib.Path, rows: list[dict], output_name: str = "merged.pptx") -> pathlib.Path:
+	"""
+	Write rows to a merged CSV, rebuild it, and return the output path.
+	"""
+	merged_csv = tmp_path / "merged.csv"
+	csv_schema.write_slide_csv(str(merged_csv), rows)
+	output_path = tmp_path / output_name
+	rebuild_slides.rebuild_from_csv(str(merged_csv), str(output_path), "")
+	return output_path
+
+
+#============================================
+def count_calls(monkeypatch: pytest.MonkeyPatch, owner, name: str) -> list[tuple]:
+	"""
+	Wrap owner.name so each call's positional arguments are recorded.
+	"""
+	calls = []
+	original = getattr(owner, name)
+
+	def counting(*args, **kwargs):
+		calls.append(args)
+		return original(*args, **kwargs)
+
+	monkeypatch.setattr(owner, name, counting)
+	return calls
+
+
+#============================================
+def fake_odp_conversion(monkeypatch: pytest.MonkeyPatch, source_path: pathlib.Path) -> list[str]:
+	"""
+	Replace soffice conversions and return the work directories they see.
+	"""
+	work_dirs = []
+
+	def fake_convert_odps(odp_paths: list[str], work_dir: str) -> dict[str, str]:
+		work_dirs.append(work_dir)
+		return {odp_path: str(source_path) for odp_path in odp_paths}
+
+	def fake_convert_to_odp(pptx_path: str, output_path: str) -> None:
+		work_dirs.append(os.path.dirname(os.path.dirname(pptx_path)))
+		os.replace(pptx_path, output_path)
+
+	monkeypatch.setattr(soffice_tools, "convert_odps_to_pptx_cached", fake_convert_odps)
+	monkeypatch.setattr(soffice_tools, "convert_pptx_to_odp", fake_convert_to_odp)
+	return work_dirs
+
+
+#============================================
+def test_pipeline_rebuild_opens_each_source_once(
+	tmp_path: pathlib.Path,
+	monkeypatch: pytest.MonkeyPatch,
+) -> None:
+	"""
+	Keep a source deck open until its last row, opening each deck once in row order.
+	"""
+	titles = ["First", "Second", "Third"]
+	deck_rows = index_decks(tmp_path, titles)
+	rows = [row for rows in deck_rows for row in rows] + deck_rows[0]
+	calls = count_calls(monkeypatch, pptx, "Presentation")
+	output_path = rebuild_rows(tmp_path, rows)
+	# the blank output deck is opened with no arguments
+	opened = [path for args in calls for path in args]
+	assert opened == [str(tmp_path / f"{title.lower()}.pptx") for title in titles]
+	output = pptx.Presentation(str(output_path))
+	assert [slide.shapes.title.text_frame.text for slide in output.slides] == titles + ["First"]
+
+
+#============================================
+def test_pipeline_rebuild_odp_uses_one_work_dir(
+	tmp_path: pathlib.Path,
+	monkeypatch: pytest.MonkeyPatch,
+) -> None:
+	"""
+	Convert ODP sources and stage ODP output in one temporary directory.
+	"""
+	rows = index_decks(tmp_path, ["Source"], "odp")[0]
+	(tmp_path / "source.odp").write_bytes(b"odp")
+	work_dirs = fake_odp_conversion(monkeypatch, tmp_path / "source.pptx")
+	output_path = rebuild_rows(tmp_path, rows, "merged.odp")
+	assert len(work_dirs) == 2
+	assert work_dirs[0] == work_dirs[1]
+	assert not os.path.exists(work_dirs[0])
+	assert len(pptx.Presentation(str(output_path)).slides) == 1
+
+
+#============================================
+def test_pipeline_rebuild_removes_work_dir_on_error(
+	tmp_path: pathlib.Path,
+	monkeypatch: pytest.MonkeyPatch,
+) -> None:
+	"""
+	Remove the ODP work directory when a row fails its slide hash check.
+	"""
+	rows = index_decks(tmp_path, ["Source"], "odp")[0]
+	rows[0]["slide_hash"] = "0" * 16
+	(tmp_path / "source.odp").write_bytes(b"odp")
+	work_dirs = fake_odp_conversion(monkeypatch, tmp_path / "source.pptx")
+	# excinfo keeps the failed frame alive, so only an explicit cleanup passes
+	with pytest.raises(ValueError, match="slide_hash mismatch") as excinfo:
+		rebuild_rows(tmp_path, rows)
+	assert excinfo.traceback
+	assert len(work_dirs) == 1
+	assert not os.path.exists(work_dirs[0])
+
+
+#============================================
+@pytest.mark.parametrize(
+	"owner, name",
+	[
+		(pptx_hash, "compute_slide_hash_from_slide"),
+		(rebuild_slides.rebuild, "select_layout"),
+	],
+	ids=["slide_hash", "layout"],
+)
+def test_pipeline_rebuild_repeated_rows_compute_once(
+	tmp_path: pathlib.Path,
+	monkeypatch: pytest.MonkeyPatch,
+	owner,
+	name: str,
+) -> None:
+	"""
+	Hash a repeated source slide and select its layout only once.
+	"""
+	rows = index_decks(tmp_path, ["Source"])[0]
+	calls = count_calls(monkeypatch, owner, name)
+	output_path = rebuild_rows(tmp_path, rows * 3)
+	assert len(calls) == 1
+	assert len(pptx.Presentation(str(output_path)).slides) == 3
@@ -1,3 +1,5 @@
+import base64
+
 import pytest
 
 pptx = pytest.importorskip("pptx")
@@ -43,8 +45,9 @@ class FakeTextFrame:
 
 
 class FakePlaceholderFormat:
-	def __init__(self, placeholder_type: int) -> None:
+	def __init__(self, placeholder_type: int, idx: int = 1) -> None:
 		self.type = placeholder_type
+		self.idx = idx
 
 
 class FakeShape:
@@ -77,6 +80,17 @@ class FakeShapes:
 		self.pictures.append((path, left, top, width, height))
 
 
+class FakeImage:
+	def __init__(self, blob: bytes) -> None:
+		self.blob = blob
+
+
+class FakePicture:
+	def __init__(self, blob: bytes) -> None:
+		self.shape_type = pptx.enum.shapes.MSO_SHAPE_TYPE.PICTURE
+		self.image = FakeImage(blob)
+
+
 class FakePresentationDimensions:
 	def __init__(self, width, height) -> None:
 		self.slide_width = width
@@ -183,6 +197,26 @@ def test_find_body_placeholder() -> None:
 	assert found == body_shape
 
 
+#============================================
+def test_find_body_placeholder_fallback_skips_title() -> None:
+	"""
+	Fall back to the first text shape that is not the title placeholder.
+	"""
+	title_shape = FakeShape(is_placeholder=True, text_frame=FakeTextFrame())
+	title_shape.placeholder_format = FakePlaceholderFormat(
+		pptx.enum.shapes.PP_PLACEHOLDER.TITLE,
+		idx=0,
+	)
+	content_shape = FakeShape(
+		is_placeholder=True,
+		placeholder_type=pptx.enum.shapes.PP_PLACEHOLDER.OBJECT,
+		text_frame=FakeTextFrame(),
+	)
+	shapes = FakeShapes([title_shape, content_shape], title=title_shape)
+	slide = FakeSlide(shapes, pptx.util.Inches(10), pptx.util.Inches(7.5))
+	assert rebuild_slides.find_body_placeholder(slide) is content_shape
+
+
 #============================================
 def test_set_body_text() -> None:
 	"""
@@ -234,3 +268,48 @@ def test_insert_images_uses_placeholder() -> None:
 
 
 #============================================
+def test_place_images_grid_reuses_repeated_blob() -> None:
+	"""
+	Share one image part and relationship among repeated blobs on a slide.
+	"""
+	png_one = base64.b64decode(
+		"iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR4nGNgYAAAAAMA"
+		"ASsJTYQAAAAASUVORK5CYII="
+	)
+	png_two = base64.b64decode(
+		"iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR4nGMAAQAABQAB"
+		"JBSQGQAAAABJRU5ErkJggg=="
+	)
+	presentation = pptx.Presentation()
+	slide = presentation.slides.add_slide(presentation.slide_layouts[6])
+	rebuild_slides.place_images_grid(slide, [png_one, png_two, png_one, png_one])
+	pictures = list(slide.shapes)
+	assert len(pictures) == 4
+	rids = [picture._pic.blip_rId for picture in pictures]
+	assert rids[0] == rids[2] == rids[3]
+	assert rids[1] != rids[0]
+	assert [picture.image.blob for picture in pictures] == [
+		png_one,
+		png_two,
+		png_one,
+		png_one,
+	]
+	lefts = [picture.left for picture in pictures]
+	assert lefts[0] == lefts[2]
+	assert lefts[1] == lefts[3]
+	assert lefts[0] < lefts[1]
+
+
+#============================================
+def test_collect_source_images_uses_given_shapes() -> None:
+	"""
+	Read image blobs from the shape list passed in.
+	"""
+	first = FakePicture(b"first")
+	second = FakePicture(b"second")
+	text_shape = FakeShape(text_frame=FakeTextFrame())
+	text_shape.shape_type = pptx.enum.shapes.MSO_SHAPE_TYPE.TEXT_BOX
+	slide = FakeSlide(FakeShapes([first]), 1, 1)
+	assert rebuild_slides.collect_source_images(slide) == [b"first"]
+	shapes = [first, text_shape, second]
+	assert rebuild_slides.collect_source_images(slide, shapes) == [b"first", b"second"]
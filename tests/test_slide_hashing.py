@@ -100,6 +100,29 @@ def test_compute_slide_hash_from_slide_stable(tmp_path) -> None:
 	assert hash_one == hash_two
 
 
+#============================================
+def test_compute_slide_hash_collects_shape_texts(tmp_path) -> None:
+	"""
+	Collect box text and hashes while hashing without changing the hash.
+	"""
+	pptx_path = tmp_path / "hash_texts.pptx"
+	build_sample_pptx(str(pptx_path))
+	presentation = pptx.Presentation(str(pptx_path))
+	slide = presentation.slides[0]
+	plain_hash, _, _ = pptx_hash.compute_slide_hash_from_slide(slide)
+	shape_texts = {}
+	collected_hash, _, _ = pptx_hash.compute_slide_hash_from_slide(
+		slide,
+		shape_texts=shape_texts,
+	)
+	assert collected_hash == plain_hash
+	body = slide.shapes.placeholders[1]
+	assert shape_texts[body._element] == (
+		"Body text",
+		csv_schema.compute_text_hash("Body text"),
+	)
+
+
 #============================================
 def test_index_rows_hash_matches_pristine_slide(tmp_path) -> None:
 	"""
@@ -160,3 +183,83 @@ def test_slide_hash_changes_with_picture(tmp_path) -> None:
 		second_presentation.slides[0]
 	)
 	assert first_hash != second_hash
+
+
+#============================================
+def test_compute_deck_slide_hashes_matches_serial(tmp_path) -> None:
+	"""
+	Pooled slide hashes should match hashing each slide directly.
+	"""
+	pptx_path = tmp_path / "pooled.pptx"
+	presentation = pptx.Presentation()
+	for index in range(3):
+		slide = presentation.slides.add_slide(presentation.slide_layouts[1])
+		slide.shapes.title.text = f"Title {index}"
+	presentation.save(str(pptx_path))
+	reopened = pptx.Presentation(str(pptx_path))
+	expected = [
+		pptx_hash.compute_slide_hash_from_slide(slide)[0]
+		for slide in reopened.slides
+	]
+	pooled = pptx_hash.compute_deck_slide_hashes(str(pptx_path), 3, 2)
+	assert pooled == expected
+
+
+#============================================
+def test_index_rows_pooled_matches_serial(tmp_path) -> None:
+	"""
+	Indexing with a process pool should give the same rows in slide order.
+	"""
+	pptx_path = tmp_path / "pooled_index.pptx"
+	presentation = pptx.Presentation()
+	for index in range(5):
+		slide = presentation.slides.add_slide(presentation.slide_layouts[1])
+		slide.shapes.title.text = f"Title {index}"
+		slide.placeholders[1].text = f"Body {index}"
+	presentation.save(str(pptx_path))
+	serial = index_slide_deck.index_rows(str(pptx_path), "pooled_index.pptx")
+	pooled = index_slide_deck.index_rows(str(pptx_path), "pooled_index.pptx", 2)
+	assert pooled == serial
+	assert [row["source_slide_index"] for row in pooled] == ["1", "2", "3", "4", "5"]
+
+
+#============================================
+def test_resolve_worker_count_uses_cpus_for_zero(monkeypatch) -> None:
+	"""
+	A jobs value of 0 or less resolves to one worker per CPU.
+	"""
+	monkeypatch.setattr(pptx_hash.os, "cpu_count", lambda: 6)
+	assert pptx_hash.resolve_worker_count(0) == 6
+	assert pptx_hash.resolve_worker_count(-1) == 6
+	assert pptx_hash.resolve_worker_count(3) == 3
+	monkeypatch.setattr(pptx_hash.os, "cpu_count", lambda: None)
+	assert pptx_hash.resolve_worker_count(0) == 1
+
+
+#============================================
+def test_hash_image_blob_hashes_shared_part_once(tmp_path, monkeypatch) -> None:
+	"""
+	Hash an image shared by several slides once per image part.
+	"""
+	png_bytes = base64.b64decode(
+		"iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR4nGNgYAAAAAMA"
+		"ASsJTYQAAAAASUVORK5CYII="
+	)
+	image_path = tmp_path / "logo.png"
+	image_path.write_bytes(png_bytes)
+	presentation = pptx.Presentation()
+	pictures = []
+	for _ in range(3):
+		slide = presentation.slides.add_slide(presentation.slide_layouts[6])
+		pictures.append(slide.shapes.add_picture(str(image_path), 0, 0))
+	calls = []
+	original_hash_bytes = pptx_hash.hash_bytes
+
+	def counting_hash_bytes(payload: bytes) -> str:
+		calls.append(len(payload))
+		return original_hash_bytes(payload)
+
+	monkeypatch.setattr(pptx_hash, "hash_bytes", counting_hash_bytes)
+	hashes = [pptx_hash.hash_image_blob(picture) for picture in pictures]
+	assert hashes == [original_hash_bytes(png_bytes)] * 3
+	assert len(calls) == 1
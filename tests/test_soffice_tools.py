@@ -0,0 +1,157 @@
+import os
+import sys
+import pathlib
+import subprocess
+
+import slide_deck_pipeline.soffice_tools as soffice_tools
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+
+#============================================
+def fake_convert(odp_path: str, work_dir: str) -> str:
+	"""
+	Stand in for soffice by writing a placeholder PPTX.
+	"""
+	base_name = os.path.splitext(os.path.basename(odp_path))[0]
+	pptx_path = os.path.join(work_dir, f"{base_name}.pptx")
+	with open(pptx_path, "wb") as handle:
+		handle.write(b"converted")
+	return pptx_path
+
+
+#============================================
+def test_convert_odp_to_pptx_cached_reuses_conversion(tmp_path, monkeypatch) -> None:
+	"""
+	Convert once, then copy the cached PPTX for identical ODP bytes.
+	"""
+	monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+	calls = []
+
+	def counting_convert(odp_path: str, work_dir: str) -> str:
+		calls.append(odp_path)
+		return fake_convert(odp_path, work_dir)
+
+	monkeypatch.setattr(soffice_tools, "convert_odp_to_pptx", counting_convert)
+	odp_path = tmp_path / "deck.odp"
+	odp_path.write_bytes(b"odp bytes")
+	first_dir = tmp_path / "first"
+	second_dir = tmp_path / "second"
+	first_dir.mkdir()
+	second_dir.mkdir()
+	first = soffice_tools.convert_odp_to_pptx_cached(str(odp_path), str(first_dir))
+	second = soffice_tools.convert_odp_to_pptx_cached(str(odp_path), str(second_dir))
+	assert len(calls) == 1
+	assert second == str(second_dir / "deck.pptx")
+	with open(first, "rb") as handle:
+		first_bytes = handle.read()
+	with open(second, "rb") as handle:
+		assert handle.read() == first_bytes
+
+
+#============================================
+def test_build_soffice_command_reuses_process_profile(monkeypatch) -> None:
+	"""
+	Point every soffice run in one process at the same private profile.
+	"""
+	monkeypatch.setattr(soffice_tools, "find_soffice", lambda: "/usr/bin/soffice")
+	command = soffice_tools.build_soffice_command("odp", "out", "deck.pptx")
+	profile_dir = soffice_tools.get_soffice_profile_dir()
+	assert os.path.isdir(profile_dir)
+	assert command[0] == "/usr/bin/soffice"
+	assert command[1] == f"-env:UserInstallation={pathlib.Path(profile_dir).as_uri()}"
+	assert "--safe-mode" not in command
+	assert command[-4:] == ["odp", "--outdir", "out", "deck.pptx"]
+	again = soffice_tools.build_soffice_command("pptx", "out", "deck.odp")
+	assert again[1] == command[1]
+
+
+#============================================
+def test_concurrent_processes_use_separate_profiles() -> None:
+	"""
+	Give processes running at the same time their own profile, removed at exit.
+	"""
+	code = (
+		"import sys, slide_deck_pipeline.soffice_tools as soffice_tools\n"
+		"print(soffice_tools.get_soffice_profile_dir(), flush=True)\n"
+		"sys.stdin.readline()\n"
+	)
+	processes = [
+		subprocess.Popen(
+			[sys.executable, "-c", code],
+			cwd=REPO_ROOT,
+			stdin=subprocess.PIPE,
+			stdout=subprocess.PIPE,
+			text=True,
+		)
+		for _ in range(2)
+	]
+	# both processes hold their profile until told to exit
+	profile_dirs = [process.stdout.readline().strip() for process in processes]
+	for process in processes:
+		process.communicate("\n")
+		assert process.returncode == 0
+	assert profile_dirs[0] != profile_dirs[1]
+	assert not any(os.path.exists(profile_dir) for profile_dir in profile_dirs)
+
+
+#============================================
+def test_convert_odps_to_pptx_cached_batches_misses(tmp_path, monkeypatch) -> None:
+	"""
+	Convert all uncached ODP files in one soffice run.
+	"""
+	monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+	batches = []
+
+	def fake_convert_many(odp_paths: list[str], work_dir: str) -> dict[str, str]:
+		batches.append(list(odp_paths))
+		return {path: fake_convert(path, work_dir) for path in odp_paths}
+
+	monkeypatch.setattr(soffice_tools, "convert_odps_to_pptx", fake_convert_many)
+	odp_paths = []
+	for name in ("alpha", "beta"):
+		odp_path = tmp_path / f"{name}.odp"
+		odp_path.write_bytes(name.encode("utf-8"))
+		odp_paths.append(str(odp_path))
+	(tmp_path / "other").mkdir()
+	repeated = tmp_path / "other" / "alpha.odp"
+	repeated.write_bytes(b"other alpha")
+	odp_paths.append(str(repeated))
+	work_dir = tmp_path / "work"
+	work_dir.mkdir()
+	converted = soffice_tools.convert_odps_to_pptx_cached(odp_paths, str(work_dir))
+	assert batches == [odp_paths[:2], odp_paths[2:]]
+	assert set(converted) == set(odp_paths)
+	assert converted[str(repeated)] != converted[odp_paths[0]]
+	rerun_dir = tmp_path / "rerun"
+	rerun_dir.mkdir()
+	soffice_tools.convert_odps_to_pptx_cached(odp_paths, str(rerun_dir))
+	assert len(batches) == 2
+
+
+#============================================
+def test_convert_odps_to_pptx_cached_batches_repeated_names(tmp_path, monkeypatch) -> None:
+	"""
+	Convert ODP files that share a base name in one extra run per repetition.
+	"""
+	monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+	batches = []
+
+	def fake_convert_many(odp_paths: list[str], work_dir: str) -> dict[str, str]:
+		batches.append(list(odp_paths))
+		return {path: fake_convert(path, work_dir) for path in odp_paths}
+
+	monkeypatch.setattr(soffice_tools, "convert_odps_to_pptx", fake_convert_many)
+	odp_paths = []
+	for folder in ("one", "two", "three"):
+		(tmp_path / folder).mkdir()
+		for name in ("alpha", "beta"):
+			odp_path = tmp_path / folder / f"{name}.odp"
+			odp_path.write_bytes(f"{folder} {name}".encode("utf-8"))
+			odp_paths.append(str(odp_path))
+	work_dir = tmp_path / "work"
+	work_dir.mkdir()
+	converted = soffice_tools.convert_odps_to_pptx_cached(odp_paths, str(work_dir))
+	assert batches == [odp_paths[0:2], odp_paths[2:4], odp_paths[4:6]]
+	assert set(converted) == set(odp_paths)
+	assert len(set(converted.values())) == len(odp_paths)
@@ -86,3 +86,18 @@ def test_load_yaml_spec_image_conflict_strict(tmp_path: pathlib.Path) -> None:
 	)
 	with pytest.raises(ValueError):
 		spec_schema.load_yaml_spec(str(yaml_path), strict=True)
+
+
+#============================================
+def test_normalize_layout_type_cached() -> None:
+	"""
+	Reuse normalized layout types and still reject unknown values.
+	"""
+	spec_schema.normalize_layout_type.cache_clear()
+	for _ in range(3):
+		assert spec_schema.normalize_layout_type(" Title Content ") == "title_content"
+	assert spec_schema.normalize_layout_type.cache_info().hits == 2
+	for _ in range(2):
+		with pytest.raises(ValueError):
+			spec_schema.normalize_layout_type("no_such_layout")
+	assert spec_schema.normalize_layout_type("no_such_layout", True) == ""
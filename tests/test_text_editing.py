@@ -0,0 +1,230 @@
+import io
+
+import pytest
+
+pptx = pytest.importorskip("pptx")
+
+import yaml
+
+import slide_deck_pipeline.pptx_hash as pptx_hash
+import slide_deck_pipeline.text_boxes as text_boxes
+import slide_deck_pipeline.text_editing as text_editing
+
+
+#============================================
+def test_load_patch_stream_yields_patches() -> None:
+	"""
+	Stream patches after the header keys are read.
+	"""
+	content = (
+		"version: 1\n"
+		"source_pptx: deck.pptx\n"
+		"patches:\n"
+		"- source_slide_index: 1\n"
+		"  boxes:\n"
+		"  - box_id: title\n"
+		"    text: Title\n"
+		"- source_slide_index: 2\n"
+		"  boxes: []\n"
+	)
+	header, patches = text_editing.load_patch_stream(io.StringIO(content))
+	assert header == {"version": 1, "source_pptx": "deck.pptx"}
+	assert not isinstance(patches, list)
+	patch_list = list(patches)
+	assert len(patch_list) == 2
+	assert patch_list[0]["boxes"][0]["text"] == "Title"
+	assert patch_list[1]["source_slide_index"] == 2
+
+
+#============================================
+def test_load_patch_stream_header_after_patches() -> None:
+	"""
+	Read header keys that appear after the patches list.
+	"""
+	content = "patches:\n- source_slide_index: 1\nversion: 1\n"
+	header, patches = text_editing.load_patch_stream(io.StringIO(content))
+	assert header == {"version": 1}
+	assert patches == [{"source_slide_index": 1}]
+
+
+#============================================
+def test_load_patch_stream_parses_content_after_streamed_patches() -> None:
+	"""
+	Keep reading after the streamed patches so trailing keys and errors surface.
+	"""
+	prefix = "version: 1\nsource_pptx: d.pptx\npatches:\n- a: 1\n"
+	header, patches = text_editing.load_patch_stream(io.StringIO(prefix + "extra: 2\n"))
+	assert list(patches) == [{"a": 1}]
+	assert header["extra"] == 2
+	_, patches = text_editing.load_patch_stream(io.StringIO(prefix + "extra: [unclosed\n"))
+	with pytest.raises(yaml.YAMLError):
+		list(patches)
+	_, patches = text_editing.load_patch_stream(io.StringIO(prefix + "---\nmore: 1\n"))
+	with pytest.raises(ValueError, match="single YAML document"):
+		list(patches)
+
+
+#============================================
+def test_load_patch_stream_rejects_non_mapping() -> None:
+	"""
+	Reject patch files that are not YAML mappings.
+	"""
+	with pytest.raises(ValueError):
+		text_editing.load_patch_stream(io.StringIO("- 1\n"))
+
+
+#============================================
+def build_title_pptx(path: str) -> None:
+	"""
+	Build a PPTX with one title and body slide.
+	"""
+	presentation = pptx.Presentation()
+	slide = presentation.slides.add_slide(presentation.slide_layouts[1])
+	slide.shapes.title.text = "Title"
+	slide.placeholders[1].text_frame.text = "Body"
+	presentation.save(path)
+
+
+#============================================
+def test_apply_and_save_two_patches_same_slide(tmp_path) -> None:
+	"""
+	Apply two patches to one slide using the pristine slide hash.
+	"""
+	input_path = str(tmp_path / "deck.pptx")
+	output_path = str(tmp_path / "edited.pptx")
+	build_title_pptx(input_path)
+	slide = pptx.Presentation(input_path).slides[0]
+	slide_hash, _, _ = pptx_hash.compute_slide_hash_from_slide(slide)
+	patches = [
+		{
+			"source_slide_index": 1,
+			"slide_hash": slide_hash,
+			"boxes": [{"box_id": "title", "text": "New title"}],
+		},
+		{
+			"source_slide_index": 1,
+			"slide_hash": slide_hash,
+			"boxes": [{"box_id": "body_1", "text": "New body"}],
+		},
+	]
+	text_editing.apply_and_save(input_path, patches, output_path, False, False, False)
+	edited = pptx.Presentation(output_path).slides[0]
+	assert edited.shapes.title.text_frame.text == "New title"
+	assert edited.placeholders[1].text_frame.text == "New body"
+
+
+#============================================
+def test_apply_and_save_skips_unchanged_text(tmp_path, capsys) -> None:
+	"""
+	Leave boxes whose patch text matches the current text untouched.
+	"""
+	input_path = str(tmp_path / "deck.pptx")
+	output_path = str(tmp_path / "edited.pptx")
+	build_title_pptx(input_path)
+	slide = pptx.Presentation(input_path).slides[0]
+	slide_hash, _, _ = pptx_hash.compute_slide_hash_from_slide(slide)
+	patches = [
+		{
+			"source_slide_index": 1,
+			"slide_hash": slide_hash,
+			"boxes": [
+				{"box_id": "title", "text": "Title"},
+				{"box_id": "body_1", "text": "New body"},
+				{"box_id": "notes", "text": ""},
+			],
+		},
+	]
+	text_editing.apply_and_save(input_path, patches, output_path, False, False, False)
+	output = capsys.readouterr().out
+	assert "Updated blocks: 1" in output
+	assert "Unchanged blocks: 2" in output
+	edited = pptx.Presentation(output_path).slides[0]
+	assert edited.placeholders[1].text_frame.text == "New body"
+	assert not edited.has_notes_slide
+
+
+#============================================
+def test_render_bullets_nested() -> None:
+	"""
+	Render nested bullet lists as tab-indented lines.
+	"""
+	lines = text_editing.render_bullets(["Top", ["Sub", ["Deep"]], "Next"])
+	assert lines == ["Top", "\tSub", "\t\tDeep", "Next"]
+
+
+#============================================
+def test_render_bullets_depth_limit() -> None:
+	"""
+	Reject bullets nested past the maximum depth.
+	"""
+	with pytest.raises(ValueError):
+		text_editing.render_bullets(["a", ["b", ["c", ["d", ["e"]]]]])
+
+
+#============================================
+def test_should_skip_box_statuses() -> None:
+	"""
+	Skip locked boxes and boxes with a skip edit_status.
+	"""
+	assert text_editing.should_skip_box({"locked": True})
+	assert text_editing.should_skip_box({"edit_status": " Frozen "})
+	assert not text_editing.should_skip_box({"edit_status": "edit"})
+	assert not text_editing.should_skip_box({"box_id": "title"})
+
+
+#============================================
+def test_find_box_matches_collect_text_boxes() -> None:
+	"""
+	Find placeholder and fallback boxes under the same ids as the bulk scan.
+	"""
+	presentation = pptx.Presentation()
+	slide = presentation.slides.add_slide(presentation.slide_layouts[1])
+	slide.shapes.title.text = "Title"
+	blank = presentation.slides.add_slide(presentation.slide_layouts[6])
+	blank.shapes.add_textbox(0, 0, 100, 100).name = "Label Box"
+	for current in (slide, blank):
+		boxes, _ = text_boxes.collect_text_boxes(current, False, False)
+		assert boxes
+		for box in boxes:
+			found = text_boxes.find_box(current, box["box_id"], False, False)
+			assert found["shape"].shape_id == box["shape"].shape_id
+		assert text_boxes.find_box(current, "missing", False, False) is None
+
+
+#============================================
+def test_resolve_slide_number() -> None:
+	"""
+	Accept ints and digit strings in range, reject everything else.
+	"""
+	assert text_editing.resolve_slide_number(2, 3) == 2
+	assert text_editing.resolve_slide_number("3", 3) == 3
+	assert text_editing.resolve_slide_number(4, 3) == 0
+	assert text_editing.resolve_slide_number(0, 3) == 0
+	assert text_editing.resolve_slide_number(-1, 3) == 0
+	assert text_editing.resolve_slide_number(True, 3) == 0
+	assert text_editing.resolve_slide_number(None, 3) == 0
+	assert text_editing.resolve_slide_number("x", 3) == 0
+
+
+#============================================
+def test_load_patch_stream_interns_short_strings() -> None:
+	"""
+	Share one string object for repeated short values across patches.
+	"""
+	text = (
+		"version: 1\n"
+		"source_pptx: deck.pptx\n"
+		"patches:\n"
+		"- source_slide_index: 1\n"
+		"  boxes:\n"
+		"  - box_id: body_1\n"
+		"- source_slide_index: 2\n"
+		"  boxes:\n"
+		"  - box_id: body_1\n"
+	)
+	_, patches = text_editing.load_patch_stream(io.StringIO(text))
+	first, second = list(patches)
+	first_id = first["boxes"][0]["box_id"]
+	second_id = second["boxes"][0]["box_id"]
+	assert first_id == "body_1"
+	assert first_id is second_id
@@ -0,0 +1,117 @@
+import pytest
+
+yaml = pytest.importorskip("yaml")
+pptx = pytest.importorskip("pptx")
+
+import slide_deck_pipeline.csv_schema as csv_schema
+import slide_deck_pipeline.text_boxes as text_boxes
+import slide_deck_pipeline.text_export as text_export
+
+
+#============================================
+def build_payload(texts: list[str]) -> dict[str, object]:
+	"""
+	Build a patch payload with one box per text value.
+	"""
+	boxes = []
+	for index, text in enumerate(texts, 1):
+		boxes.append(
+			{
+				"box_id": f"body_{index}",
+				"text_hash_before": "0123456789abcdef",
+				"text": text,
+			}
+		)
+	payload = {
+		"version": 1,
+		"source_pptx": "deck.pptx",
+		"patches": [
+			{"source_slide_index": 1, "slide_hash": "1234567890123456", "boxes": boxes},
+		],
+	}
+	return payload
+
+
+#============================================
+def test_emit_patch_yaml_round_trips() -> None:
+	"""
+	Emitted YAML loads back to the same payload with both loaders.
+	"""
+	texts = [
+		"Plain title",
+		"Top\n\tSub: detail\n\t\tDeep",
+		"\tStarts with a tab\nNext",
+		"Trailing newlines\n\n",
+		"Quotes ' and \" and # and caf\u00e9",
+		"yes",
+		"",
+	]
+	payload = build_payload(texts)
+	yaml_text = text_export.emit_patch_yaml(payload)
+	assert yaml_text.isascii()
+	assert yaml.safe_load(yaml_text) == payload
+	assert yaml.load(yaml_text, Loader=yaml.CSafeLoader) == payload
+
+
+#============================================
+def test_emit_patch_yaml_uses_literal_blocks() -> None:
+	"""
+	Write multi-line text as a literal block scalar.
+	"""
+	payload = build_payload(["Top\n\tSub"])
+	yaml_text = text_export.emit_patch_yaml(payload)
+	assert "    text: |-\n      Top\n      \tSub\n" in yaml_text
+	assert "slide_hash: '1234567890123456'" in yaml_text
+
+
+#============================================
+def test_write_yaml_baseline_omits_unchanged_boxes(tmp_path) -> None:
+	"""
+	Write only boxes whose text changed since the baseline export.
+	"""
+	deck_path = str(tmp_path / "deck.pptx")
+	presentation = pptx.Presentation()
+	slide = presentation.slides.add_slide(presentation.slide_layouts[1])
+	slide.shapes.title.text = "Title"
+	slide.placeholders[1].text_frame.text = "Body"
+	presentation.save(deck_path)
+	baseline_path = str(tmp_path / "baseline.yaml")
+	text_export.write_yaml(deck_path, "deck.pptx", baseline_path, False, False, False)
+	slide.placeholders[1].text_frame.text = "Changed body"
+	presentation.save(deck_path)
+	delta_path = str(tmp_path / "delta.yaml")
+	text_export.write_yaml(
+		deck_path,
+		"deck.pptx",
+		delta_path,
+		False,
+		False,
+		False,
+		baseline_path,
+	)
+	with open(delta_path, "r", encoding="utf-8") as handle:
+		delta = yaml.safe_load(handle)
+	assert delta["base"] == "baseline.yaml"
+	boxes = delta["patches"][0]["boxes"]
+	assert [box["box_id"] for box in boxes] == ["body_1"]
+	assert boxes[0]["text"] == "Changed body"
+
+
+#============================================
+def test_extract_text_and_hash_matches_two_pass() -> None:
+	"""
+	Match extract_text_block plus compute_text_hash, including line feeds.
+	"""
+	presentation = pptx.Presentation()
+	slide = presentation.slides.add_slide(presentation.slide_layouts[6])
+	samples = ["Plain  text", "\tTabbed\tword ", "Feed\ninside run", ""]
+	for sample in samples:
+		shape = slide.shapes.add_textbox(0, 0, 100, 100)
+		paragraph = shape.text_frame.paragraphs[0]
+		paragraph.add_run().text = "Intro   words"
+		second = shape.text_frame.add_paragraph()
+		second.level = 1
+		second.add_run()._r.t.text = sample
+		text_value, text_hash = text_boxes.extract_text_and_hash(shape)
+		assert text_value == text_boxes.extract_text_block(shape)
+		assert text_hash == csv_schema.compute_text_hash(text_value)
@@ -4,6 +4,7 @@ import pytest
 
 pptx = pytest.importorskip("pptx")
 
+import slide_deck_pipeline.default_layouts as default_layouts
 import slide_deck_pipeline.pptx_text as pptx_text
 import slide_deck_pipeline.text_to_slides as text_to_slides
 
@@ -46,3 +47,53 @@ def test_render_default_layout(tmp_path: pathlib.Path) -> None:
 	assert slide.shapes.title.text == "Hello"
 	body_text = pptx_text.extract_body_text(slide)
 	assert "Point one" in body_text
+
+
+#============================================
+def test_render_resolves_each_layout_type_once(
+	tmp_path: pathlib.Path,
+	monkeypatch: pytest.MonkeyPatch,
+) -> None:
+	"""
+	Resolve a layout type shared by several slides only once.
+	"""
+	spec_path = tmp_path / "spec.yaml"
+	spec_path.write_text("version: 1\nslides: []\n", encoding="utf-8")
+	output_path = tmp_path / "output.pptx"
+	slides = []
+	for layout_type in ("title_content", "title_only", "title_content"):
+		slides.append(
+			{
+				"layout_type": layout_type,
+				"title": layout_type,
+				"subtitle": None,
+				"bodies": [],
+				"image": None,
+				"images": None,
+			}
+		)
+	spec = {
+		"version": 1,
+		"template_deck": None,
+		"defaults": {"layout_type": "title_content", "master_name": None},
+		"slides": slides,
+	}
+	resolved = []
+	original_resolve = default_layouts.resolve_default_layout
+
+	def counting_resolve(layout_map, layout_type, strict):
+		resolved.append(layout_type)
+		return original_resolve(layout_map, layout_type, strict)
+
+	monkeypatch.setattr(default_layouts, "resolve_default_layout", counting_resolve)
+	text_to_slides.render_to_pptx(
+		spec,
+		str(spec_path),
+		None,
+		str(output_path),
+		strict=False,
+	)
+	assert resolved == ["title_content", "title_only"]
+	presentation = pptx.Presentation(str(output_path))
+	titles = [slide.shapes.title.text for slide in presentation.slides]
+	assert titles == ["title_content", "title_only", "title_content"]
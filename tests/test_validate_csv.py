@@ -1,4 +1,9 @@
+import os
+
+import pytest
+
 import slide_deck_pipeline.csv_schema as csv_schema
+import slide_deck_pipeline.csv_validation as csv_validation
 import validate_csv
 
 
@@ -97,3 +102,121 @@ def test_validate_rows_bad_slide_index() -> None:
 		template_path="",
 	)
 	assert any("invalid source_slide_index" in item for item in errors)
+
+
+#============================================
+def test_collect_strict_odp_paths(tmp_path) -> None:
+	"""
+	Collect each ODP source deck that strict validation will hash once.
+	"""
+	(tmp_path / "deck.odp").write_bytes(b"odp")
+	(tmp_path / "deck.pptx").write_bytes(b"pptx")
+	(tmp_path / "skipped.odp").write_bytes(b"odp")
+	rows = []
+	for source_pptx in ("deck.odp", "deck.pptx", "deck.odp", "missing.odp"):
+		row = build_row("0123456789abcdef")
+		row["source_pptx"] = source_pptx
+		rows.append(row)
+	skipped = build_row("0123456789abcdef", source_slide_index="0")
+	skipped["source_pptx"] = "skipped.odp"
+	rows.append(skipped)
+	odp_paths = csv_validation.collect_strict_odp_paths(rows, str(tmp_path), {})
+	assert [os.path.basename(path) for path in odp_paths] == ["deck.odp"]
+
+
+#============================================
+def test_validate_rows_resolves_each_source_once(tmp_path, monkeypatch) -> None:
+	"""
+	Search for each distinct source deck once but report every row.
+	"""
+	slide_hash = csv_schema.compute_slide_hash(b"<slide>Title</slide>", "")
+	rows = [build_row(slide_hash) for _ in range(3)]
+	rows[1]["source_pptx"] = "missing.pptx"
+	rows[2]["source_pptx"] = "missing.pptx"
+	(tmp_path / "deck.pptx").write_bytes(b"pptx")
+	monkeypatch.chdir(tmp_path)
+	lookups = []
+	resolve_source_path = csv_validation.path_resolver.resolve_source_path
+
+	def counting_resolve(source_path, input_dir, strict):
+		lookups.append(source_path)
+		return resolve_source_path(source_path, input_dir, strict)
+
+	monkeypatch.setattr(
+		csv_validation.path_resolver,
+		"resolve_source_path",
+		counting_resolve,
+	)
+	errors, _ = validate_csv.validate_rows(
+		rows,
+		csv_dir=str(tmp_path),
+		check_sources=True,
+		strict=False,
+		template_path="",
+	)
+	assert lookups == ["deck.pptx", "missing.pptx"]
+	assert errors == [
+		"Row 2: source_pptx not found.",
+		"Row 3: source_pptx not found.",
+	]
+
+
+#============================================
+def test_validate_rows_strict_resolves_each_source_once(tmp_path, monkeypatch) -> None:
+	"""
+	Share source lookups between the strict ODP pass and the row checks.
+	"""
+	pptx = pytest.importorskip("pptx")
+	converted_path = tmp_path / "converted.pptx"
+	presentation = pptx.Presentation()
+	presentation.slides.add_slide(presentation.slide_layouts[6])
+	presentation.save(str(converted_path))
+	(tmp_path / "deck.odp").write_bytes(b"odp")
+	rows = [build_row("0123456789abcdef") for _ in range(3)]
+	rows[0]["source_pptx"] = "deck.odp"
+	rows[1]["source_pptx"] = "deck.odp"
+	rows[2]["source_pptx"] = "missing.pptx"
+	lookups = []
+	resolve_source_path = csv_validation.path_resolver.resolve_source_path
+
+	def counting_resolve(source_path, input_dir, strict):
+		lookups.append(source_path)
+		return resolve_source_path(source_path, input_dir, strict)
+
+	def fake_convert_odps(odp_paths: list[str], work_dir: str) -> dict[str, str]:
+		return {odp_path: str(converted_path) for odp_path in odp_paths}
+
+	monkeypatch.setattr(
+		csv_validation.path_resolver,
+		"resolve_source_path",
+		counting_resolve,
+	)
+	monkeypatch.setattr(
+		csv_validation.soffice_tools,
+		"convert_odps_to_pptx_cached",
+		fake_convert_odps,
+	)
+	errors, _ = validate_csv.validate_rows(
+		rows,
+		csv_dir=str(tmp_path),
+		check_sources=True,
+		strict=True,
+		template_path="",
+	)
+	assert lookups == ["deck.odp", "missing.pptx"]
+	assert "Row 3: source_pptx not found." in errors
+
+
+#============================================
+def test_is_hex_hash() -> None:
+	"""
+	Accept 16 hex digits in either case and reject anything else.
+	"""
+	assert csv_validation.is_hex_hash("0123456789abcdef")
+	assert csv_validation.is_hex_hash("DEADBEEFdeadbeef")
+	assert not csv_validation.is_hex_hash("")
+	assert not csv_validation.is_hex_hash("0123456789abcde")
+	assert not csv_validation.is_hex_hash("0123456789abcdef0")
+	assert not csv_validation.is_hex_hash("0123456789abcdeg")
+	assert not csv_validation.is_hex_hash("01234567 89abcde")
+	assert not csv_validation.is_hex_hash("0123456789abcde\uff26")
@@ -6,7 +6,6 @@ import os
 # local repo modules
 import slide_deck_pipeline.reporting as reporting
 import slide_deck_pipeline.spec_schema as spec_schema
-import slide_deck_pipeline.text_to_slides as text_to_slides
 
 
 #============================================
@@ -54,6 +53,9 @@ def main() -> None:
 	Main entry point.
 	"""
 	args = parse_args()
+	# local repo modules
+	import slide_deck_pipeline.text_to_slides as text_to_slides
+
 	output_path = args.output_path
 	if not output_path:
 		base_name = os.path.splitext(args.input_path)[0]